@@ -0,0 +1,290 @@
+# file: benchcrawl.py
+#
+# purpose: benchmarks chinesedata.py end to end against standinserver.py. Starts a stand-in
+# server, runs full crawls of the datasets asked for against it, each in a fresh directory,
+# and reports the requests sent, the bytes they took, the rows parsed, the wall time and the
+# pages per second of each, along with a checksum of the csv files written so that runs can be
+# compared for changes in the output as well as in speed.
+#
+# created by: Andrew MacDonald on 10/18/26.
+#
+# copyright: (c) 2016 Andrew MacDonald. All rights reserved.
+# email: andrewwm@gmail.com
+
+import getopt
+import glob
+import hashlib
+import json
+import os.path
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+####
+#### GLOBAL VARIABLES
+####
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+CRAWLER = os.path.join(SCRIPT_DIR, "chinesedata.py")
+SERVER = os.path.join(SCRIPT_DIR, "standinserver.py")
+
+# the dataset flags of chinesedata.py, in the order they are benchmarked
+DATASET_FLAGS = [('county', '-c'), ('urban', '-u'), ('prefecture', '-f'), ('province', '-p'), ('national', '-n')]
+
+DEFAULT_YEARS = "2000+2001"
+DEFAULT_REPEAT = 1
+
+# the time-to-live of the cache in the --offline check, in seconds; every page is made older
+OFFLINE_CACHE_TTL = 60
+
+# seconds to wait for the stand-in server to start taking connections
+SERVER_START_TIMEOUT = 10
+
+# the settings of the benchmark, set from the command line
+benchOptions = {
+	'datasets':[name for name, flag in DATASET_FLAGS],
+	'together':False,
+	'years':DEFAULT_YEARS,
+	'repeat':DEFAULT_REPEAT,
+	'keep':False,
+	'offline':False,
+	'server':[],
+	'crawler':[]}
+
+####
+#### FUNCTIONS
+####
+
+# Finds a port nobody is listening on
+def getFreePort():
+
+	probe = socket.socket()
+	probe.bind(('127.0.0.1', 0))
+	port = probe.getsockname()[1]
+	probe.close()
+
+	return port
+
+# Starts standinserver.py on a free port and waits for it to take connections; returns the
+# process and the port
+def startServer(serverargs):
+
+	port = getFreePort()
+	server = subprocess.Popen([sys.executable, SERVER, "-p", str(port)] + serverargs, stdout=open(os.devnull, "w"))
+	started = time.time()
+
+	while(time.time() - started < SERVER_START_TIMEOUT):
+		try:
+			socket.create_connection(('127.0.0.1', port), 1).close()
+			return server, port
+		except socket.error:
+			if(server.poll() != None):
+				break
+
+			time.sleep(0.1)
+
+	server.kill()
+	print "The stand-in server didn't start"
+	sys.exit(1)
+
+# Crawls the datasets in one run of chinesedata.py in a new directory, with the cache options
+# given. Returns the wall time, the crawl's metrics and the csv files it wrote with their
+# checksums, or exits if it fails
+def runCrawl(port, datasets, cacheargs=["--no-cache"]):
+
+	workdir = tempfile.mkdtemp(prefix="benchcrawl")
+	command = [sys.executable, CRAWLER]
+
+	for name, flag in DATASET_FLAGS:
+		if(name in datasets):
+			command.append(flag)
+
+	command = command + ["-s", "-y", benchOptions['years'], "--base-url", "http://127.0.0.1:%s" % port, "--login-wait", "0"] + cacheargs + ["--max-rate", "0", "--metrics", "metrics.json"] + benchOptions['crawler']
+
+	started = time.time()
+	crawl = subprocess.Popen(command, cwd=workdir, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+	output = crawl.communicate()[0]
+	elapsed = time.time() - started
+
+	if(crawl.returncode != 0 or os.path.isfile(os.path.join(workdir, "metrics.json")) == False):
+		print "The crawl of %s failed:" % ", ".join(datasets)
+		print output
+		print "Its files are in %s" % workdir
+		sys.exit(1)
+
+	metricsfile = open(os.path.join(workdir, "metrics.json"))
+	metrics = json.load(metricsfile)
+	metricsfile.close()
+
+	checksums = {}
+
+	for filename in sorted(glob.glob(os.path.join(workdir, "*.csv"))):
+		csvfile = open(filename, "rb")
+		checksums[os.path.basename(filename)] = hashlib.md5(csvfile.read()).hexdigest()
+		csvfile.close()
+
+	if(benchOptions['keep'] == True):
+		print "Kept the files of the crawl of %s in %s" % (", ".join(datasets), workdir)
+	else:
+		shutil.rmtree(workdir)
+
+	return elapsed, metrics, checksums
+
+# Crawls the datasets into a page cache, makes every page in it older than its time-to-live, and
+# crawls them again offline out of the cache; returns whether the offline run wrote the same files
+def checkOffline(port, datasets):
+
+	cachedir = tempfile.mkdtemp(prefix="benchcrawlcache")
+
+	try:
+		checksums = runCrawl(port, datasets, ["--cache-dir", cachedir])[2]
+		stale = time.time() - 2 * OFFLINE_CACHE_TTL
+
+		for dirpath, dirnames, filenames in os.walk(cachedir):
+			for filename in filenames:
+				os.utime(os.path.join(dirpath, filename), (stale, stale))
+
+		return runCrawl(port, datasets, ["--cache-dir", cachedir, "--cache-ttl", str(OFFLINE_CACHE_TTL), "--offline"])[2] == checksums
+	finally:
+		shutil.rmtree(cachedir)
+
+# Adds up the requests, the bytes the server sent and the rows in a crawl's metrics
+def countMetrics(metrics):
+
+	requests = 0
+	transferred = 0
+	rows = 0
+
+	for page in metrics['pages']:
+		requests = requests + page['requests']
+		transferred = transferred + page['transferredbytes']
+		rows = rows + page['rows']
+
+	return requests, transferred, rows
+
+# Lets people know how to use the program from the command line
+def usage(error):
+
+	if(error != ""):
+		print "Error: " + error + "\n"
+
+	print "USAGE: benchcrawl [-h | --help] [-d] [-y] [-r] [--together] [--keep]\n\t[--offline] [--server-args] [-- chinesedata options]\n"
+	print "NAME\n\tbenchcrawl -- benchmarks chinesedata.py against standinserver.py\n"
+	print "DESCRIPTION\n\tRuns full crawls against a local stand-in server and reports, for each"
+	print "\tdataset, the requests sent, the kilobytes sent back, the rows parsed, the wall time, the pages"
+	print "\tfetched per second and the checksums of the csv files written. Any"
+	print "\targuments after -- are passed on to chinesedata.py, such as -w 8.\n"
+	print "\t-d\tSpecifies the datasets to crawl, separated by commas. Default is\n\t\t" + ",".join(benchOptions['datasets']) + ".\n"
+	print "\t-y\tSpecifies the years to crawl. Default is " + DEFAULT_YEARS + ".\n"
+	print "\t-r\tSpecifies the number of times to crawl each dataset; the fastest\n\t\trun is reported. Default is " + str(DEFAULT_REPEAT) + ".\n"
+	print "\t--together\n\t\tCrawls all of the datasets in one run of chinesedata.py, rather\n\t\tthan one run each.\n"
+	print "\t--keep\n\t\tKeeps the directories the crawls were run in.\n"
+	print "\t--offline\n\t\tAlso checks that each crawl comes out the same when it is run again\n\t\twith --offline from a cache whose pages are all past their\n\t\ttime-to-live.\n"
+	print "\t--server-args\n\t\tSpecifies options for standinserver.py, such as\n\t\t\"--latency 0.05 --errors 0.01 --provinces 31 --subunits 80\"."
+	print ""
+	print "\tSample usage: \"python benchcrawl.py -d county --server-args '--latency 0.05' -- -w 8\""
+	print ""
+
+	sys.exit(0)
+
+# Parses the command line arguments into benchOptions
+def parseArguments(argv):
+
+	# everything after -- goes to chinesedata.py
+	if("--" in argv):
+		benchOptions['crawler'] = argv[argv.index("--")+1:]
+		argv = argv[:argv.index("--")]
+
+	try:
+		opts, args = getopt.getopt(argv, "hd:y:r:", ["help", "together", "keep", "offline", "server-args="])
+	except getopt.GetoptError, err:
+		usage(str(err))
+
+	if(args != []):
+		usage("extraneous argument(s): " + str(args) + " not allowed.")
+
+	for opt, arg in opts:
+		if opt in ("-h", "--help"):
+			usage("")
+		elif(opt == "-d"):
+			benchOptions['datasets'] = arg.split(",")
+
+			for name in benchOptions['datasets']:
+				if(name not in [dataset for dataset, flag in DATASET_FLAGS]):
+					usage("there is no dataset called " + name)
+		elif(opt == "-y"):
+			benchOptions['years'] = arg
+		elif(opt == "-r"):
+			try:
+				benchOptions['repeat'] = int(arg)
+			except ValueError:
+				benchOptions['repeat'] = 0
+
+			if(benchOptions['repeat'] < 1):
+				usage("the number of runs must be a whole number of at least 1")
+		elif(opt == "--together"):
+			benchOptions['together'] = True
+		elif(opt == "--keep"):
+			benchOptions['keep'] = True
+		elif(opt == "--offline"):
+			benchOptions['offline'] = True
+		elif(opt == "--server-args"):
+			benchOptions['server'] = arg.split()
+
+####
+#### MAIN CODE
+####
+
+if __name__ == '__main__':
+
+	parseArguments(sys.argv[1:])
+
+	if(benchOptions['together'] == True):
+		runs = [benchOptions['datasets']]
+	else:
+		runs = [[name] for name in benchOptions['datasets']]
+
+	server, port = startServer(benchOptions['server'])
+
+	try:
+		print "%-32s %9s %9s %9s %9s %9s  %s" % ("datasets", "requests", "KB sent", "rows", "wall(s)", "pages/s", "output md5")
+
+		totalrequests = 0
+		totaltransferred = 0
+		totaltime = 0.0
+		failures = 0
+
+		for datasets in runs:
+			best = None
+
+			for i in range(benchOptions['repeat']):
+				result = runCrawl(port, datasets)
+
+				if(best == None or result[0] < best[0]):
+					best = result
+
+			elapsed, metrics, checksums = best
+			requests, transferred, rows = countMetrics(metrics)
+			totalrequests = totalrequests + requests
+			totaltransferred = totaltransferred + transferred
+			totaltime = totaltime + elapsed
+
+			print "%-32s %9d %9d %9d %9.2f %9.1f  %s" % (",".join(datasets), requests, transferred / 1024, rows, elapsed, requests / elapsed, " ".join(checksums[name][:8] for name in sorted(checksums)))
+
+			if(benchOptions['offline'] == True):
+				if(checkOffline(port, datasets) == True):
+					print "%-32s offline from a stale cache: ok" % ",".join(datasets)
+				else:
+					print "%-32s offline from a stale cache: DIFFERS" % ",".join(datasets)
+					failures = failures + 1
+
+		print "%-32s %9d %9d %9s %9.2f %9.1f" % ("total", totalrequests, totaltransferred / 1024, "", totaltime, totalrequests / totaltime)
+	finally:
+		server.kill()
+
+	if(failures > 0):
+		print "\n%s offline runs differ from the crawls" % failures
+		sys.exit(1)
@@ -0,0 +1,366 @@
+# file: benchparse.py
+#
+# purpose: benchmarks the page parsing in chinesedata.py on its own. Runs parseRows,
+# parseDropdown and parseSubunitData over a corpus of pages (made-up ones in the shapes the
+# site gives us, plus any saved pages we are given) with each of the parser backends, and
+# reports the time taken, the rows parsed per second and the memory used. Every result is
+# checked against a plain reference version of the parsing, kept here as it was before any
+# optimization, so a faster parser that gets a different answer is caught.
+#
+# created by: Andrew MacDonald on 10/18/26.
+#
+# copyright: (c) 2016 Andrew MacDonald. All rights reserved.
+# email: andrewwm@gmail.com
+
+import getopt
+import glob
+import os
+import os.path
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import zlib
+
+from bs4 import BeautifulSoup, FeatureNotFound
+
+import standinserver
+
+from chinadata import crawl, fetch, parse, settings, storage
+
+####
+#### GLOBAL VARIABLES
+####
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_REPEAT = 20
+
+# the peak memory use of a parse is the median of this many runs
+PEAK_RUNS = 3
+
+# a page for the parser to warm up on before its memory use is measured
+WARMUP_PAGE = '<html><body><table id="texttable1"><thead><tr><td>Name</td></tr></thead><tbody><tr><td class="d">x</td></tr></tbody></table></body></html>'
+
+# what runs in the fresh python to measure the memory a parse takes: the page comes in on stdin,
+# the parser is warmed up on a small page, so that what it only does the first time it is used
+# isn't counted, and then the page is parsed and how far that pushed the peak memory use is printed.
+# The peak is the VmHWM of /proc/self/status rather than getrusage's ru_maxrss, which a process
+# started from another one carries over from it
+PEAK_PROGRAM = """
+import sys
+sys.path.insert(0, %r)
+import benchparse
+html = sys.stdin.read()
+benchparse.candidateParse(benchparse.WARMUP_PAGE, %r, 0)
+before = benchparse.peakMemory()
+benchparse.candidateParse(html, %r, %d)
+print benchparse.peakMemory() - before
+"""
+
+# the settings of the benchmark, set from the command line
+benchOptions = {
+	'repeat':DEFAULT_REPEAT,
+	'backends':None,
+	'corpus':None,
+	'save':None}
+
+####
+#### FUNCTIONS
+####
+
+# Makes one page with standinserver.py, with the number of provinces and subunits given
+def makeFixture(provinces, subunits, dataset, code, province, year):
+
+	standinserver.serverOptions['provinces'] = provinces
+	standinserver.serverOptions['subunits'] = subunits
+
+	return standinserver.makePage(dataset, code, province, year)
+
+# Builds the corpus: a list of (name, dataset, page code, html). The dataset and page code are
+# None for saved pages, which are only run through parseRows and parseDropdown
+def makeCorpus():
+
+	corpus = []
+	standinserver.crawlerSettings = standinserver.loadCrawlerSettings(standinserver.SETTINGS_FILE)
+
+	county = makeFixture(4, 6, "county", "A01", "11", "2000")
+
+	corpus.append(("county-small-province", "county", "A01", county))
+	corpus.append(("prefecture-200-rows", "prefecture", "A01", makeFixture(4, 200, "prefecture", "A01", "11", "2000")))
+	corpus.append(("county-all-provinces", "county", "A01", makeFixture(31, 80, "county", "A01", "", "2000")))
+	corpus.append(("province", None, None, makeFixture(31, 0, "province", settings.PROVINCE_PAGES[0], "", "2000")))
+	corpus.append(("national", None, None, makeFixture(31, 0, "national", settings.NATIONAL_PAGES[0], "", "")))
+
+	# a header that is two rows deep, one of them left unclosed
+	corpus.append(("malformed-thead", "county", "A01", county.replace('<thead><tr>', '<thead><tr><td>Group</td></tr><tr>', 1).replace('</tr></thead>', '</thead>', 1)))
+
+	# more than one tail row under the data
+	corpus.append(("tail-rows", "county", "A01", county.replace('<tr><td class="tdtail">', '<tr><td class="tdtail">Note: made up</td></tr><tr><td class="tdtail">', 1)))
+
+	if(benchOptions['corpus'] != None):
+		corpus = corpus + loadCorpus(benchOptions['corpus'])
+
+	return corpus
+
+# Loads saved pages: .html files, and the .z files of a chinesedata.py page cache; given a
+# file rather than a directory, loads the table pages in a chinesedata.py --archive file
+def loadCorpus(directory):
+
+	corpus = []
+
+	if(os.path.isfile(directory)):
+		for i, (url, postvalues, html) in enumerate(fetch.readArchive(directory)):
+			if('texttable1' in html):
+				corpus.append(("%s#%s" % (os.path.basename(directory), i), None, None, html))
+
+		return corpus
+
+	for path in sorted(glob.glob(os.path.join(directory, "*.htm*")) + glob.glob(os.path.join(directory, "*", "*.z"))):
+		pagefile = open(path, "rb")
+		html = pagefile.read()
+		pagefile.close()
+
+		if(path.endswith(".z")):
+			html = zlib.decompress(html)
+
+		corpus.append((os.path.basename(path), None, None, html))
+
+	return corpus
+
+# The parsing as it was before any optimization: the whole page parsed, then the data rows and
+# every dropdown read out of it. Returns the rows, the number of columns and the dropdowns
+def referenceParse(html, backend):
+
+	soup = BeautifulSoup(html, backend)
+	rows = []
+	numcolumns = 0
+	numcolumnsdone = False
+
+	for row in soup.findAll('table', id="texttable1")[0].findAll('tr'):
+		# skips the headers, including malformed ones, and the tails
+		if(row.parent.name == 'thead' or row.parent.parent.name == 'thead'):
+			continue
+		elif(row.td['class'][0] == u'tdtail'):
+			continue
+
+		datarow = []
+
+		for i, contents in enumerate(row.contents):
+			if(numcolumnsdone == False):
+				numcolumns = numcolumns + 1
+
+			if(contents.string.isspace()):
+				datarow.append(settings.MISSING_VALUE)
+			elif(i == 0):
+				datarow.append(unicode(contents.string))
+			else:
+				datarow.append(contents.string.replace(",", ""))
+
+		rows.append(datarow)
+		numcolumnsdone = True
+
+	dropdowns = []
+
+	for select in soup.findAll('select'):
+		dropdowns.append([(option['value'], unicode(option.string)) for option in select.findAll('option') if option['value'] != ''])
+
+	return rows, numcolumns, dropdowns
+
+# Parses a page the way chinesedata.py does, with the backend given
+def candidateParse(html, backend, numdropdowns):
+
+	parse.parserBackend = backend
+	page = parse.ParsedPage(html)
+	rows, numcolumns = parse.parseRows(page)
+	dropdowns = []
+
+	for i in range(numdropdowns):
+		dropdowns.append(parse.parseDropdown(page, i))
+
+	return page, rows, numcolumns, dropdowns
+
+# Times the parsing of one page with one backend, best of the repeats, and checks the answer
+# against the reference. For the subunit pages, parseSubunitData is timed as well, on a page
+# that has already been parsed
+def benchFixture(name, dataset, pagecode, html, backend):
+
+	reference = referenceParse(html, backend)
+	baseline = referenceParse(html, 'html.parser')
+	best = None
+	bestsubunit = None
+
+	for i in range(benchOptions['repeat']):
+		started = time.time()
+		page, rows, numcolumns, dropdowns = candidateParse(html, backend, len(reference[2]))
+		elapsed = time.time() - started
+
+		if(best == None or elapsed < best):
+			best = elapsed
+
+		if(dataset != None):
+			# a page's layout is worked out the first time it is seen, from whichever page that is
+			if(i == 0):
+				parse.pageLayouts.clear()
+
+				if(os.path.isfile(dataset + settings.LAYOUT_FILE_SUFFIX)):
+					os.remove(dataset + settings.LAYOUT_FILE_SUFFIX)
+
+			started = time.time()
+			crawl.parseSubunitData(page, storage.newDatabase(dataset), dataset, pagecode)
+			elapsed = time.time() - started
+
+			if(bestsubunit == None or elapsed < bestsubunit):
+				bestsubunit = elapsed
+
+	return {'rows':len(rows), 'parse':best, 'subunit':bestsubunit, 'peak':measurePeakMemory(html, backend, len(reference[2])), 'matches':(rows, numcolumns, dropdowns) == reference, 'agrees':reference == baseline}
+
+# Parses a page in a fresh python, and returns how far the parse pushed its peak memory use, in
+# kilobytes. A fresh python is used because a process forked off from this one would start out
+# with the memory freed by the parses already done here, and the parse would reuse that rather
+# than take more
+def measurePeakMemory(html, backend, numdropdowns):
+
+	peaks = []
+
+	for i in range(PEAK_RUNS):
+		child = subprocess.Popen([sys.executable, "-c", PEAK_PROGRAM % (SCRIPT_DIR, backend, backend, numdropdowns)], stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+		output = child.communicate(html)[0]
+
+		if(child.returncode != 0):
+			print "Measuring the memory used by the %s parser failed" % backend
+			sys.exit(1)
+
+		peaks.append(int(output))
+
+	return sorted(peaks)[len(peaks) // 2]
+
+# The most memory this process has used, in kilobytes
+# note: only called from PEAK_PROGRAM
+def peakMemory():
+
+	statusfile = open("/proc/self/status")
+
+	try:
+		for line in statusfile:
+			if(line.startswith("VmHWM:")):
+				return int(line.split()[1])
+	finally:
+		statusfile.close()
+
+# Gets the parser backends to benchmark: the ones asked for, or every one chinesedata.py might
+# use that is installed
+def getBackends():
+
+	backends = []
+
+	for backend in (benchOptions['backends'] or settings.PARSER_BACKENDS):
+		try:
+			BeautifulSoup("<p></p>", backend)
+			backends.append(backend)
+		except FeatureNotFound:
+			print "Skipping the %s backend, which isn't installed" % backend
+
+	return backends
+
+# Lets people know how to use the program from the command line
+def usage(error):
+
+	if(error != ""):
+		print "Error: " + error + "\n"
+
+	print "USAGE: benchparse [-h | --help] [-n] [-b] [--corpus] [--save]\n"
+	print "NAME\n\tbenchparse -- benchmarks the page parsing of chinesedata.py\n"
+	print "DESCRIPTION\n\tTimes parseRows, parseDropdown and parseSubunitData on a corpus of pages"
+	print "\twith each parser backend, and checks the results against a reference"
+	print "\tversion of the parsing. Exits with an error if any of them differ.\n"
+	print "\t-n\tSpecifies the number of times each page is parsed; the fastest is\n\t\treported. Default is " + str(DEFAULT_REPEAT) + ".\n"
+	print "\t-b\tSpecifies the backends to benchmark, separated by commas. Default is\n\t\tevery installed one of " + ",".join(settings.PARSER_BACKENDS) + ".\n"
+	print "\t--corpus\n\t\tAdds the saved pages in a directory to the corpus: .html files, or\n\t\tthe .z files of a chinesedata.py page cache directory. Given a\n\t\tchinesedata.py --archive file instead, adds the pages in that.\n"
+	print "\t--save\n\t\tWrites the made-up pages of the corpus to a directory as .html files."
+	print ""
+
+	sys.exit(0)
+
+# Parses the command line arguments into benchOptions
+def parseArguments(argv):
+
+	try:
+		opts, args = getopt.getopt(argv, "hn:b:", ["help", "corpus=", "save="])
+	except getopt.GetoptError, err:
+		usage(str(err))
+
+	if(args != []):
+		usage("extraneous argument(s): " + str(args) + " not allowed.")
+
+	for opt, arg in opts:
+		if opt in ("-h", "--help"):
+			usage("")
+		elif(opt == "-n"):
+			try:
+				benchOptions['repeat'] = int(arg)
+			except ValueError:
+				benchOptions['repeat'] = 0
+
+			if(benchOptions['repeat'] < 1):
+				usage("the number of repeats must be a whole number of at least 1")
+		elif(opt == "-b"):
+			benchOptions['backends'] = arg.split(",")
+		elif(opt == "--corpus"):
+			benchOptions['corpus'] = arg
+		elif(opt == "--save"):
+			benchOptions['save'] = arg
+
+####
+#### MAIN CODE
+####
+
+if __name__ == '__main__':
+
+	parseArguments(sys.argv[1:])
+
+	corpus = makeCorpus()
+	backends = getBackends()
+	failures = 0
+
+	if(benchOptions['save'] != None):
+		if(os.path.isdir(benchOptions['save']) == False):
+			os.makedirs(benchOptions['save'])
+
+		for name, dataset, pagecode, html in corpus:
+			pagefile = open(os.path.join(benchOptions['save'], name + ".html"), "wb")
+			pagefile.write(html)
+			pagefile.close()
+
+	# parseSubunitData saves the page layouts it works out, so it is run somewhere they won't be kept
+	workdir = tempfile.mkdtemp(prefix="benchparse")
+	os.chdir(workdir)
+
+	try:
+		print "%-28s %-12s %6s %10s %10s %12s %9s  %s" % ("page", "backend", "rows", "parse(ms)", "rows/s", "subunit(ms)", "peak(KB)", "result")
+
+		for name, dataset, pagecode, html in corpus:
+			for backend in backends:
+				result = benchFixture(name, dataset, pagecode, html, backend)
+				subunit = "-"
+
+				if(result['subunit'] != None):
+					subunit = "%.3f" % (result['subunit'] * 1000)
+
+				if(result['matches'] == False):
+					status = "DIFFERS FROM REFERENCE"
+					failures = failures + 1
+				elif(result['agrees'] == False):
+					status = "ok (backend differs from html.parser)"
+				else:
+					status = "ok"
+
+				print "%-28s %-12s %6d %10.3f %10.0f %12s %9d  %s" % (name[:28], backend, result['rows'], result['parse'] * 1000, result['rows'] / max(result['parse'], 0.000001), subunit, result['peak'], status)
+	finally:
+		os.chdir("/")
+		shutil.rmtree(workdir)
+
+	if(failures > 0):
+		print "\n%s results differ from the reference parsing" % failures
+		sys.exit(1)
@@ -0,0 +1,182 @@
+# file: benchstartup.py
+#
+# purpose: benchmarks how quickly chinesedata.py starts. Times "chinesedata.py --help" from the
+# command line, and the import of each module of the chinadata package, each in a fresh python,
+# and reports which of the heavy libraries (BeautifulSoup and its parsers, and the networking
+# libraries) each one drags in with it. Those should only be loaded once a crawl actually runs,
+# so the run fails if --help, or importing settings or parse, brings in BeautifulSoup.
+#
+# created by: Andrew MacDonald on 10/18/26.
+#
+# copyright: (c) 2016 Andrew MacDonald. All rights reserved.
+# email: andrewwm@gmail.com
+
+import getopt
+import os
+import os.path
+import subprocess
+import sys
+import time
+
+####
+#### GLOBAL VARIABLES
+####
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+CRAWLER = os.path.join(SCRIPT_DIR, "chinesedata.py")
+
+# the modules whose import is timed, in the order the package builds on them
+MODULES = ['chinadata.settings', 'chinadata.parse', 'chinadata.storage', 'chinadata.fetch', 'chinadata.crawl', 'chinadata.cli', 'bs4']
+
+# the libraries that are slow to import, and which modules may load them
+HEAVY_MODULES = ['bs4', 'lxml', 'urllib2', 'cookielib']
+
+# none of these may import BeautifulSoup; the parse module imports it when the first page is parsed
+LIGHT_MODULES = ['chinadata.settings', 'chinadata.parse', 'chinadata.cli', 'chinesedata.py --help']
+
+DEFAULT_REPEAT = 10
+
+# what runs in the fresh python to time an import: prints the seconds taken and the heavy
+# libraries it loaded, with the modules imported beforehand left out of the time
+IMPORT_PROGRAM = """
+import sys, time
+sys.path.insert(0, %r)
+started = time.time()
+import %s
+elapsed = time.time() - started
+print repr(elapsed)
+print ",".join(name for name in %r if name in sys.modules)
+"""
+
+# the same for running --help through chinadata.cli, which exits once it has printed the usage
+HELP_PROGRAM = """
+import os, sys, time
+sys.path.insert(0, %r)
+started = time.time()
+sys.stdout = open(os.devnull, "w")
+try:
+	import chinadata.cli
+	chinadata.cli.main(["--help"])
+except SystemExit:
+	pass
+elapsed = time.time() - started
+sys.stdout = sys.__stdout__
+print repr(elapsed)
+print ",".join(name for name in %r if name in sys.modules)
+"""
+
+# the settings of the benchmark, set from the command line
+benchOptions = {
+	'repeat':DEFAULT_REPEAT}
+
+####
+#### FUNCTIONS
+####
+
+# Runs a program in a fresh python, and returns the seconds it reported and the heavy
+# libraries it had loaded
+def runProgram(program):
+
+	output = subprocess.check_output([sys.executable, "-c", program])
+	elapsed, loaded = output.split("\n")[:2]
+
+	return float(elapsed), [name for name in loaded.split(",") if name != ""]
+
+# Times a command from start to finish, python's own startup included
+def timeCommand(command):
+
+	devnull = open(os.devnull, "w")
+	started = time.time()
+	subprocess.check_call(command, stdout=devnull, stderr=devnull)
+	elapsed = time.time() - started
+	devnull.close()
+
+	return elapsed
+
+# Runs the timing function the number of times asked for, and returns the fastest and the
+# median of the times, with the heavy libraries loaded (which are the same every time)
+def repeatTiming(timing):
+
+	times = []
+	loaded = []
+
+	for i in range(benchOptions['repeat']):
+		elapsed, loaded = timing()
+		times.append(elapsed)
+
+	times.sort()
+
+	return times[0], times[len(times) / 2], loaded
+
+# Lets people know how to use the program from the command line
+def usage(error):
+
+	if(error != ""):
+		print "Error: " + error + "\n"
+
+	print "USAGE: benchstartup [-h | --help] [-n]\n"
+	print "NAME\n\tbenchstartup -- benchmarks how quickly chinesedata.py starts\n"
+	print "DESCRIPTION\n\tTimes chinesedata.py --help and the import of each module of the"
+	print "\tchinadata package, each in a fresh python, and lists the slow libraries"
+	print "\teach one loads. Exits with an error if --help, chinadata.settings,"
+	print "\tchinadata.parse or chinadata.cli loads BeautifulSoup.\n"
+	print "\t-n\tSpecifies the number of times each is timed; the fastest and the\n\t\tmedian are reported. Default is " + str(DEFAULT_REPEAT) + "."
+	print ""
+
+	sys.exit(0)
+
+# Parses the command line arguments into benchOptions
+def parseArguments(argv):
+
+	try:
+		opts, args = getopt.getopt(argv, "hn:", ["help"])
+	except getopt.GetoptError, err:
+		usage(str(err))
+
+	if(args != []):
+		usage("extraneous argument(s): " + str(args) + " not allowed.")
+
+	for opt, arg in opts:
+		if opt in ("-h", "--help"):
+			usage("")
+		elif(opt == "-n"):
+			try:
+				benchOptions['repeat'] = int(arg)
+			except ValueError:
+				benchOptions['repeat'] = 0
+
+			if(benchOptions['repeat'] < 1):
+				usage("the number of repeats must be a whole number of at least 1")
+
+####
+#### MAIN CODE
+####
+
+if __name__ == '__main__':
+
+	parseArguments(sys.argv[1:])
+
+	results = []
+	failures = 0
+
+	# python on its own, for comparison with the whole of --help
+	results.append(("python -c pass", repeatTiming(lambda: (timeCommand([sys.executable, "-c", "pass"]), []))))
+	results.append(("chinesedata.py --help (total)", repeatTiming(lambda: (timeCommand([sys.executable, CRAWLER, "--help"]), []))))
+	results.append(("chinesedata.py --help", repeatTiming(lambda: runProgram(HELP_PROGRAM % (SCRIPT_DIR, HEAVY_MODULES)))))
+
+	for module in MODULES:
+		results.append(("import " + module, repeatTiming(lambda: runProgram(IMPORT_PROGRAM % (SCRIPT_DIR, module, HEAVY_MODULES)))))
+
+	print "%-36s %9s %11s  %s" % ("what", "best(ms)", "median(ms)", "slow libraries loaded")
+
+	for name, (best, median, loaded) in results:
+		status = ""
+
+		if(name.replace("import ", "") in LIGHT_MODULES and 'bs4' in loaded):
+			status = "  SHOULD NOT LOAD bs4"
+			failures = failures + 1
+
+		print "%-36s %9.1f %11.1f  %s%s" % (name, best * 1000, median * 1000, ", ".join(loaded) or "-", status)
+
+	if(failures > 0):
+		sys.exit(1)
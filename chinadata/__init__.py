@@ -0,0 +1,12 @@
+# file: chinadata/__init__.py
+#
+# purpose: the crawler behind chinesedata.py, for getting datasets off the AllChina Datacenter
+# (chinadataonline.org). It is split into settings (the datasets and the crawl's defaults),
+# fetch (requests), parse (pages), storage (tables, csv files and what is kept between runs),
+# crawl (each dataset's crawl) and cli (the command line). Nothing is imported here, so that
+# importing one module doesn't bring in the rest; see cli.py for why that matters
+#
+# created by: Andrew MacDonald on 10/18/26.
+#
+# copyright: (c) 2008, 2009, 2010, 2013 Andrew MacDonald. All rights reserved.
+# email: andrewm@stanfordalumni.org
@@ -0,0 +1,501 @@
+# file: chinadata/cli.py
+#
+# purpose: the command line: the usage text, the options, and the main code that logs in and
+# runs the crawl. Only imports the rest of the package once the options have been read, so
+# that --help and bad options come back straight away
+#
+# created by: Andrew MacDonald on 11/24/08, as part of chinesedata.py; split out on 10/18/26.
+#
+# copyright: (c) 2008, 2009, 2010, 2013 Andrew MacDonald. All rights reserved.
+# email: andrewm@stanfordalumni.org
+
+import getopt
+import sys
+
+from chinadata.settings import *
+
+####
+#### FUNCTIONS
+####
+
+# Lets people know how to use the program from the command line
+def usage(error):
+	
+	print ""
+	
+	if(error != ""):
+		print "\x1B[1merror: " + error + "\x1B[0m\n"
+	
+	print "USAGE: chinesedata [-c] [-f] [-n] [-p] [-u] [-h | --help] [-y] [-s] [-m] [-w] [--max-inflight]\n\t[--cache-dir] [--cache-ttl] [--cache-size] [--no-cache] [--offline]\n\t[--resume] [--max-rate] [--incremental] [--no-batch] [--parsers]\n\t[--refresh-dropdowns] [--metrics] [--archive] [--base-url]\n\t[--login-wait]"
+	print ""
+	print "NAME\n\tchinesedata -- downloads data from the All China Online Database\n"
+	print "DESCRIPTION\n\tThis program allows one to download one of several different datasets"
+	print "\tavailable from the University of Michigan depository, provided one has a"
+	print "\tsubscription. The script must be run from a machine that has an"
+	print "\tacceptable IP address to their service. The data is written out" 
+	print "\tin csv format to the directory from which the script is run. Note that"
+	print "\ta dataset option must be specified. Several may be given, in which case"
+	print "\tthe datasets are downloaded side by side in one session, each to its"
+	print "\town files; the years given with -y are then used for all of them."
+	print "\t"
+	print "\tThe following options are available:\n"
+	print "\t-c\tSpecifies downloading the counties dataset; available years\n\t\tare " + str(COUNTY_DATASET_START) + " to " + str(COUNTY_DATASET_END) + "\n"
+	print "\t-f\tSpecifies downloading the prefecture-level dataset; available\n\t\tyears are " + str(PREFECTURE_DATASET_START) + " to " + str(PREFECTURE_DATASET_END) + "\n"
+	print "\t-n\tSpecifies downloading the national-level dataset; available\n\t\tyears are " + str(NATIONAL_DATASET_START) + " to " + str(NATIONAL_DATASET_END) + "\n"
+	print "\t-p\tSpecifies downloading the provincial-level dataset; available\n\t\tyears are " + str(PROVINCE_DATASET_START) + " to " + str(PROVINCE_DATASET_END) + "\n"
+	print "\t-u\tSpecifies downloading the urban-area dataset (at the level of a\n\t\tcounty); available years are " + str(URBAN_DATASET_START) + " to " + str(URBAN_DATASET_END) + "\n"
+	print "\t-h\tShows this message.\n"
+	print "\t--help\tSame as -h.\n"
+	print "\t-y\tSpecifies the years requested. Takes a required argument of the\n\t\tyears that are desired. Default if -y is not selected is either\n\t\t" + str(DEFAULT_YEARS_COUNTY[0]) + " or the first year data is available, whichever is farther\n\t\tback in time, to " + str(DEFAULT_YEARS_COUNTY[len(DEFAULT_YEARS_COUNTY)-1]) + ", but this can take a long time on the\n\t\tcounty, prefecture, and urban datasets.\n\n\t\tNecessary format is: 1982+2000\n\t\t"
+	print "\t-s\tIf -s is selected, then only error messages will be printed; \n\t\totherwise, verbose status updates will be printed.\n"
+	print "\t-m\tIf -m is selected, then each year's data will be recorded in\n\t\tits own file. Default is to write all data to one file. Good if\n\t\tyour connection is unreliable. Note: option has no effect if \n\t\t-n flag is chosen.\n"
+	print "\t-w\tSpecifies the number of pages fetched at the same time. Takes a\n\t\trequired whole-number argument. Default is " + str(DEFAULT_WORKERS) + ", which fetches\n\t\tone page at a time. Same as --workers.\n"
+	print "\t--max-inflight\n\t\tSpecifies the most requests that may be open to the server at\n\t\tonce, however many workers there are. Default is " + str(DEFAULT_MAX_INFLIGHT) + ".\n"
+	print "\t--cache-dir\n\t\tSpecifies the directory downloaded pages are cached in, so that\n\t\ta re-run doesn't download them again. Default is " + DEFAULT_CACHE_DIR + ".\n"
+	print "\t--cache-ttl\n\t\tSpecifies how many seconds a cached page is used before it is\n\t\tdownloaded again; 0 means forever. Default is " + str(DEFAULT_CACHE_TTL) + ".\n"
+	print "\t--cache-size\n\t\tSpecifies the most megabytes the cache may take up; the least\n\t\trecently used pages are removed past that. Default is " + str(DEFAULT_CACHE_SIZE) + ".\n"
+	print "\t--no-cache\n\t\tTurns off the page cache.\n"
+	print "\t--offline\n\t\tDoesn't connect to the server at all; every page must come from\n\t\tthe cache, however old the pages are. Good for re-parsing or\n\t\tre-exporting an earlier crawl.\n"
+	print "\t--resume\n\t\tPicks up an interrupted crawl with the same dataset, years and -m\n\t\tsetting: work recorded in its .journal file is skipped, and the\n\t\tcsv files are appended to rather than started over.\n"
+	print "\t--max-rate\n\t\tSpecifies the most requests per second we will send. The actual\n\t\trate starts lower and adapts to how the server is coping; 0\n\t\tturns the limit off. Default is " + str(DEFAULT_MAX_RATE) + ".\n"
+	print "\t--incremental\n\t\tOnly downloads what the dataset's earlier csv files in this\n\t\tdirectory don't already have (a province in a year for the\n\t\tcounty, urban and prefecture data, a year for the provincial\n\t\tdata), and merges the two into the new output. Output files\n\t\tthat would be written over are kept as <name>.old.\n"
+	print "\t--no-batch\n\t\tFetches the county data one province at a time. By default each\n\t\tpage is fetched for all provinces at once where the site allows\n\t\tit, which takes about a thirtieth of the requests.\n"
+	print "\t--parsers\n\t\tSpecifies the number of processes parsing pages, so that parsing\n\t\tisn't limited to one processor. Default is " + str(DEFAULT_PARSERS) + ", which parses\n\t\tthe pages in the same process that fetches them.\n"
+	print "\t--refresh-dropdowns\n\t\tAsks the site for each year's list of provinces again, rather\n\t\tthan using the lists saved in " + DROPDOWN_FILE + " by earlier runs.\n"
+	print "\t--metrics\n\t\tWrites the crawl's request latencies, bytes, retries, parse times\n\t\tand rows, by dataset and page, to the JSON file given, and the same\n\t\tin Prometheus's text format to the same name with .prom\n\t\tadded.\n"
+	print "\t--archive\n\t\tKeeps every page the site sends back in the archive file given,\n\t\tcompressed, with an index of where each page is in a .idx file\n\t\tnext to it; pages from the cache aren't added again. A re-run\n\t\tadds to the same archive.\n"
+	print "\t--base-url\n\t\tCrawls another site in place of http://chinadataonline.org, such as\n\t\ta standinserver.py running on this machine.\n"
+	print "\t--login-wait\n\t\tSpecifies the seconds to wait after logging in. Default is " + str(WAIT_TIME) + "."
+	print ""
+	print "\tSample usage: \"python chinesedata.py -c -m -y 1999+2002\""
+	print "\tThis gets the county data and writes each year from 1999-2002 to a\n\tseparate file."
+	print ""
+	print "\tSample usage: \"python chinesedata.py -c -u -f -p -n\""
+	print "\tThis gets every dataset, for all of its available years, in one run."
+	print ""
+	print "This script is (c) 2008, 2009, 2010, 2013 Andrew MacDonald (andrewm@stanfordalumni.org)"
+	print "All rights reserved. Version 1.1\n"
+	
+	sys.exit(0)
+
+# Parses the command line arguments and sets up the default variables
+def parseArguments(argv):
+
+	# setting up our defaults here
+	years = []
+	multifile = DEFAULT_MULTIFILE
+	verbose = DEFAULT_VERBOSE
+	options = dict(crawlOptions)
+	
+	# indicates whether years are within the bounds allowed, and if the -y flag was used
+	validYears = True
+	yearsSpecified = False
+	startYear = 0
+	endYear = 0
+	
+	# the datasets picked, in the order their flags were given, each with its default years
+	datasets = []
+
+	try: 
+		opts, args = getopt.getopt(argv, "cpunfhy:smw:", ["help", "year=", "workers=", "max-inflight=", "cache-dir=", "cache-ttl=", "cache-size=", "no-cache", "offline", "resume", "max-rate=", "incremental", "no-batch", "parsers=", "refresh-dropdowns", "metrics=", "archive=", "base-url=", "login-wait="])
+
+		if(opts == []):
+			usage("no arguments specified; at least a dataset flag must be set.")
+		# arguments aren't used in this script
+		elif(args != []):
+			usage("extraneous argument(s): " + str(args) + " not allowed.")
+	
+	except getopt.GetoptError, err:           
+		usage(str(err))
+		sys.exit(0)                         
+
+	for opt, arg, in opts:
+	
+		# doing help
+		if opt in ("-h", "--help"):      
+			usage("")                     
+			sys.exit() 
+	
+		# noting up the dataset
+		elif(opt == "-c"):
+			if(COUNTY_DATASET not in [picked[0] for picked in datasets]):
+				datasets.append((COUNTY_DATASET, DEFAULT_YEARS_COUNTY))
+
+		elif(opt == "-n"):
+			if(NATIONAL_DATASET not in [picked[0] for picked in datasets]):
+				datasets.append((NATIONAL_DATASET, DEFAULT_YEARS_NATIONAL))
+			
+		elif(opt == "-p"):
+			if(PROVINCE_DATASET not in [picked[0] for picked in datasets]):
+				datasets.append((PROVINCE_DATASET, DEFAULT_YEARS_PROVINCE))
+			
+		elif(opt == "-u"):
+			if(URBAN_DATASET not in [picked[0] for picked in datasets]):
+				datasets.append((URBAN_DATASET, DEFAULT_YEARS_URBAN))
+				
+		elif(opt == "-f"):
+			if(PREFECTURE_DATASET not in [picked[0] for picked in datasets]):
+				datasets.append((PREFECTURE_DATASET, DEFAULT_YEARS_PREFECTURE))
+	
+		# checking for multifile
+		elif(opt == "-m"):
+			multifile = True
+		
+		# checking for silent mode
+		elif(opt == "-s"):
+			verbose = False	
+
+		# checking for the number of fetch threads
+		elif opt in ("-w", "--workers"):
+			try:
+				options['workers'] = int(arg)
+			except ValueError:
+				options['workers'] = 0
+
+			if(options['workers'] < 1):
+				usage("the number of workers must be a whole number of at least 1")
+
+		# checking for the cap on simultaneous requests to the server
+		elif(opt == "--max-inflight"):
+			try:
+				options['maxinflight'] = int(arg)
+			except ValueError:
+				options['maxinflight'] = 0
+
+			if(options['maxinflight'] < 1):
+				usage("the maximum number of in-flight requests must be a whole number of at least 1")
+
+		# checking the page cache options
+		elif(opt == "--cache-dir"):
+			options['cachedir'] = arg
+
+		elif(opt == "--no-cache"):
+			options['cachedir'] = None
+
+		elif opt in ("--cache-ttl", "--cache-size"):
+			try:
+				value = int(arg)
+			except ValueError:
+				value = -1
+
+			if(value < 0):
+				usage("the argument to " + opt + " must be a whole number")
+			elif(opt == "--cache-ttl"):
+				options['cachettl'] = value
+			else:
+				options['cachesize'] = value
+
+		elif(opt == "--offline"):
+			options['offline'] = True
+
+		# checking for resuming an interrupted crawl
+		elif(opt == "--resume"):
+			options['resume'] = True
+
+		# checking for only crawling what earlier output files are missing
+		elif(opt == "--incremental"):
+			options['incremental'] = True
+
+		# checking for turning off the all-province requests
+		elif(opt == "--no-batch"):
+			options['batch'] = False
+
+		# checking for the number of parser processes
+		elif(opt == "--parsers"):
+			try:
+				options['parsers'] = int(arg)
+			except ValueError:
+				options['parsers'] = -1
+
+			if(options['parsers'] < 0):
+				usage("the number of parsers must be a whole number")
+
+		# checking for asking the site for the province lists again
+		elif(opt == "--refresh-dropdowns"):
+			options['refreshdropdowns'] = True
+
+		# checking for where to write the crawl's metrics
+		elif(opt == "--metrics"):
+			options['metrics'] = arg
+
+		# checking for where to archive the pages the site sends back
+		elif(opt == "--archive"):
+			options['archive'] = arg
+
+		# checking for another site to crawl, such as standinserver.py
+		elif(opt == "--base-url"):
+			options['site'] = arg.rstrip("/")
+
+		# checking for the wait after logging in
+		elif(opt == "--login-wait"):
+			try:
+				options['loginwait'] = float(arg)
+			except ValueError:
+				options['loginwait'] = -1
+
+			if(options['loginwait'] < 0):
+				usage("the wait after logging in must be a number of seconds")
+
+		# checking for the cap on the request rate
+		elif(opt == "--max-rate"):
+			try:
+				options['maxrate'] = float(arg)
+			except ValueError:
+				options['maxrate'] = 0
+
+			if(options['maxrate'] < 0):
+				usage("the maximum request rate must be a positive number, or 0 for no limit")
+		
+		# checking for year
+		elif(opt == "-y"):
+			i = 0
+			n = 0
+			years = []
+			# reset these now that we know we have to do years
+			startYear = 0
+			endYear = 0
+			
+			# text processing can throw a lot of exceptions if the text is malformed
+			try:
+				for digit in arg:
+					# getting the start year; note that we are progressing digit by digit
+					if(i <= 3):
+						startYear = startYear + int(digit) * pow(10, 3-i)
+						
+					# checking sure we have the right seperator
+					elif(i == 4):
+						if(digit != "+"):
+							raise self.e
+					
+					# getting the end year
+					elif(i >= 5):
+						endYear = endYear + int(digit) * pow(10, 8-i)
+					
+					# incremeting the counter
+					i = i + 1
+				
+				# this means in some way or other the year-digits were too long or too short
+				if(i < 9):
+					raise self.e
+				elif(i > 9):
+					raise self.e
+				
+				# makes sure -y option isn't overwritten with the defaults when processing the dataset flag
+				yearsSpecified = True
+				
+				# inits the years vector
+				while(n <= endYear - startYear):
+					years.append(startYear + n)
+					n = n + 1
+					
+			except:
+				usage("the formatting of the -y argument was incorrect; see the entry below for correct usage")
+			
+	# making sure that they actually picked a dataset
+	if(datasets == []):
+		usage("no dataset specified")
+
+	# offline runs can only read pages out of the cache
+	if(options['offline'] == True and options['cachedir'] == None):
+		usage("--offline needs the page cache, so it can't be used with --no-cache")
+
+	# checking the years now at the end, since we don't know in what order the flags were;
+	# the years given with -y are used for every dataset, so they have to suit all of them
+	if(yearsSpecified == True):
+		for i, picked in enumerate(datasets):
+			validYears = checkYearValidity(startYear, endYear, picked[0])
+	
+			if(validYears == False):
+				usage("the years selected were outside the bounds of what is available for the " + picked[0] + " dataset")
+
+			datasets[i] = (picked[0], years)
+		
+	return datasets, multifile, verbose, options
+
+# A small helper function that checks to see whether one has inputted a valid set of years
+# in reference to the type of datset that they have selected.
+# note: assumes that startYear and endYear are ints
+def checkYearValidity(startYear, endYear, dataset):
+	
+	valid = True
+	validStartYear = 0
+	validEndYear = 0
+	
+	# Sets up the valid start and end years based on the datset
+	if(dataset==COUNTY_DATASET):
+		validStartYear = COUNTY_DATASET_START
+		validEndYear = COUNTY_DATASET_END
+		
+	if(dataset==NATIONAL_DATASET):
+		validStartYear = NATIONAL_DATASET_START
+		validEndYear = NATIONAL_DATASET_END
+	
+	if(dataset==PROVINCE_DATASET):
+		validStartYear = PROVINCE_DATASET_START
+		validEndYear = PROVINCE_DATASET_END
+	
+	if(dataset==URBAN_DATASET):
+		validStartYear = URBAN_DATASET_START
+		validEndYear = URBAN_DATASET_END
+		
+	if(dataset==PREFECTURE_DATASET):
+		validStartYear = PREFECTURE_DATASET_START
+		validEndYear = PREFECTURE_DATASET_END
+	
+	# The sanity checks
+	if(startYear < validStartYear):
+		valid = False
+	
+	if(endYear > validEndYear):
+		valid = False
+		
+	# obviously also a problem
+	if(startYear > endYear):
+		valid = False
+	
+	return valid
+
+# Runs chinesedata.py with the command line arguments in argv
+def main(argv):
+
+	####
+	#### INITIALIZATION CODE - 1. get command line flags 2. initialize the cookie system to allow logging into the All China Data Center 3. Initialize the .csv file(s)
+	####
+
+	# The variables that describe how the program should operate
+	datasets = []
+	multifile = ""
+	verbose = ""
+
+	# Reading command line arguments; datasets is a list of (dataset, years)
+	datasets, multifile, verbose, options = parseArguments(argv)
+	crawlOptions.update(options)
+
+	# the rest of the package, which brings in the networking libraries and BeautifulSoup with it,
+	# is only imported now that we know there is a crawl to run
+	import multiprocessing
+
+	from chinadata import crawl, fetch, parse, settings, storage
+
+	if(verbose==True):
+		print "\nStarting program by initializing cookies and files"
+
+
+	# loads the cookies, and sets up the session, the rate limiter and the crawl's metrics
+	fetch.openSession(crawlOptions['maxrate'])
+
+	# starts the parser processes before any other threads are running, the reporting thread
+	# included, so that none of them is holding a lock when the processes fork
+	if(crawlOptions['parsers'] > 0):
+		parse.parserPool = multiprocessing.Pool(crawlOptions['parsers'], parse.initParserProcess)
+
+	# prints a summary line of the metrics every so often if we are being verbose
+	if(verbose==True):
+		fetch.crawlMetrics.startReporting(METRICS_INTERVAL)
+
+	# points the crawl at another site, if we were given one
+	if(crawlOptions['site'] != None):
+		settings.LOGIN_URL = crawlOptions['site']
+		settings.BASE_URL = crawlOptions['site'] + "/member/"
+
+	settings.WAIT_TIME = crawlOptions['loginwait']
+
+	# sets up the page cache; the size is given in megabytes
+	if(crawlOptions['cachedir'] != None):
+		fetch.responseCache = fetch.ResponseCache(crawlOptions['cachedir'], crawlOptions['cachettl'], crawlOptions['cachesize'] * 1024 * 1024)
+
+	# opens the archive of raw responses, adding to it if an earlier run started it
+	if(crawlOptions['archive'] != None):
+		fetch.responseArchive = fetch.ResponseArchive(crawlOptions['archive'])
+
+	# opens each dataset's journal of finished work, picking up an earlier run's entries if we are resuming
+	for dataset, years in datasets:
+		storage.crawlJournals[dataset] = storage.CrawlJournal(dataset + str(years[0]) + "-" + str(years[len(years)-1]) + ".journal", crawlOptions['resume'])
+
+		if(crawlOptions['resume'] == True and verbose==True):
+			print "Resuming the %s data: %s units already written out, %s pages of unfinished units to redo" % (dataset, len(storage.crawlJournals[dataset].units), storage.crawlJournals[dataset].unfinishedPages())
+
+	# loads the dropdown lists saved by earlier runs
+	storage.loadDropdownRegistry()
+
+	# opens the CSV files, by dataset
+	csvfiles = {}
+
+	for dataset, years in datasets:
+		# picks up the earlier output files, before initCSV starts writing over them
+		if(crawlOptions['incremental'] == True):
+			storage.loadExistingRows(dataset, years, multifile, verbose)
+
+		csvfiles[dataset] = storage.initCSV(dataset, years, multifile)
+
+	###
+	### RUNTIME CODE - the main goal here is to log in, then dispatch the actual handling of getting the data to dataset-specific functions
+	###
+
+	finished = False
+
+	try:
+		txdata = ''	
+
+		# there is no need to log in when every page comes out of the cache
+		if(crawlOptions['offline'] == True):
+			if(verbose==True):
+				print "Running offline; all pages will come from the cache in %s" % crawlOptions['cachedir']
+		else:
+			fetch.logIn(verbose)
+
+		# gets the data; several datasets are crawled side by side, through the same session
+		if(len(datasets) == 1):
+			crawl.getData(datasets[0][0], datasets[0][1], csvfiles[datasets[0][0]], verbose, multifile)
+		else:
+			crawl.getDatasets(datasets, csvfiles, verbose, multifile)
+
+	except IOError, e:
+		print "We failed to open a page."
+		if hasattr(e, 'code'):
+			print "We failed with error code - %s." % e.code
+		elif hasattr(e, 'reason'):
+			print "The error object has the following 'reason' attribute :"
+			print e.reason
+			print "This usually means the server doesn't exist,"
+			print "is down, or we don't have an internet connection."
+		sys.exit()
+
+
+
+	else:
+			print "Success! Data saved." 
+			finished = True
+			if(verbose==True):
+				print "Now cleaning up after ourselves"
+
+	####
+	#### CLEANUP CODE - done however the crawl ended, so a failed crawl still saves its cookies,
+	#### its journals and its metrics
+	####
+	finally:
+		fetch.closeSession(verbose)
+		fetch.crawlMetrics.stop()
+
+		if(fetch.responseArchive != None):
+			fetch.responseArchive.close()
+
+		if(verbose==True):
+			print fetch.crawlMetrics.summary()
+
+		if(crawlOptions['metrics'] != None):
+			fetch.crawlMetrics.write(crawlOptions['metrics'])
+
+		for dataset in storage.crawlJournals:
+			storage.crawlJournals[dataset].close()
+
+		storage.saveDropdownRegistry()
+
+		# the parsers are only left to finish their work when there is a crawl to finish it for
+		if(parse.parserPool != None):
+			if(finished == True):
+				parse.parserPool.close()
+			else:
+				parse.parserPool.terminate()
+
+			parse.parserPool.join()
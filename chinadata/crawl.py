@@ -0,0 +1,688 @@
+# file: chinadata/crawl.py
+#
+# purpose: crawling each dataset: works out the requests for every page, year and province,
+# and puts what comes back into the dataset's table, and from there into its csv files or out
+# to the caller as records
+#
+# created by: Andrew MacDonald on 11/24/08, as part of chinesedata.py; split out on 10/18/26.
+#
+# copyright: (c) 2008, 2009, 2010, 2013 Andrew MacDonald. All rights reserved.
+# email: andrewm@stanfordalumni.org
+
+import sys
+import threading
+import time
+
+from chinadata import fetch, settings
+from chinadata.settings import *
+from chinadata.fetch import crawlStopping, fetchPages
+from chinadata.parse import parseDropdown, parseHeaders, parsePages, parseRows, placePage, splitPage
+from chinadata.storage import CrawlJournal, Record, checkProvinceList, crawlJournals, enterData, existingUnit, findRowIndex, newDatabase, registerDropdown, registeredDropdown, saveDropdownRegistry, writeUnits
+
+####
+#### FUNCTIONS
+####
+
+# Gets a list of all of the provinces available based on the drop-down menus
+# will iterate through all the years passed
+def initProvinceList(years, dataset, verbose):
+	
+	provincelist = []
+	url = ""
+	valuelist = []
+	fetchyears = []
+
+	# initializing the internal database based on year/county retrieval
+	for i in years:
+		# the lists an earlier run saved in the dropdown registry don't need to be asked for again
+		if(crawlOptions['refreshdropdowns'] == False and registeredDropdown(dataset, i, "") != None):
+			continue
+
+		fetchyears.append(i)
+
+		# values for the POST url
+		if(dataset==COUNTY_DATASET):
+			values = {'code':'A01', 'province':'', 'city':'', 'ayear':i}
+			url = settings.BASE_URL + COUNTY_BASE_URL
+		elif(dataset==PROVINCE_DATASET):
+			values = {'code':'A0101', 'dq':'', 'ayear':i}
+			url = settings.BASE_URL + PROVINCE_BASE_URL
+		elif(dataset==URBAN_DATASET):
+			values = {'code':'A01', 'province':'', 'city':'', 'ayear':i, 'sid':'0'}
+			url = settings.BASE_URL + URBAN_BASE_URL
+		elif(dataset==PREFECTURE_DATASET):
+			values = {'code':'A01', 'province':'', 'city':'', 'ayear':i, 'sid':'0'}
+			url = settings.BASE_URL + PREFECTURE_BASE_URL
+
+		valuelist.append(values)
+
+	# sends the requests
+	for i, page in enumerate(parsePages(fetchPages(url, valuelist, crawlOptions['workers']))):
+		if(dataset==PROVINCE_DATASET and verbose==True):
+			print "Initializing province list"
+		elif(verbose==True):
+			print "Initializing province list for year: %s" % fetchyears[i]
+			
+		if(dataset==PROVINCE_DATASET):
+			registerDropdown(dataset, fetchyears[i], "", parseDropdown(page, PROVINCE_DATASET_DD), verbose)
+		else:
+			registerDropdown(dataset, fetchyears[i], "", parseDropdown(page, PROVINCE_DD), verbose)
+
+	saveDropdownRegistry()
+
+	for i in years:
+		provincelist.append(registeredDropdown(dataset, i, ""))
+
+	# the province data only ever asks for one year's list
+	if(dataset==PROVINCE_DATASET):
+		provincelist = provincelist[0]
+	
+	if(verbose==True):
+		print "\n\n***Inititalization complete. Starting on data gathering***\n\n"
+	
+	return provincelist
+
+# This processes a page-type that is below the province level - essentially, counties and cities.
+# Yields each province in each year as a unit of work; see crawlUnits
+def processSubProvinceData(years, verbose, dataset):
+	
+	pages = []
+	provincelist = []
+	url = ""
+	
+	if(dataset==COUNTY_DATASET):
+		pages = COUNTY_PAGES
+		url = settings.BASE_URL + COUNTY_BASE_URL
+	elif(dataset==URBAN_DATASET):
+		pages = URBAN_PAGES
+		url = settings.BASE_URL + URBAN_BASE_URL
+	elif(dataset==PREFECTURE_DATASET):
+		pages = PREFECTURE_PAGES
+		url = settings.BASE_URL + PREFECTURE_BASE_URL
+			
+	provincelist = initProvinceList(years, dataset, verbose)
+	
+	# lays out every (year, province) unit and the page requests it needs up front, so that the
+	# pages can be fetched concurrently; they still come back, and are parsed, in exactly this order
+	units = []
+	valuelist = []
+	needed = {}
+	batchedpages = {}
+	checkedyears = []
+
+	for year in years:
+		needed[year] = []
+
+		for provincetuple in provincelist[years.index(year)]:
+			# skips provinces that an earlier, interrupted run already wrote out
+			if(crawlJournals[dataset].unitDone(dataset, year, provincetuple[0])):
+				continue
+
+			units.append((year, provincetuple))
+
+			# provinces we already have from an earlier crawl's output don't need any pages
+			if(existingUnit(dataset, year, provincetuple[0]) == None):
+				needed[year].append(provincetuple)
+
+		# years with more than one province to get are fetched in batches (see fetchBatchedYear), the
+		# rest one province at a time
+		if(len(needed[year]) < 2 or crawlOptions['batch'] == False or dataset not in BATCH_DATASETS):
+			for provincetuple in needed[year]:
+				for numpages in pages:
+					valuelist.append(subunitValues(dataset, numpages, provincetuple[0], year))
+
+			needed[year] = []
+
+	outputs = parsePages(fetchPages(url, valuelist, crawlOptions['workers']))
+
+	# now that we've initialized, we need to loop through all of the years and provinces
+	for i, unit in enumerate(units):
+		year, provincetuple = unit
+
+		if(i == 0 or units[i-1][0] != year):
+			if(verbose==True):
+				print "Now doing year: %s" % year
+
+			if(needed[year] != []):
+				batchedpages = fetchBatchedYear(url, dataset, pages, year, needed[year], provincelist[years.index(year)], verbose)
+
+		if(verbose==True):
+			print "\tNow doing province: %s" % provincetuple[1]
+
+		# copies over what an earlier crawl already got for this province
+		if(existingUnit(dataset, year, provincetuple[0]) != None):
+			if(verbose==True):
+				print "\t\tAlready have this province; copying it over"
+
+			yield (year, provincetuple[0], existingUnit(dataset, year, provincetuple[0]))
+			continue
+
+		subunitDB = newDatabase(dataset)
+
+		# goes across all the pages within the province/year to get the data we need
+		for numpages in pages:
+			if(verbose==True):
+				print "\t\tNow doing page: %s" % numpages
+
+			if(needed[year] != []):
+				page = batchedpages[(provincetuple[0], numpages)]
+			else:
+				page = outputs.next()
+
+			# makes sure the year's province list we went by is still the one on the site
+			if(year not in checkedyears and checkProvinceList(dataset, year, page) == True):
+				checkedyears.append(year)
+
+			# puts the page's data into its columns in the database
+			parseSubunitData(page, subunitDB, dataset, numpages)
+			crawlJournals[dataset].recordPage(dataset, year, provincetuple[0], numpages)
+
+		# keeps the province's subunits for later runs and for lookupUnitId
+		registerDropdown(dataset, year, provincetuple[0], [(subunitDB.get(row, 1), subunitDB.get(row, 0)) for row in range(len(subunitDB))], verbose)
+
+		# now that we've got all of the pages' data concat'ed, we can process it
+		yield (year, provincetuple[0], enterData(subunitDB, provincetuple, year, dataset))
+
+# Gets the POST values for one page of a subunit dataset; a province of '' asks for all of them
+def subunitValues(dataset, numpages, province, year):
+
+	if(dataset==COUNTY_DATASET):
+		values = {'code':numpages, 'province':province, 'city':'', 'ayear':year}
+	elif(dataset==URBAN_DATASET):
+		values = {'code':numpages, 'province':province, 'city':'', 'ayear':year, 'sid':'1'}
+	elif(dataset==PREFECTURE_DATASET):
+		values = {'code':numpages, 'province':province, 'city':'', 'ayear':year, 'sid':'0'}
+
+	return values
+
+# Fetches every page of a year for all of the provinces at once, using the site's all-province view,
+# and splits each one back out into a page per province (see splitCombinedPage). Any page that
+# can't be split cleanly, say because the combined table was cut short, is fetched again one
+# province at a time. provinces are the ones wanted, and allprovinces all of the year's provinces.
+# Returns a ParsedPage for each (province ID, page code) of the provinces wanted
+def fetchBatchedYear(url, dataset, pages, year, provinces, allprovinces, verbose):
+
+	batchedpages = {}
+	fallback = []
+	valuelist = []
+
+	for numpages in pages:
+		valuelist.append(subunitValues(dataset, numpages, '', year))
+
+	for i, page in enumerate(parsePages(fetchPages(url, valuelist, crawlOptions['workers']))):
+		split = splitCombinedPage(page, provinces, allprovinces)
+
+		if(split == None):
+			if(verbose==True):
+				print "\tThe all-province table for page %s can't be split up; getting it a province at a time" % pages[i]
+
+			fallback.append(pages[i])
+			continue
+
+		for provincetuple in provinces:
+			batchedpages[(provincetuple[0], pages[i])] = split[provincetuple[0]]
+
+	valuelist = []
+
+	for numpages in fallback:
+		for provincetuple in provinces:
+			valuelist.append(subunitValues(dataset, numpages, provincetuple[0], year))
+
+	for i, page in enumerate(parsePages(fetchPages(url, valuelist, crawlOptions['workers']))):
+		batchedpages[(provinces[i % len(provinces)][0], fallback[i / len(provinces)])] = page
+
+	return batchedpages
+
+# Splits a page from the all-province view into a ParsedPage for each of the provinces, using the
+# subunit IDs from the dropdown to tell which province each row belongs to. Every subunit is matched
+# against allprovinces, the year's whole province list, and the rows of the provinces that aren't
+# wanted are dropped. Returns None if that can't be done reliably: if the table has fewer rows than
+# the dropdown has subunits (so it was cut short or split over several pages), if a row's name
+# doesn't pick out exactly one subunit, if a subunit's ID doesn't match any province, or if one of
+# the provinces wanted has no subunits at all
+def splitCombinedPage(page, provinces, allprovinces):
+
+	subunits = parseDropdown(page, SUBUNIT_DD)
+	rows, numcolumns = parseRows(page)
+	byname = {}
+	split = {}
+
+	if(subunits == [] or len(rows) < len(subunits)):
+		return None
+
+	for provincetuple in provinces:
+		split[provincetuple[0]] = ([], [])
+
+	for subunit in subunits:
+		byname.setdefault(subunit[1].rstrip(), []).append(subunit)
+
+	for subunit in subunits:
+		province = provinceOfUnit(subunit[0], allprovinces)
+
+		if(province == None):
+			return None
+
+		if(province in split):
+			split[province][0].append(subunit)
+
+	for row in rows:
+		matches = byname.get(row[0].rstrip(), [])
+
+		if(len(matches) != 1):
+			return None
+
+		province = provinceOfUnit(matches[0][0], allprovinces)
+
+		if(province in split):
+			split[province][1].append(row)
+
+	for province in split.keys():
+		if(split[province][0] == []):
+			return None
+
+		split[province] = splitPage(split[province][1], numcolumns, parseHeaders(page), split[province][0])
+		split[province].dropdowns[PROVINCE_DD] = parseDropdown(page, PROVINCE_DD)
+
+		# each province gets its share of the time it took to parse the combined page
+		split[province].parsetime = page.parsetime / len(split)
+
+	return split
+
+# Finds which of the provinces a subunit ID belongs to: the one whose ID, less any trailing pairs of
+# zeros, starts the subunit's ID. Returns None if there isn't one
+def provinceOfUnit(unitid, provinces):
+
+	for provincetuple in provinces:
+		prefix = provincetuple[0]
+
+		while(prefix.endswith("00")):
+			prefix = prefix[:-2]
+
+		if(prefix != "" and unitid.startswith(prefix)):
+			return provincetuple[0]
+
+	return None
+
+# Parses a generic subunit data page, given as a ParsedPage, into the database; the page's columns
+# go wherever the dataset's page layout puts them (see placePage), so pages can come in any order
+def parseSubunitData(page, database, dataset, pagecode):
+
+	data = []
+	rowIndex = 0
+	numColumns = 0
+	pageColumns = 0
+	subunitTuple = []
+	subunits = []
+
+	# Need to set numColumns based on the dataset
+	if(dataset == COUNTY_DATASET):
+		numColumns = len(COUNTY_HEADERS) - (COUNTY_NUM_HEADER_VARIABLES)
+	elif(dataset == URBAN_DATASET):
+		numColumns = len(URBAN_HEADERS) - (URBAN_NUM_HEADER_VARIABLES)
+	elif(dataset == PREFECTURE_DATASET):
+		numColumns = len(PREFECTURE_HEADERS) - (PREFECTURE_NUM_HEADER_VARIABLES)
+	else:
+		print "Dataset type not supported in this parsing mode"
+		raise self.e
+
+	# initing the db based on the dropdown menu of whichever page comes first
+	if(len(database) == 0):
+		subunits = parseDropdown(page, SUBUNIT_DD)
+
+		for n, subunit in enumerate(subunits):
+			initSubunit(database, subunit[1].rstrip(), subunit[0], numColumns)
+	
+	# gets all the data rows and the number of columns
+	datapage, pageColumns = parseRows(page)
+	
+	# finds the database column the page's data starts at; the database has no columns for
+	# the header variables
+	startColumncursor = placePage(dataset, pagecode, page)[0] - getNumHeaderVariables(dataset)
+
+	if(fetch.crawlMetrics != None):
+		fetch.crawlMetrics.recordParse(dataset, pagecode, page.parsetime, len(datapage))
+	
+	# Iterates down the list of rows
+	for datarow in datapage:
+
+		# checks to see if the named unit is already in the database; if not, rowIndex is == -1
+		rowIndex = findRowIndex(database, datarow[0], 0)
+
+		# now we have to find if this subunit already has an entry;
+		# if it doesn't exist yet, we have to creat a new row
+		# if it does, then we add on the new data parts
+		# note: this only occurs when the county shows up on subsequent 
+		# pages but is not on the first page's subunit dropdown list
+		# not sure if this ever happens, but probably better to account for it
+		if(rowIndex == -1):
+			print "doing post-init not found code"
+			subunits = []
+			subunitTuple = []
+
+			subunits = parseDropdown(page, SUBUNIT_DD)
+			
+			# Finds the necessary subunit
+			for subunit in subunits:
+				if(subunit[1] == datarow[0]):
+					subunitTuple = subunit
+				
+			# If the subunit does not have a drop-down entry, we are in trouble	
+			if(subunitTuple == []):
+				print "Subunit has shown up that does not have a corresponding ID given"
+				print "This is a serious error"
+				sys.exit()
+				
+			initSubunit(database, subunitTuple[1], subunitTuple[0], numColumns)		
+									
+			# resets the row index to the proper value
+			rowIndex = findRowIndex(database, datarow[0], 0) 
+		
+		# need to reset n each time for each row
+		n = startColumncursor
+		
+		# actually adds on the new data into the database structure
+		for p, newdata in enumerate(datarow):
+			if(p == 0):
+				# name is already entered; this datarow has the name
+				pass
+			else:										
+				# adds in the new data, advances the column variable
+				database.set(rowIndex, n, newdata)
+				n = n + 1
+
+# Another helper function that initializes the subunit data in the subunit database
+# note: only called from parseSubunitData
+def initSubunit(database, name, id, numColumns):
+	
+	newentry = []
+	
+	for i in range(numColumns):
+		if(i == 0):
+			newentry.append(name)
+		elif(i == 1):
+			newentry.append(id)
+		else:
+			newentry.append(MISSING_VALUE)
+	
+	database.addRow(newentry)
+
+# Crawls a dataset and writes it out to its csv files
+def getData(dataset, years, csvfiles, verbose, multifile):
+
+	writeUnits(dataset, years, crawlUnits(dataset, years, verbose), csvfiles, multifile)
+
+# Actually switches between the functions that do all of the data gathering work. Each of them is
+# a generator, yielding a unit of work as soon as it is finished: (year, province ID, rows), where
+# rows are the unit's lines of output in the order of the dataset's headers. The year is "" for the
+# national data, which is one unit, and the province ID is "" for the national and province data.
+# The pages are only fetched as the units are asked for, and a unit's rows must be used up before
+# the next unit is asked for
+def crawlUnits(dataset, years, verbose):
+
+	if(dataset==COUNTY_DATASET):
+		return getCountyData(years, verbose)
+	elif(dataset==NATIONAL_DATASET):
+		return getNationalData(years, verbose)
+	elif(dataset==PROVINCE_DATASET):
+		return getProvinceData(years, verbose)
+	elif(dataset==URBAN_DATASET):
+		return getUrbanData(years, verbose)
+	elif(dataset==PREFECTURE_DATASET):
+		return getPrefectureData(years, verbose)
+
+# Crawls a dataset and yields its output a row at a time, as a Record (see storage.Record), rather
+# than writing it to csv files; only the unit of work being crawled is held in memory. The session
+# has to be open and logged in first (see fetch.openSession and fetch.logIn). A dataset with no
+# journal gets one that is only kept in memory, so nothing is written but the caches
+# Sample usage: for record in iterRecords(COUNTY_DATASET, [2000, 2001]): print record.get('GDP(100 million yuan)')
+def iterRecords(dataset, years, verbose=False):
+
+	if(dataset not in crawlJournals):
+		crawlJournals[dataset] = CrawlJournal(None, False)
+
+	for year, province, rows in crawlUnits(dataset, years, verbose):
+		for row in rows:
+			yield Record(dataset, row)
+
+# Gets several datasets at once, each in its own thread. The threads share the session, rate
+# limiter, page cache and dropdown registry, so their requests are interleaved under the same
+# limits as one dataset's would be. If any of them fails (including with a sys.exit), the others
+# are stopped at their next page and the error is raised here, in the main thread
+def getDatasets(datasets, csvfiles, verbose, multifile):
+
+	threads = []
+	errors = []
+
+	for dataset, years in datasets:
+		thread = threading.Thread(target=getDataInThread, args=(dataset, years, csvfiles[dataset], verbose, multifile, errors))
+		thread.start()
+		threads.append(thread)
+
+	# joins with a timeout, so that Ctrl-C still gets through to the main thread; on Ctrl-C the
+	# other threads are told to stop, and are waited for before it is passed on
+	try:
+		while(errors == [] and len(threads) > 0):
+			threads[0].join(1)
+
+			if(threads[0].is_alive() == False):
+				threads.pop(0)
+	except KeyboardInterrupt:
+		stopThreads(threads)
+		raise
+
+	if(errors != []):
+		stopThreads(threads)
+
+		raise errors[0][0], errors[0][1], errors[0][2]
+
+# Tells the threads of getDatasets to stop, and waits for them to finish what they are doing
+# note: only called from getDatasets
+def stopThreads(threads):
+
+	crawlStopping.set()
+
+	for thread in threads:
+		while(thread.is_alive()):
+			thread.join(1)
+
+# The thread for one dataset in getDatasets; keeps whatever the crawl raises in errors
+# note: only called from getDatasets
+def getDataInThread(dataset, years, csvfiles, verbose, multifile, errors):
+
+	try:
+		getData(dataset, years, csvfiles, verbose, multifile)
+	except BaseException:
+		errors.append(sys.exc_info())
+
+# Gets county data - this function and urban do essentially the same thing
+def getCountyData(years, verbose):
+
+	return processSubProvinceData(years, verbose, COUNTY_DATASET)
+
+# Gets the national data, which is one unit of work covering every year
+def getNationalData(years, verbose):
+	
+	pages = NATIONAL_PAGES
+	url = settings.BASE_URL + NATIONAL_BASE_URL
+	offset, width, index = [0, 0, 0]
+	database, newyear, rows = [newDatabase(NATIONAL_DATASET), [], []]
+
+	# the whole national dataset is one unit of work, so there is nothing to do if it was finished
+	if(crawlJournals[NATIONAL_DATASET].unitDone(NATIONAL_DATASET, "", "")):
+		if(verbose==True):
+			print "The national data was already written out by an earlier run"
+		return
+
+	# an earlier crawl's output with every year we want saves us the whole crawl
+	if(existingUnit(NATIONAL_DATASET, "", "") != None):
+		if(verbose==True):
+			print "Already have the national data for every year; copying it over"
+
+		yield ("", "", existingUnit(NATIONAL_DATASET, "", ""))
+		return
+	
+	# inits the database
+	for i, year in enumerate(years):
+	
+		newyear = []
+		
+		for t in range(len(NATIONAL_HEADERS)):
+			if(t == 0):
+				newyear.append(str(year))
+			else:
+				newyear.append(MISSING_VALUE)
+		
+		database.addRow(newyear)
+	
+	# the national pages don't depend on the year, so one request per page covers everything
+	valuelist = []
+
+	for page in pages:
+		valuelist.append({'code':page})
+
+	for i, parsedpage in enumerate(parsePages(fetchPages(url, valuelist, crawlOptions['workers']))):
+		page = pages[i]
+
+		if(verbose==True):
+			print "Now doing page: %s" % page		
+
+		# gets the rows and where their columns go
+		rows = parseRows(parsedpage)[0]
+		offset, width = placePage(NATIONAL_DATASET, page, parsedpage)
+
+		if(fetch.crawlMetrics != None):
+			fetch.crawlMetrics.recordParse(NATIONAL_DATASET, page, parsedpage.parsetime, len(rows))
+
+		# goes through the rows and copies the data to our year-database
+		for row in rows:
+			index = findRowIndex(database, row[0].lstrip('&nbsp;'), NATIONAL_NUM_HEADER_VARIABLES-1)
+		
+			if(index != -1):				
+				for t in range(width + 1):
+					if(t == 0):
+						# this is the year - we've already got that
+						pass
+					else:
+						database.set(index, offset+t-1, row[t])
+			else:
+				# got a year here that is not in the range of years we are asked to deal with
+				# so, pass
+				pass
+
+		crawlJournals[NATIONAL_DATASET].recordPage(NATIONAL_DATASET, "", "", page)
+	
+	yield ("", "", enterData(database, [], year, NATIONAL_DATASET))
+
+# Gets the province data, a unit of work for each year
+def getProvinceData(years, verbose):
+
+	pages = PROVINCE_PAGES
+	url = settings.BASE_URL + PROVINCE_BASE_URL
+	provinces, lastyear, newrow, rows, currentyear = [[], [], [], [], []]
+	offset, width, index = [0, 0, 0]
+	
+	# Sends the last year of the dataset into the init function; 
+	# this function requires an array of years, but we only need to 
+	# init once
+	lastyear.append(years[len(years)-1])
+	provinces = initProvinceList(lastyear, PROVINCE_DATASET, verbose)
+	
+	print("Province headers: " + str(len(PROVINCE_HEADERS)))
+
+	# queues up every year's pages at once, so they can be fetched concurrently; outputs
+	# come back in the same order as the loops below consume them
+	valuelist = []
+
+	for year in years:
+		# years that an earlier, interrupted run already wrote out, or that we already have from an
+		# earlier crawl's output, don't need any pages
+		if(crawlJournals[PROVINCE_DATASET].unitDone(PROVINCE_DATASET, year, "") == False and existingUnit(PROVINCE_DATASET, year, "") == None):
+			for page in pages:
+				valuelist.append({'code':page, 'dq':'', 'ayear':year})
+
+	outputs = parsePages(fetchPages(url, valuelist, crawlOptions['workers']))
+	
+	# In this, we loop through each year; each year has a separate datastructure
+	# At the end of processing the data for that year, it is written out to the file
+	for i, year in enumerate(years):
+		if(crawlJournals[PROVINCE_DATASET].unitDone(PROVINCE_DATASET, year, "")):
+			continue
+
+		currentyear = newDatabase(PROVINCE_DATASET)
+		
+		if(verbose==True):
+			print "Now doing year: %s" % year
+
+		# copies over what an earlier crawl already got for this year
+		if(existingUnit(PROVINCE_DATASET, year, "") != None):
+			if(verbose==True):
+				print "\tAlready have this year; copying it over"
+
+			yield (year, "", existingUnit(PROVINCE_DATASET, year, ""))
+			continue
+	
+		# inits the currentyear database
+		for province in provinces:
+			newrow = []
+		
+			for s in range(len(PROVINCE_HEADERS)): 
+				# appends the year
+				if(s == 0):
+					newrow.append(year)
+				# appends the id
+				elif(s == 1):
+					newrow.append(province[0])
+				# appends the name
+				elif(s == 2):
+					newrow.append(province[1])
+				else:
+					newrow.append(MISSING_VALUE)
+			
+			currentyear.addRow(newrow)
+			
+		for page in pages:
+			if(verbose==True):
+				print "\tNow doing page: %s" % page
+			
+			# gets the next page, parsed
+			parsedpage = outputs.next()
+			
+			# gets the rows and where their columns go
+			rows = parseRows(parsedpage)[0]
+			offset, width = placePage(PROVINCE_DATASET, page, parsedpage)
+
+			if(fetch.crawlMetrics != None):
+				fetch.crawlMetrics.recordParse(PROVINCE_DATASET, page, parsedpage.parsetime, len(rows))
+			
+			# goes through the rows and copies the data to our year-database
+			for row in rows:
+			
+				index = findRowIndex(currentyear, row[0], PROVINCE_NUM_HEADER_VARIABLES-1)
+			
+				if(index != -1):				
+					for t in range(width + 1):
+						if(t == 0):
+							# this is the name - we've already got that
+							pass
+						else:
+							currentyear.set(index, offset+t-1, row[t])
+				else:
+					print "Province not found in province database!"
+					print "This is a serious error."
+					print "Exiting."
+					raise self.e
+
+			crawlJournals[PROVINCE_DATASET].recordPage(PROVINCE_DATASET, year, "", page)
+		
+
+		yield (year, "", enterData(currentyear, [], year, PROVINCE_DATASET))
+
+# Gets urban data - this function and county do essentially the same thing
+def getUrbanData(years, verbose):
+
+	return processSubProvinceData(years, verbose, URBAN_DATASET)
+
+# Gets prefecture-level data - this function is similar to county and urban pages; hence, this function	
+def getPrefectureData(years, verbose):
+
+	return processSubProvinceData(years, verbose, PREFECTURE_DATASET)
@@ -0,0 +1,998 @@
+# file: chinadata/fetch.py
+#
+# purpose: getting pages off the site: the keep-alive session, the page cache and archive, the
+# rate limiter, the crawl's metrics, and sendRequest and fetchPages, which every request goes
+# through. The session and the rest are set up with openSession, by the main code in cli.py or by
+# anything else that wants to crawl
+#
+# created by: Andrew MacDonald on 11/24/08, as part of chinesedata.py; split out on 10/18/26.
+#
+# copyright: (c) 2008, 2009, 2010, 2013 Andrew MacDonald. All rights reserved.
+# email: andrewm@stanfordalumni.org
+
+import array
+import cookielib
+import email.utils
+import hashlib
+import httplib
+import json
+import math
+import os.path
+import Queue
+import random
+import re
+import socket
+import sys
+import threading
+import time
+import urllib
+import urllib2
+import urlparse
+import zlib
+
+from chinadata import settings
+from chinadata.settings import *
+
+####
+#### GLOBAL VARIABLES
+####
+
+# cookiejar variables
+cj = None
+
+# the keep-alive session that every request goes through; see openSession
+session = None
+
+# the on-disk cache of downloaded pages; set up in the main code unless --no-cache is given
+responseCache = None
+
+# the archive of raw responses written with --archive; set up in the main code
+responseArchive = None
+
+# the request rate limiter shared by every worker; see openSession
+rateLimiter = None
+
+# the crawl's counters and timings, by dataset and page; see CrawlMetrics
+crawlMetrics = None
+
+# per-host semaphores that cap the number of requests in flight to each server; see hostSemaphore
+hostSemaphores = {}
+
+hostSemaphoresLock = threading.Lock()
+
+# set when one of the datasets being crawled side by side has failed, to stop the others at their
+# next page; see getDatasets
+crawlStopping = threading.Event()
+
+####
+#### FUNCTIONS
+####
+
+# A persistent HTTP session: keeps a pool of keep-alive connections per host, so that the thousands
+# of small POSTs in a crawl don't each pay for a new TCP connection, and shares one cookie jar
+# between all of them. Errors are raised as urllib2 errors, which is what sendRequest expects
+class Session(object):
+
+	def __init__(self, cookiejar, headers):
+		self.cookiejar = cookiejar
+		self.headers = headers
+		self.idle = {}
+		self.lock = threading.Lock()
+
+	# Sends postvalues to url (a GET if postvalues is None) and returns the body of the response,
+	# following any redirects along the way, along with the number of bytes the body took to send
+	def fetch(self, url, postvalues, headers=None):
+
+		txdata = None
+
+		if(postvalues != None):
+			txdata = urllib.urlencode(postvalues)
+
+		for i in range(MAX_REDIRECTS + 1):
+			req = urllib2.Request(url, txdata, headers or self.headers)
+			response, body = self.send(req)
+
+			# hands any new cookies over to the cookie jar
+			self.cookiejar.extract_cookies(SessionResponse(response), req)
+
+			if(response.status in (301, 302, 303, 307) and response.getheader('location')):
+				url = urlparse.urljoin(url, response.getheader('location'))
+
+				# browsers turn a redirected POST into a GET, and so does urllib2
+				if(response.status != 307):
+					txdata = None
+
+			elif(response.status >= 400):
+				raise urllib2.HTTPError(url, response.status, response.reason, response.msg, None)
+			else:
+				return self.decode(url, response, body), len(body)
+
+		raise urllib2.URLError("too many redirects")
+
+	# Undoes whatever compression the server put on a response body
+	def decode(self, url, response, body):
+
+		encoding = (response.getheader('content-encoding') or '').strip().lower()
+
+		try:
+			if(encoding in ('gzip', 'x-gzip')):
+				return zlib.decompress(body, 16 + zlib.MAX_WBITS)
+			elif(encoding == 'deflate'):
+				# servers disagree on whether deflate means a zlib stream or a bare one
+				try:
+					return zlib.decompress(body)
+				except zlib.error:
+					return zlib.decompress(body, -zlib.MAX_WBITS)
+		except zlib.error, e:
+			raise urllib2.URLError("the %s response from %s could not be decompressed: %s" % (encoding, url, e))
+
+		return body
+
+	# Sends one request on a pooled connection; a connection the server has quietly closed
+	# while it sat in the pool is thrown away and the request retried on a fresh one
+	def send(self, req):
+
+		reqheaders = {}
+		host = req.get_host()
+		path = urlparse.urlunsplit(('', '') + urlparse.urlsplit(req.get_full_url())[2:]) or '/'
+
+		self.cookiejar.add_cookie_header(req)
+		reqheaders.update(req.header_items())
+		reqheaders['Accept-Encoding'] = ACCEPT_ENCODING
+
+		if(req.has_data()):
+			reqheaders['Content-Type'] = 'application/x-www-form-urlencoded'
+
+		while(True):
+			conn, reused = self.getConnection(req.get_type(), host)
+
+			try:
+				conn.request(req.get_method(), path, req.get_data(), reqheaders)
+				response = conn.getresponse()
+				body = response.read()
+			except (httplib.HTTPException, socket.error), e:
+				conn.close()
+
+				if(reused == False):
+					raise urllib2.URLError(e)
+			else:
+				if(response.will_close):
+					conn.close()
+				else:
+					self.releaseConnection(req.get_type(), host, conn)
+
+				return response, body
+
+	# Takes an idle connection to the host out of the pool, or opens a new one;
+	# also returns whether the connection has been used before
+	def getConnection(self, scheme, host):
+
+		with self.lock:
+			if(self.idle.get((scheme, host))):
+				return self.idle[(scheme, host)].pop(), True
+
+		if(scheme == 'https'):
+			conn = httplib.HTTPSConnection(host, timeout=REQUEST_TIMEOUT)
+		else:
+			conn = httplib.HTTPConnection(host, timeout=REQUEST_TIMEOUT)
+
+		conn.set_debuglevel(HTTP_DEBUG_LEVEL)
+
+		return conn, False
+
+	# Puts a connection back into the pool for the next request to the same host
+	def releaseConnection(self, scheme, host, conn):
+
+		with self.lock:
+			self.idle.setdefault((scheme, host), []).append(conn)
+
+	# Closes all of the pooled connections
+	def close(self):
+
+		with self.lock:
+			for conns in self.idle.values():
+				for conn in conns:
+					conn.close()
+
+			self.idle = {}
+
+# The bit of a urllib2 response that cookielib needs to read the cookies out of an httplib response
+# note: only used by Session
+class SessionResponse(object):
+
+	def __init__(self, response):
+		self.response = response
+
+	def info(self):
+		return self.response.msg
+
+# An on-disk cache of page outputs, keyed on the url and the sorted POST values. Each page is
+# stored zlib-compressed in its own file; a file's modification time is when it was downloaded
+# (for the time-to-live) and its access time is when it was last used (for evicting the least
+# recently used pages once the cache is over its maximum size)
+class ResponseCache(object):
+
+	def __init__(self, directory, ttl, maxsize):
+		self.directory = directory
+		self.ttl = ttl
+		self.maxsize = maxsize
+		self.lock = threading.Lock()
+		self.entries = None
+		self.size = 0
+
+	# The name of the cache file for a request
+	def path(self, url, postvalues):
+
+		items = sorted(dict(postvalues).items())
+		key = hashlib.sha1(url + "\n" + urllib.urlencode(items)).hexdigest()
+
+		return os.path.join(self.directory, key[:2], key + ".z")
+
+	# Returns the cached output for the request, or None if it isn't cached or has gone stale;
+	# with ignorettl, a page is used however long ago it was downloaded
+	def get(self, url, postvalues, ignorettl=False):
+
+		path = self.path(url, postvalues)
+		now = time.time()
+
+		self.loadEntries()
+
+		with self.lock:
+			if(path not in self.entries):
+				return None
+
+			stored, used, size = self.entries[path]
+
+			if(ignorettl == False and self.ttl > 0 and now - stored > self.ttl):
+				return None
+
+			self.entries[path] = (stored, now, size)
+
+		try:
+			cachefile = open(path, 'rb')
+			try:
+				output = zlib.decompress(cachefile.read())
+			finally:
+				cachefile.close()
+
+			# marks the page as just used, keeping the download time
+			os.utime(path, (now, stored))
+		except (IOError, OSError, zlib.error):
+			# evicted by another process, or a half-written file; either way, not cached
+			return None
+
+		return output
+
+	# Stores the output for the request, evicting old pages if the cache is now too big
+	def put(self, url, postvalues, output):
+
+		path = self.path(url, postvalues)
+		data = zlib.compress(output)
+
+		self.loadEntries()
+
+		if(os.path.isdir(os.path.dirname(path)) == False):
+			try:
+				os.makedirs(os.path.dirname(path))
+			except OSError:
+				# another thread just made it
+				pass
+
+		# writes to a temporary file first, so that a crash never leaves half a page in the cache
+		temppath = "%s.%s.tmp" % (path, threading.current_thread().ident)
+		cachefile = open(temppath, 'wb')
+		try:
+			cachefile.write(data)
+		finally:
+			cachefile.close()
+		os.rename(temppath, path)
+
+		now = time.time()
+
+		with self.lock:
+			if(path in self.entries):
+				self.size = self.size - self.entries[path][2]
+
+			self.entries[path] = (now, now, len(data))
+			self.size = self.size + len(data)
+
+			if(self.size > self.maxsize):
+				self.evict()
+
+	# Removes the least recently used pages until the cache is back under its maximum size
+	# note: must be called holding self.lock
+	def evict(self):
+
+		for path in sorted(self.entries, key=lambda entry: self.entries[entry][1]):
+			if(self.size <= self.maxsize * CACHE_EVICT_TO):
+				break
+
+			try:
+				os.remove(path)
+			except OSError:
+				pass
+
+			self.size = self.size - self.entries.pop(path)[2]
+
+	# Reads in the list of cached pages the first time the cache is used
+	def loadEntries(self):
+
+		with self.lock:
+			if(self.entries != None):
+				return
+
+			self.entries = {}
+
+			for dirpath, dirnames, filenames in os.walk(self.directory):
+				for filename in filenames:
+					if(filename.endswith(".z")):
+						path = os.path.join(dirpath, filename)
+						info = os.stat(path)
+
+						self.entries[path] = (info.st_mtime, info.st_atime, info.st_size)
+						self.size = self.size + info.st_size
+
+# An append-only archive of the raw pages the site sent back, so that what it said can be looked
+# at again without downloading it. The archive is a run of gzip members, one per page, so zcat
+# prints the lot; the index next to it has a line per page with where its member starts and how
+# long it is, when it was downloaded and the request it answers, so that any one page can be read
+# back with a single seek
+class ResponseArchive(object):
+
+	def __init__(self, path):
+		self.path = path
+		self.lock = threading.Lock()
+		self.entries = {}
+
+		archivesize = 0
+		indexsize = 0
+
+		# picks up where an earlier crawl left off; anything written after the last whole line of
+		# the index, by a crawl that died part way through a page, is cut off
+		if(os.path.isfile(path + ARCHIVE_INDEX_SUFFIX)):
+			indexfile = open(path + ARCHIVE_INDEX_SUFFIX, 'rb')
+
+			for line in indexfile:
+				entry = parseArchiveIndexLine(line)
+
+				if(entry == None):
+					break
+
+				offset, length, stored, url, postvalues = entry
+				self.entries[(url, postvalues)] = (offset, length)
+				archivesize = max(archivesize, offset + length)
+				indexsize = indexsize + len(line)
+
+			indexfile.close()
+		# without its index there is no telling where the pages in an archive start, and we won't
+		# throw away pages that somebody went to the trouble of downloading
+		elif(os.path.isfile(path) and os.path.getsize(path) > 0):
+			print "\nThe archive %s has no index (%s), so we can't add to it." % (path, path + ARCHIVE_INDEX_SUFFIX)
+			print "Either restore the index or give --archive a new file. Exiting."
+			sys.exit()
+
+		self.handle = open(path, 'ab')
+		self.handle.truncate(archivesize)
+		self.indexhandle = open(path + ARCHIVE_INDEX_SUFFIX, 'ab')
+		self.indexhandle.truncate(indexsize)
+
+	# Adds the output for a request to the end of the archive
+	def put(self, url, postvalues, output):
+
+		compressor = zlib.compressobj(ARCHIVE_COMPRESSION, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+		data = compressor.compress(output) + compressor.flush()
+		key = archiveKey(url, postvalues)
+
+		with self.lock:
+			self.handle.seek(0, os.SEEK_END)
+			offset = self.handle.tell()
+
+			# the page goes in before its index line, so the index never points past the end
+			self.handle.write(data)
+			self.handle.flush()
+			self.indexhandle.write("%s\t%s\t%.3f\t%s\t%s\n" % (offset, len(data), time.time(), key[0], key[1]))
+			self.indexhandle.flush()
+
+			self.entries[key] = (offset, len(data))
+
+	# Returns the latest output archived for the request, or None if there isn't one
+	def get(self, url, postvalues):
+
+		with self.lock:
+			entry = self.entries.get(archiveKey(url, postvalues))
+
+		if(entry == None):
+			return None
+
+		archivefile = open(self.path, 'rb')
+		try:
+			archivefile.seek(entry[0])
+			return zlib.decompress(archivefile.read(entry[1]), 16 + zlib.MAX_WBITS)
+		finally:
+			archivefile.close()
+
+	def close(self):
+
+		with self.lock:
+			self.handle.close()
+			self.indexhandle.close()
+
+# The key a request is archived under: its url and its POST values, sorted and encoded
+def archiveKey(url, postvalues):
+
+	return url, urllib.urlencode(sorted(dict(postvalues or {}).items()))
+
+# Splits a line of an archive's index into the offset, length, download time, url and encoded
+# POST values of a page; returns None for a line cut short by a crash
+def parseArchiveIndexLine(line):
+
+	fields = line.rstrip("\n").split("\t")
+
+	if(line.endswith("\n") == False or len(fields) != 5):
+		return None
+
+	return int(fields[0]), int(fields[1]), float(fields[2]), fields[3], fields[4]
+
+# Reads back every page in an archive, in the order they were downloaded, yielding the url, the
+# POST values and the output of each. The archive is read straight through, so pages come back
+# as fast as they can be decompressed
+def readArchive(path):
+
+	indexfile = open(path + ARCHIVE_INDEX_SUFFIX, 'rb')
+	archivefile = open(path, 'rb')
+
+	try:
+		for line in indexfile:
+			entry = parseArchiveIndexLine(line)
+
+			if(entry == None):
+				break
+
+			offset, length, stored, url, postvalues = entry
+			archivefile.seek(offset)
+
+			yield url, urlparse.parse_qsl(postvalues, keep_blank_values=True), zlib.decompress(archivefile.read(length), 16 + zlib.MAX_WBITS)
+	finally:
+		indexfile.close()
+		archivefile.close()
+
+# A token bucket that spaces out the requests of every worker. Its rate adapts to how the server
+# is doing: it climbs while responses come back quickly, and is cut back sharply when the server
+# starts giving errors or slowing down. pause stops all requests for a while, for a Retry-After
+class RateLimiter(object):
+
+	def __init__(self, maxrate):
+		self.maxrate = maxrate
+		self.rate = RATE_START
+
+		if(maxrate != 0):
+			self.rate = min(RATE_START, maxrate)
+		self.tokens = 1.0
+		self.updated = time.time()
+		self.pausedUntil = 0
+		self.lastDecrease = 0
+		self.latency = None
+		self.slowStart = True
+		self.lock = threading.Lock()
+
+	# Waits until a request may be sent
+	def acquire(self):
+
+		while(True):
+			with self.lock:
+				now = time.time()
+				self.tokens = min(RATE_BURST, self.tokens + (now - self.updated) * self.rate)
+				self.updated = now
+
+				if(now < self.pausedUntil):
+					wait = self.pausedUntil - now
+				# a maximum rate of 0 means no limit at all
+				elif(self.maxrate == 0):
+					return
+				elif(self.tokens >= 1):
+					self.tokens = self.tokens - 1
+					return
+				else:
+					wait = (1 - self.tokens) / self.rate
+
+			time.sleep(wait)
+
+	# Notes how a request went: how long it took and whether the server was struggling
+	def record(self, latency, overloaded):
+
+		with self.lock:
+			now = time.time()
+
+			if(latency != None):
+				if(self.latency == None):
+					self.latency = latency
+				else:
+					self.latency = LATENCY_SMOOTHING * latency + (1 - LATENCY_SMOOTHING) * self.latency
+
+			if(overloaded == True or (self.latency != None and self.latency > LATENCY_TARGET)):
+				if(now - self.lastDecrease >= RATE_ADJUST_INTERVAL):
+					self.rate = max(RATE_MIN, self.rate * RATE_DECREASE)
+					self.lastDecrease = now
+					self.slowStart = False
+			# a failed request that isn't the server struggling, like a 404, says nothing about how
+			# fast we can go, so it never speeds us up
+			elif(latency == None):
+				return
+			elif(self.slowStart == True):
+				self.rate = self.rate * RATE_SLOW_START
+			else:
+				self.rate = self.rate + RATE_INCREASE
+
+			if(self.maxrate != 0):
+				self.rate = min(self.maxrate, self.rate)
+
+	# Holds back every request for the given number of seconds
+	def pause(self, seconds):
+
+		with self.lock:
+			self.pausedUntil = max(self.pausedUntil, time.time() + seconds)
+
+# Counts what the crawl does, by dataset and page code: the requests sent and how long each
+# took, the bytes that came back, the pages that came out of the cache instead, the retries, and
+# the time spent parsing and the rows that came out of it. The bytes are counted twice: as the
+# pages' output, and as what the server sent before it was decompressed. All of the threads
+# record into one instance, so every method takes the lock
+class CrawlMetrics(object):
+
+	def __init__(self):
+		self.lock = threading.Lock()
+		self.started = time.time()
+		self.pages = {}
+		self.reporter = None
+		self.stopping = threading.Event()
+
+	# Gets the counters for a dataset and page, making them the first time
+	# note: the lock must be held
+	def counters(self, dataset, page):
+
+		if((dataset, page) not in self.pages):
+			self.pages[(dataset, page)] = {'requests':0, 'latencies':array.array('d'), 'bytes':0, 'transferred':0, 'cachehits':0, 'retries':0, 'parsetime':0.0, 'rows':0}
+
+		return self.pages[(dataset, page)]
+
+	def recordRequest(self, url, postvalues, latency, size, transferred):
+
+		with self.lock:
+			counters = self.counters(*requestLabels(url, postvalues))
+			counters['requests'] = counters['requests'] + 1
+			counters['latencies'].append(latency)
+			counters['bytes'] = counters['bytes'] + size
+			counters['transferred'] = counters['transferred'] + transferred
+
+	def recordCacheHit(self, url, postvalues, size):
+
+		with self.lock:
+			counters = self.counters(*requestLabels(url, postvalues))
+			counters['cachehits'] = counters['cachehits'] + 1
+			counters['bytes'] = counters['bytes'] + size
+
+	def recordRetry(self, url, postvalues):
+
+		with self.lock:
+			counters = self.counters(*requestLabels(url, postvalues))
+			counters['retries'] = counters['retries'] + 1
+
+	def recordParse(self, dataset, page, parsetime, rows):
+
+		with self.lock:
+			counters = self.counters(dataset, page)
+			counters['parsetime'] = counters['parsetime'] + parsetime
+			counters['rows'] = counters['rows'] + rows
+
+	# Adds up the counters of every page into one set
+	# note: the lock must be held
+	def totals(self):
+
+		totals = {'requests':0, 'latencies':array.array('d'), 'bytes':0, 'transferred':0, 'cachehits':0, 'retries':0, 'parsetime':0.0, 'rows':0}
+
+		for counters in self.pages.values():
+			for name in totals:
+				totals[name] = totals[name] + counters[name]
+
+		return totals
+
+	# A line saying how the crawl has gone so far
+	def summary(self):
+
+		with self.lock:
+			totals = self.totals()
+
+		elapsed = max(time.time() - self.started, 0.001)
+		latencies = sorted(totals['latencies'])
+
+		return "[metrics] %s requests (%.2f/s) and %s pages from the cache in %.0fs; latency p50 %.2fs p95 %.2fs; %.1f MB (%.1f MB sent); %s retries; %s rows parsed in %.1fs" % (totals['requests'], totals['requests'] / elapsed, totals['cachehits'], elapsed, percentile(latencies, 50), percentile(latencies, 95), totals['bytes'] / 1048576.0, totals['transferred'] / 1048576.0, totals['retries'], totals['rows'], totals['parsetime'])
+
+	# Prints the summary every interval seconds, from a thread of its own, until stop is called
+	def startReporting(self, interval):
+
+		self.reporter = threading.Thread(target=self.report, args=(interval,))
+		self.reporter.daemon = True
+		self.reporter.start()
+
+	# note: only called from startReporting, in the reporting thread
+	def report(self, interval):
+
+		while(self.stopping.wait(interval) == False):
+			print self.summary()
+
+	def stop(self):
+
+		self.stopping.set()
+
+		if(self.reporter != None):
+			self.reporter.join()
+
+	# Writes the metrics out as JSON to path, and in Prometheus's text format to the same path
+	# with .prom added on the end
+	def write(self, path):
+
+		pages = []
+		prom = []
+
+		with self.lock:
+			elapsed = time.time() - self.started
+
+			for dataset, page in sorted(self.pages):
+				counters = self.pages[(dataset, page)]
+				latencies = sorted(counters['latencies'])
+				entry = {'dataset':dataset, 'page':page, 'requests':counters['requests'], 'cachehits':counters['cachehits'], 'retries':counters['retries'], 'bytes':counters['bytes'], 'transferredbytes':counters['transferred'], 'parseseconds':counters['parsetime'], 'rows':counters['rows'], 'latency':{}}
+
+				if(len(latencies) > 0):
+					entry['latency']['mean'] = sum(latencies) / len(latencies)
+					entry['latency']['max'] = latencies[-1]
+
+					for p in METRICS_PERCENTILES:
+						entry['latency']['p' + str(p)] = percentile(latencies, p)
+
+				pages.append(entry)
+
+		metricsfile = open(path, 'w')
+		json.dump({'started':self.started, 'elapsedseconds':elapsed, 'pages':pages}, metricsfile, indent=1, sort_keys=True)
+		metricsfile.close()
+
+		prom.append("# HELP chinadata_request_latency_seconds How long the requests for a page took.")
+		prom.append("# TYPE chinadata_request_latency_seconds summary")
+
+		for entry in pages:
+			labels = 'dataset="%s",page="%s"' % (entry['dataset'], entry['page'])
+
+			for p in METRICS_PERCENTILES:
+				if(('p' + str(p)) in entry['latency']):
+					prom.append('chinadata_request_latency_seconds{%s,quantile="%s"} %r' % (labels, p / 100.0, entry['latency']['p' + str(p)]))
+
+			if(entry['requests'] > 0):
+				prom.append('chinadata_request_latency_seconds_sum{%s} %r' % (labels, entry['latency']['mean'] * entry['requests']))
+
+			prom.append('chinadata_request_latency_seconds_count{%s} %s' % (labels, entry['requests']))
+
+		for name, key, description in [('response_bytes', 'bytes', 'Bytes of page output, from the server or the cache.'), ('transferred_bytes', 'transferredbytes', 'Bytes the server sent, before decompression.'), ('cache_hits', 'cachehits', 'Pages that came out of the cache.'), ('request_retries', 'retries', 'Requests that failed and were tried again.'), ('parse_seconds', 'parseseconds', 'Time spent parsing pages.'), ('rows', 'rows', 'Data rows parsed out of pages.')]:
+			prom.append("# HELP chinadata_%s_total %s" % (name, description))
+			prom.append("# TYPE chinadata_%s_total counter" % name)
+
+			for entry in pages:
+				prom.append('chinadata_%s_total{dataset="%s",page="%s"} %r' % (name, entry['dataset'], entry['page'], entry[key]))
+
+		promfile = open(path + ".prom", 'w')
+		promfile.write("\n".join(prom) + "\n")
+		promfile.close()
+
+# Works out which dataset and page code a request is for, for the metrics. The province lists of
+# the urban data are asked for in the same way as the prefecture data's, so they count as those
+def requestLabels(url, postvalues):
+
+	page = ""
+	dataset = "other"
+
+	if(isinstance(postvalues, dict)):
+		page = postvalues.get('code', "")
+
+	if(url.endswith(COUNTY_BASE_URL)):
+		dataset = COUNTY_DATASET
+	elif(url.endswith(NATIONAL_BASE_URL)):
+		dataset = NATIONAL_DATASET
+	elif(url.endswith(PROVINCE_BASE_URL)):
+		dataset = PROVINCE_DATASET
+	elif(url.endswith(URBAN_BASE_URL) and isinstance(postvalues, dict) and postvalues.get('sid') == '1'):
+		dataset = URBAN_DATASET
+	elif(url.endswith(PREFECTURE_BASE_URL)):
+		dataset = PREFECTURE_DATASET
+
+	return dataset, page
+
+# Gets the pth percentile of a sorted list of numbers (the nearest-rank one), or 0 for an empty list
+def percentile(values, p):
+
+	if(len(values) == 0):
+		return 0.0
+
+	return values[min(len(values) - 1, max(0, int(math.ceil(p / 100.0 * len(values))) - 1))]
+
+# How long to wait before the next try after failing failtimes times: exponential backoff with
+# jitter, but never less than the server asked for in a Retry-After header
+def backoffDelay(failtimes, retryafter):
+
+	delay = min(BACKOFF_MAX, BACKOFF_BASE * pow(2, failtimes - 1))
+	delay = random.uniform(delay / 2.0, delay)
+
+	if(retryafter != None):
+		delay = max(delay, retryafter)
+
+	return delay
+
+# Reads the Retry-After header (seconds, or an HTTP date) of an HTTP error, if it has one
+def getRetryAfter(error):
+
+	retryafter = None
+
+	if(getattr(error, 'hdrs', None) != None):
+		retryafter = error.hdrs.getheader('retry-after')
+
+	if(retryafter == None):
+		return None
+	elif(retryafter.strip().isdigit()):
+		return int(retryafter)
+
+	retrydate = email.utils.parsedate_tz(retryafter)
+
+	if(retrydate == None):
+		return None
+
+	return max(0, email.utils.mktime_tz(retrydate) - time.time())
+
+# Sends a request; the error-handling code will keep trying to hit the server unless we get an unrecoverable
+# error or hit the defined NUM_SERVER_TRIES. Pages are served from the cache when they can be;
+# cacheable should be False for requests like the login, whose answer we always need fresh
+def sendRequest(baseurl, postvalues, txheader, cacheable=True):
+	output = ""
+	notDone = True
+	# To comport with the standard definition of "times"
+	serverFailTimes = 1
+
+	if(cacheable == True and responseCache != None):
+		# offline, the cache is all there is, so a page is never too old to use
+		output = responseCache.get(baseurl, postvalues, crawlOptions['offline'])
+
+		if(output != None):
+			if(crawlMetrics != None):
+				crawlMetrics.recordCacheHit(baseurl, postvalues, len(output))
+
+			return output
+
+		if(crawlOptions['offline'] == True):
+			print "\nThe page %s %s is not in the cache, and we are running offline." % (baseurl, postvalues)
+			print "Exiting."
+			sys.exit()
+
+	# caps the number of requests open at once to this server
+	semaphore = hostSemaphore(baseurl)
+	
+	while(notDone):
+		try:
+			# waits our turn with the rate limiter, then sends the POST request through the session,
+			# waiting for a free slot if the host already has too many open, and gets the text
+			rateLimiter.acquire()
+			semaphore.acquire()
+			try:
+				started = time.time()
+				output, transferred = session.fetch(baseurl, postvalues, txheader)
+			finally:
+				semaphore.release()
+
+			rateLimiter.record(time.time() - started, False)
+
+			if(crawlMetrics != None):
+				crawlMetrics.recordRequest(baseurl, postvalues, time.time() - started, len(output), transferred)
+			
+			# We finished okay, so no need to loop
+			notDone = False
+			
+		# Need a bunch of error handling in case the system gives us trouble
+		except IOError, e:
+			print "\nThe server failed to respond for some reason."
+			
+			# We have failed too many times, and must exit
+			if(serverFailTimes == NUM_SERVER_TRIES):
+				print "\nThe server has failed to respond %s times." % NUM_SERVER_TRIES
+				print "This is past the limit specified in the code NUM_SERVER_TRIES"
+				print "Thus, we are exiting"
+				sys.exit()
+				
+			# This error is probably server busy	
+			elif hasattr(e, 'code'):
+				# Often, the server will just get a bit pissy and give a 500 error, but we can deal with this;
+				# a 5xx or a 429 means it is struggling, so everyone slows down, and if it told us how long to
+				# wait, nobody sends anything until then
+				# note that we loop after the wait time, as notDone still equals True
+				retryafter = getRetryAfter(e)
+				delay = backoffDelay(serverFailTimes, retryafter)
+
+				rateLimiter.record(None, e.code >= 500 or e.code == 429)
+
+				if(retryafter != None):
+					rateLimiter.pause(retryafter)
+
+				print "In particular, the server gave us an HTML error code - %s." % e.code
+				print "This is probably recoverable. Waiting %.1f seconds before trying again\n" % delay
+				
+				# Wait a bit for the server to get 'unstuck', and note the failure
+				time.sleep(delay)
+				serverFailTimes = serverFailTimes + 1
+
+				if(crawlMetrics != None):
+					crawlMetrics.recordRetry(baseurl, postvalues)
+				
+			# These other types of errors may not be recoverable, so we have to exit
+			elif hasattr(e, 'reason'):
+				print "In particular, the error has the following 'reason' attribute :"
+				print e.reason
+				print "This usually means the server doesn't exist,"
+				print "is down, or we don't have an internet connection."
+				print "Since this error could mean many things (some of which are unrecoverable), the program is exiting now."
+				sys.exit()
+			# Not sure what falls into this, but it is probably bad
+			else:
+				print "Encountered an unknown error. Exiting."
+				sys.exit()
+
+	if(cacheable == True and responseCache != None):
+		responseCache.put(baseurl, postvalues, output)
+
+	if(responseArchive != None):
+		responseArchive.put(baseurl, postvalues, output)
+		
+	return output
+
+# Returns the semaphore limiting the number of in-flight requests to the host in url;
+# all threads share one semaphore per host, sized by the --max-inflight option
+def hostSemaphore(url):
+
+	host = urlparse.urlparse(url)[1]
+
+	with hostSemaphoresLock:
+		if(host not in hostSemaphores):
+			hostSemaphores[host] = threading.BoundedSemaphore(crawlOptions['maxinflight'])
+
+		return hostSemaphores[host]
+
+# Fetches every page described by the POST values in valuelist and yields the outputs in
+# the same order as valuelist. With more than one worker, a pool of threads pulls jobs off a
+# bounded queue; the window semaphore stops the workers from running too far ahead of the
+# caller, so at most a few pages per worker are ever held in memory
+def fetchPages(url, valuelist, workers):
+
+	if(workers <= 1):
+		for values in valuelist:
+			if(crawlStopping.is_set()):
+				sys.exit()
+
+			yield sendRequest(url, values, TX_HEADERS)
+		return
+
+	jobs = Queue.Queue(workers)
+	window = threading.Semaphore(workers * FETCH_WINDOW_FACTOR)
+	finished = threading.Condition()
+	results = {}
+	threads = []
+
+	threads.append(threading.Thread(target=feedFetchJobs, args=(jobs, window, valuelist, workers)))
+
+	for i in range(workers):
+		threads.append(threading.Thread(target=fetchWorker, args=(jobs, url, results, finished)))
+
+	# daemon threads, so that an exit in the main thread is not held up by idle workers
+	for thread in threads:
+		thread.daemon = True
+		thread.start()
+
+	for i in range(len(valuelist)):
+		with finished:
+			while(i not in results):
+				finished.wait(1)
+
+			output, error = results.pop(i)
+
+		window.release()
+
+		# passes on the failure (including the sys.exit from sendRequest) to the main thread
+		if(error != None):
+			raise error[0], error[1], error[2]
+
+		if(crawlStopping.is_set()):
+			sys.exit()
+
+		yield output
+
+# Puts the jobs for fetchPages onto the work queue, followed by one stop marker per worker
+# note: only called from fetchPages
+def feedFetchJobs(jobs, window, valuelist, workers):
+
+	for i, values in enumerate(valuelist):
+		window.acquire()
+		jobs.put((i, values))
+
+	for i in range(workers):
+		jobs.put(None)
+
+# The worker thread for fetchPages; stores each output (or the error it raised) in results
+# note: only called from fetchPages
+def fetchWorker(jobs, url, results, finished):
+
+	while(True):
+		job = jobs.get()
+
+		if(job == None):
+			return
+
+		output, error = "", None
+
+		try:
+			output = sendRequest(url, job[1], TX_HEADERS)
+		except BaseException:
+			error = sys.exc_info()
+
+		with finished:
+			results[job[0]] = (output, error)
+			finished.notifyAll()
+
+# Sets up the cookie jar (with the cookies saved by the last run), the session that shares it,
+# the rate limiter and the crawl's metrics; everything that is needed before a request is sent
+def openSession(maxrate):
+	global cj, session, rateLimiter, crawlMetrics
+
+	## COOKIE INITIALIZATION
+	# initializes cookiejar and the session that shares it
+	cj = cookielib.LWPCookieJar()
+
+	# loads old cookies
+	if os.path.isfile(COOKIEFILE):
+		# if we have a cookie file already saved
+		# then load the cookies into the Cookie Jar
+		cj.load(COOKIEFILE)
+
+	# all requests go through this session, using the cookiejar
+	session = Session(cj, TX_HEADERS)
+
+	# every request waits its turn with this, however many workers there are
+	rateLimiter = RateLimiter(maxrate)
+
+	# counts what the crawl does
+	crawlMetrics = CrawlMetrics()
+
+# Logs in to the site, exiting if it won't have us, and then gives the server a moment
+def logIn(verbose):
+
+	if(verbose==True):
+		print "Logging in..."
+
+	output = sendRequest(settings.LOGIN_URL, '', TX_HEADERS, False)
+
+	# Checking to see if the login worked
+	if re.search(LOGIN_FAIL, output):
+		print "Login failed!\nMake sure you are a licensed user or connected to your university's network\n"
+		sys.exit()
+	elif(verbose==True):
+		print "Login successful!"
+
+	# This is necessary because sometimes the server doesn't seem to like quickly repeated connection attempts
+	if(verbose==True):
+		print "Waiting for server to free up connection (this will take %s seconds)\n" % settings.WAIT_TIME
+	time.sleep(settings.WAIT_TIME)
+
+# Saves the cookies for the next run and closes the session's connections
+def closeSession(verbose):
+
+	if cj is None:
+		print "Number of cookies stored is 0; cleanup probably successful?"
+	else:
+		if(verbose==True):
+			print "Cleanup of login successful. Number of cookies stored: %s\n" % len(cj)
+
+		# save the cookies again
+		cj.save(COOKIEFILE)
+
+	session.close()
@@ -0,0 +1,361 @@
+# file: chinadata/parse.py
+#
+# purpose: reading pages: the data rows, headers and dropdown menus out of the site's HTML,
+# where each page's columns go in a dataset's headers, and the pool of parser processes.
+# BeautifulSoup is only imported once the first page is parsed
+#
+# created by: Andrew MacDonald on 11/24/08, as part of chinesedata.py; split out on 10/18/26.
+#
+# copyright: (c) 2008, 2009, 2010, 2013 Andrew MacDonald. All rights reserved.
+# email: andrewm@stanfordalumni.org
+
+import collections
+import json
+import os.path
+import signal
+import sys
+import time
+
+from chinadata.settings import *
+
+####
+#### GLOBAL VARIABLES
+####
+
+# the parser picked out of PARSER_BACKENDS; see pickParserBackend
+parserBackend = None
+
+# the pool of processes that parse pages when --parsers is given; see parsePages
+parserPool = None
+
+# where each page's columns go in the dataset's headers, by dataset; see pageLayout
+pageLayouts = {}
+
+# BeautifulSoup and the one error of its we catch, imported by loadBeautifulSoup the first time a
+# page is parsed; it and its parser backends take longer to import than everything else put together
+BeautifulSoup = None
+FeatureNotFound = None
+
+# the only parts of a page we ever read are the data table and the dropdown menus,
+# so the rest of the page is never built into the tree; made by loadBeautifulSoup
+PAGE_STRAINER = None
+
+####
+#### FUNCTIONS
+####
+
+# Parses the outputs coming out of fetchPages and yields them as ParsedPages, in the same order.
+# With --parsers, the pages are handed to a pool of processes to parse while the next ones are
+# fetched; as outputs are only taken from fetchPages while fewer than PARSE_WINDOW_FACTOR pages
+# per process are waiting, a slow parser holds up the fetching rather than piling pages up
+def parsePages(outputs):
+
+	if(parserPool == None):
+		for output in outputs:
+			yield ParsedPage(output)
+		return
+
+	pending = collections.deque()
+
+	for output in outputs:
+		pending.append(parserPool.apply_async(parsePageInProcess, (output,)))
+
+		if(len(pending) >= crawlOptions['parsers'] * PARSE_WINDOW_FACTOR):
+			yield pending.popleft().get(PARSE_TIMEOUT)
+
+	while(len(pending) > 0):
+		yield pending.popleft().get(PARSE_TIMEOUT)
+
+# Parses everything we might want out of a page and sends it back without its soup, which
+# can't be pickled; the rows and dropdowns are made plain unicode strings for the same reason
+# note: runs in the parser processes, from parsePages
+def parsePageInProcess(output):
+
+	page = ParsedPage(output)
+
+	if(page.soup.find('table', id="texttable1") != None):
+		parseHeaders(page)
+
+		for row in parseRows(page)[0]:
+			row[0] = unicode(row[0])
+
+	for i in range(len(page.soup.findAll('select'))):
+		page.dropdowns[i] = [(unicode(value), unicode(name)) for value, name in parseDropdown(page, i)]
+
+	page.soup = None
+
+	return page
+
+# Keeps the parser processes from being stopped by Ctrl-C, which is left to the main process
+# note: runs in the parser processes, when the pool starts them
+def initParserProcess():
+	signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+# A page of output, parsed once. The data rows and dropdown menus are read out of it by
+# parseRows and parseDropdown the first time they are asked for and kept, so however many
+# times a page is looked at, its HTML is only parsed the once
+class ParsedPage(object):
+
+	def __init__(self, output):
+		self.soup = None
+		self.rows = None
+		self.numcolumns = 0
+		self.headers = None
+		self.headerwidth = 0
+		self.dropdowns = {}
+
+		# seconds spent parsing the page so far, for the metrics
+		self.parsetime = 0.0
+
+		# a page with no output is filled in by whoever made it; see splitPage
+		if(output != None):
+			started = time.time()
+			backend = pickParserBackend()
+			self.soup = BeautifulSoup(output, backend, parse_only=PAGE_STRAINER)
+			self.parsetime = time.time() - started
+
+# Makes a ParsedPage out of rows and a subunit dropdown that were read off another page
+def splitPage(rows, numcolumns, headers, subunits):
+
+	page = ParsedPage(None)
+	page.rows = rows
+	page.numcolumns = numcolumns
+	page.headers = headers
+	page.dropdowns[SUBUNIT_DD] = subunits
+
+	return page
+
+# Imports BeautifulSoup, the first time a page is parsed
+def loadBeautifulSoup():
+	global BeautifulSoup, FeatureNotFound, PAGE_STRAINER
+
+	if(BeautifulSoup == None):
+		import bs4
+
+		PAGE_STRAINER = bs4.SoupStrainer(['table', 'select'])
+		FeatureNotFound = bs4.FeatureNotFound
+
+		# set last, as the other threads take it being set to mean all three are
+		BeautifulSoup = bs4.BeautifulSoup
+
+# Picks the fastest installed parser out of PARSER_BACKENDS, the first time it is needed,
+# loading BeautifulSoup along with it
+def pickParserBackend():
+	global parserBackend
+
+	loadBeautifulSoup()
+
+	if(parserBackend == None):
+		for backend in PARSER_BACKENDS:
+			try:
+				BeautifulSoup("", backend)
+			except FeatureNotFound:
+				continue
+
+			parserBackend = backend
+			break
+
+	return parserBackend
+
+# Gets the data rows of a ParsedPage and the number of columns in them
+def parseRows(page):
+
+	rows = []
+	numcolumns = 0
+	numcolumnsdone = False
+
+	# the page has already been through here
+	if(page.rows != None):
+		return page.rows, page.numcolumns
+
+	soup = page.soup
+	started = time.time()
+	
+	for row in soup.findAll('table', id="texttable1")[0].findAll('tr'):
+
+		rowParent = row.parent
+
+		# Skipping the headers
+		if rowParent.name == 'thead':
+			pass
+		# Nn case the header is malformed, need to check to see if we are still in header 
+		elif rowParent.parent.name == 'thead':
+			pass
+		# Skipping the tails
+		elif row.td['class'][0] == u'tdtail':
+			pass
+			#print "found tail"
+			
+			#print "row contents: " + str(row.contents)
+		
+			#data = row.findAll('td')
+		
+			#print "data contents: " + str(data)
+		
+			#for contents in enumerate(row.contents):
+			#for contents in data:
+			#	print("numcolumns in tail: " + str(numcolumns))
+			#	numcolumns = numcolumns + 1
+
+		else:
+			datarow = []
+						
+			# Iterating through the data in the row entry
+			for i, contents in enumerate(row.contents):
+
+				# Have to record the number of columns for later use on the first data row
+				if(numcolumnsdone == False):
+					numcolumns = numcolumns + 1
+			
+				# Checking for missing values
+				if(contents.string.isspace()):
+					datarow.append(MISSING_VALUE)
+				# Adds the name; no need to strip commas from the name
+				elif(i == 0):
+					datarow.append(contents.string)
+				# Appends the data to our county array
+				else:
+					# Strip out the superfluous commas
+					datum = contents.string.replace(",", "")
+					datarow.append(datum)
+			
+			rows.append(datarow)
+			numcolumnsdone = True
+
+	page.rows = rows
+	page.numcolumns = numcolumns
+	page.parsetime = page.parsetime + time.time() - started
+	
+	return rows, numcolumns
+
+# This takes in a specific year's results (as a ParsedPage) to discover the list of provinces that year
+def parseDropdown(page, dropdown):
+	soup = page.soup
+	dropdownlist = []
+
+	# the page has already been through here
+	if(dropdown in page.dropdowns):
+		return page.dropdowns[dropdown]
+
+	for row in soup.findAll('select')[dropdown].findAll('option'):
+		
+		if row['value'] == '':
+			# skips the 'all' option
+			pass
+		else:
+			# Adds to the list the unit and the row
+			dropdownlist.append((row['value'], row.string))
+
+	page.dropdowns[dropdown] = dropdownlist
+
+	return dropdownlist
+
+# Gets the text of the cells in the data table's header rows, left to right and top to bottom;
+# also notes the page's number of columns by its header, as headerwidth
+def parseHeaders(page):
+
+	headers = []
+
+	# the page has already been through here
+	if(page.headers != None):
+		return page.headers
+
+	for thead in page.soup.findAll('table', id="texttable1")[0].findAll('thead'):
+		for cell in thead.findAll(['td', 'th']):
+			headers.append(cell.get_text().strip())
+
+		# the last row of the header has a cell for each column; any rows above it only group the
+		# columns under wider titles
+		rows = thead.findAll('tr')
+
+		if(rows != []):
+			page.headerwidth = len(rows[-1].findAll(['td', 'th'], recursive=False))
+
+	page.headers = headers
+
+	return headers
+
+# Gets a dataset's page layout: for each page code, the index in the dataset's headers of the
+# page's first data column, the number of data columns it has and the page's own header cells.
+# The layout is worked out by placePage from the pages as they are first seen and kept in a
+# <dataset>.layout file, so that after the first run any page can be placed on its own
+def pageLayout(dataset):
+
+	if(dataset in pageLayouts):
+		return pageLayouts[dataset]
+
+	layout = {}
+
+	if(os.path.isfile(dataset + LAYOUT_FILE_SUFFIX)):
+		layoutfile = open(dataset + LAYOUT_FILE_SUFFIX, 'r')
+		layout = json.load(layoutfile)
+		layoutfile.close()
+
+	# drops any pages the dataset no longer has
+	for pagecode in layout.keys():
+		if(pagecode not in getPages(dataset)):
+			del layout[pagecode]
+
+	pageLayouts[dataset] = layout
+
+	return layout
+
+# Writes a dataset's page layout out to its .layout file
+def saveLayout(dataset):
+
+	layoutfile = open(dataset + LAYOUT_FILE_SUFFIX + ".tmp", 'w')
+	json.dump(pageLayouts[dataset], layoutfile, indent=1, sort_keys=True)
+	layoutfile.close()
+
+	os.rename(dataset + LAYOUT_FILE_SUFFIX + ".tmp", dataset + LAYOUT_FILE_SUFFIX)
+
+# Finds where a page's data columns go in its dataset's headers, and returns the index of the
+# first one and how many there are. A page that is already in the layout is checked against it:
+# if its header cells or its number of columns have changed, the site has moved things around and
+# the layout can't be trusted. A page that isn't in the layout yet goes right after the page
+# before it, so the first time through a dataset, its pages have to be placed in order
+def placePage(dataset, pagecode, page):
+
+	layout = pageLayout(dataset)
+	pages = getPages(dataset)
+	rows, numcolumns = parseRows(page)
+	headers = parseHeaders(page)
+
+	if(pagecode not in layout):
+		# the first page starts after the header variables, and for the subunit datasets the
+		# subunit's name and ID as well
+		if(pages.index(pagecode) == 0):
+			offset = getNumHeaderVariables(dataset)
+
+			if(dataset in (COUNTY_DATASET, URBAN_DATASET, PREFECTURE_DATASET)):
+				offset = offset + 2
+		elif(pages[pages.index(pagecode)-1] in layout):
+			previous = layout[pages[pages.index(pagecode)-1]]
+			offset = previous['offset'] + previous['width']
+		else:
+			print "Page %s of the %s data can't be placed before the page ahead of it has been seen." % (pagecode, dataset)
+			print "Exiting now"
+			sys.exit()
+
+		# a page with no data rows has no first row to count the columns of, but the last row of its
+		# header has a cell for each of them, the name of the unit included
+		if(numcolumns == 0):
+			numcolumns = page.headerwidth
+
+		# we have to reduce by 1 because the name of the unit doesn't count as a column
+		if(numcolumns - 1 < 1 or offset + numcolumns - 1 > len(getHeaders(dataset))):
+			print "Page %s of the %s data has %s columns, which don't fit in the dataset's headers." % (pagecode, dataset, numcolumns)
+			print "Exiting now"
+			sys.exit()
+
+		layout[pagecode] = {'offset':offset, 'width':numcolumns - 1, 'headers':headers}
+		saveLayout(dataset)
+
+	# a page with no data rows has nothing to check its number of columns against
+	elif(layout[pagecode]['headers'] != headers or (rows != [] and layout[pagecode]['width'] != numcolumns - 1)):
+		print "Page %s of the %s data no longer matches %s." % (pagecode, dataset, dataset + LAYOUT_FILE_SUFFIX)
+		print "The site may have changed its pages; delete the file to have the layout worked out again."
+		print "Exiting now"
+		sys.exit()
+
+	return layout[pagecode]['offset'], layout[pagecode]['width']
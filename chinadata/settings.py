@@ -0,0 +1,348 @@
+# file: chinadata/settings.py
+#
+# purpose: the site's datasets (their page codes, headers and urls), the years each one covers,
+# and the crawl's tuning constants and defaults, shared by the rest of the package. Only
+# needs the standard library, so that reading it (for --help, say) costs next to nothing
+#
+# created by: Andrew MacDonald on 11/24/08, as part of chinesedata.py; split out on 10/18/26.
+#
+# copyright: (c) 2008, 2009, 2010, 2013 Andrew MacDonald. All rights reserved.
+# email: andrewm@stanfordalumni.org
+
+import re
+import sys
+
+####
+#### GLOBAL VARIABLES
+####
+
+##
+## INTERNET VARIABLES
+##
+
+# the file the session's cookies are kept in between runs
+COOKIEFILE = 'cookies.lwp'
+
+# httplib's debug level for the session's connections; 1 dumps every header to stdout
+HTTP_DEBUG_LEVEL = 0
+
+# seconds to wait on a silent connection before treating it as failed
+REQUEST_TIMEOUT = 120
+
+# how many redirects we follow for one request before giving up
+MAX_REDIRECTS = 5
+
+# when the cache grows past its maximum size, old pages are evicted until it is this fraction of the maximum
+CACHE_EVICT_TO = 0.9
+
+# an archive's index is kept next to it, in a file of the same name with this suffix
+ARCHIVE_INDEX_SUFFIX = ".idx"
+
+# how hard each page in the archive is compressed; 1 is fastest, 9 is smallest
+ARCHIVE_COMPRESSION = 6
+
+# the compression we ask the server to use on its responses; Session undoes it
+ACCEPT_ENCODING = 'gzip, deflate'
+
+# url to start the session; LOGIN_URL and BASE_URL are changed by --base-url, so they are
+# always read as settings.LOGIN_URL and settings.BASE_URL rather than imported
+LOGIN_URL = 'http://chinadataonline.org'
+
+# The string we get when login doesn't work - we are merely guests, not our university name
+# note the double backslash because python gives a special meaning to \s; to make python
+# understand we mean the regular expression \s, you have to preface it with an extra \
+# 
+LOGIN_FAIL = 'Welcome\\s*<font color="yellow">Guest</font>'
+
+# base url to get county data
+BASE_URL = 'http://chinadataonline.org/member/'
+
+# fake a user agent, the website may not like automated exploration
+TX_HEADERS =  {'User-agent' : 'Mozilla/5.0 (Macintosh; U; Intel Mac OS X 10.5; en-US; rv:1.9.0.4) Gecko/2008102920 Firefox/3.0.4'}
+
+# amount of time to wait after logging in, so as not to overload the server
+WAIT_TIME = 30
+
+# number of times we try a server after failure before giving up
+NUM_SERVER_TRIES = 6
+
+# after a failure we back off exponentially: BACKOFF_BASE seconds, then twice that, and so on,
+# up to BACKOFF_MAX, with random jitter so that concurrent workers don't all retry at once
+BACKOFF_BASE = 2
+BACKOFF_MAX = 120
+
+# the rate limiter's starting, lowest and (by default) highest rates, in requests per second
+RATE_START = 2.0
+RATE_MIN = 0.1
+DEFAULT_MAX_RATE = 10.0
+
+# how many requests may go out back-to-back once the limiter has saved up tokens
+RATE_BURST = 2
+
+# after each quick success the rate is multiplied by RATE_SLOW_START until the server first pushes
+# back, and goes up by RATE_INCREASE after that. It is cut by RATE_DECREASE after a server error or
+# when responses get slower than LATENCY_TARGET seconds (on average), at most once every
+# RATE_ADJUST_INTERVAL seconds, so a burst of errors only counts once
+RATE_SLOW_START = 1.1
+RATE_INCREASE = 0.1
+RATE_DECREASE = 0.5
+LATENCY_TARGET = 5.0
+RATE_ADJUST_INTERVAL = 2.0
+
+# how much weight the latest response time gets in the running average of response times
+LATENCY_SMOOTHING = 0.2
+
+# seconds between the summary lines CrawlMetrics prints during a verbose crawl
+METRICS_INTERVAL = 60
+
+# the latency percentiles reported in the metrics files
+METRICS_PERCENTILES = [50, 90, 95, 99]
+
+# how many pages each fetch worker may run ahead of the page currently being parsed
+FETCH_WINDOW_FACTOR = 4
+
+# this specifies the ordering on the page of the dropdown menus
+PROVINCE_DD = 0
+SUBUNIT_DD = 1
+
+##
+## PARSING VARIABLES
+##
+
+# the parsers BeautifulSoup may use, fastest first; the first one that is installed gets used
+PARSER_BACKENDS = ['lxml', 'html.parser']
+
+# how many pages each parser process may have waiting on it before we stop taking in more
+PARSE_WINDOW_FACTOR = 2
+
+# seconds to wait on a parser process for one page; waiting on a pool with no time limit
+# can't be interrupted with Ctrl-C
+PARSE_TIMEOUT = 600
+
+# the file a dataset's page layout is kept in between runs is the dataset's name plus this
+LAYOUT_FILE_SUFFIX = ".layout"
+
+# the file dropdownRegistry is kept in between runs
+DROPDOWN_FILE = 'dropdowns.json'
+
+##
+## DATA VARIABLES
+##
+
+# missing value code for our data
+MISSING_VALUE = "NA"
+
+# what a number on the site looks like, once its commas are stripped out
+NUMBER_FORMAT = re.compile(r"^-?[0-9]+(\.[0-9]+)?$")
+
+##
+## DATASET VARIABLES
+##
+
+#
+# COUNTY VARIABLES
+#
+
+COUNTY_DATASET = "county"
+
+# array of county page codes
+COUNTY_PAGES = ['A01', 'A02', 'A03', 'A04', 'A05', 'A06', 'A07', 'A08', 'A10', 'A11']
+# headers of the data columns
+COUNTY_HEADERS = ['Year', 'Province ID', 'Province', 'District', 'DistrictID', 'Number of Towns(unit)', 'Number of Villagers Committees(unit)', 'Area of Administrative Region(10000sq.km)', 'Total Agricultural Machinery Power(10000 kw)', 'Number of Local Telephone Subscribers(10000 subscribers)', 'Electricity Amount Used in Rural Area(100 million kwh)', 'Number of Households at Year-end(household)', 'Of which: Number of Households(household)', 'Population at the Year-end(10000 persons)', 'Of which: Rural Population(10000 persons)', 'Number of Employed Persons at Year-end(10000 persons)', 'Number of Rural Labors(10000 persons)', 'Of which: Farming, Forestry, Animal Husbandry and Fishery(10000 persons)', 'GDP(100 million yuan)', 'Value-added of Primary Industry(100 million yuan)', 'Value-added of Secondary Industry(100 million yuan)', 'Industrial Value-added(100 million yuan)', 'GDP Index(%)', 'Annual Per Capita Net Income of Rural Households(yuan)', 'Local Government Revenue(100 million yuan)', 'Local Government Expenditure(100 million yuan)', 'Outstanding Amount of Savings Deposits of Urban Households(100 million yuan)', 'Outstanding Loan of Financial Institutes at Year-end(100 million yuan)', 'Grain Output(10000 tons)', 'Cotton Output(10000 tons)', 'Oilbearing Output(10000 tons)', 'Meat Output(10000 tons)', 'Number of Industrial Enterprises above Designated Size(unit)', 'Output of Industrial Enterprises above Designated Size (at current)(100 million yuan)', 'Completed Investment in Capital Construction(100 million yuan)', 'Exports Value(1,000 US dollars)', 'Foreign Capital Actually Used in This Year(USD 10000)', 'Contractual Foreign Investment(USD 10000)', 'Student Enrollment in Regular Secondary Schools(10000 persons)', 'Student Enrollment in Primary Schools(10000 persons)', 'Number of Beds in Hospitals and Sanitation Agencies(10000 units)', 'Number of Social Welfare Nursing Centers(unit)', 'Number of Beds in Social Welfare Nursing Centers(unit)']
+# url specifying the county pages
+COUNTY_BASE_URL = 'county/countytshow.asp'
+# number of left-hand side array variables that will be spliced on a the end
+COUNTY_NUM_HEADER_VARIABLES = 3
+
+# the datasets whose pages can be fetched for all provinces at once and split back up afterwards;
+# the urban and prefecture pages start each province with its totals, which the all-province view
+# doesn't give us
+BATCH_DATASETS = [COUNTY_DATASET]
+
+#
+# NATIONAL VARIABLES
+#
+
+NATIONAL_DATASET = "national"
+
+# array of national page codes
+NATIONAL_PAGES = ['A0101', 'A0102', 'A0103', 'A0104', 'A0201', 'A0202', 'A0301', 'A0302', 'A0401', 'A0402', 'A0501', 'A0502', 'A0503', 'A0504', 'A0601', 'A0603', 'A0604', 'A0607', 'A0608', 'A0609', 'A0610', 'A0611', 'A0612', 'A0613', 'A0616', 'A0617', 'A0619', 'A0701', 'A0801', 'A0802', 'A0803', 'A0804', 'A0805', 'A0901', 'A0902', 'A0903', 'A0904', 'A1001', 'A1002', 'A1101', 'A1102', 'A1103', 'A1104', 'A1105', 'A1106', 'A1107', 'A1108', 'A1109', 'A1110', 'A1111', 'A1112', 'A1113', 'A1201', 'A1202', 'A1301', 'A1302', 'A1303', 'A1304', 'A1305', 'A1306', 'A1307', 'A1308', 'A1309', 'A1401', 'A1402', 'A1403', 'A1404', 'A1405', 'A1406', 'A1408', 'A1410', 'A1412', 'A1414', 'A1416', 'A1418', 'A1419', 'A1420', 'A1421', 'A1422', 'A1423', 'A1424', 'A1501', 'A1502', 'A1503', 'A1504', 'A1601']
+NATIONAL_HEADERS = ['Year', 'Gross National Product(100 million yuan)', 'Gross Domestic Product(100 million yuan)', 'Gross Domestic Product - Primary Industry(100 million yuan)', 'Gross Domestic Product - Secondary Industry(100 million yuan)', 'Gross Domestic Product - Secondary Industry - Industry(100 million yuan)', 'Gross Domestic Product - Secondary Industry - Construction(100 million yuan)', 'Gross Domestic Product - Tertiary Industry(100 million yuan)', 'Gross Domestic Product - Tertiary Industry - Transportation Post and Telecommunications(100 million yuan)', 'Gross Domestic Product - Tertiary Industry - Wholesale Retail and Catering(100 million yuan)', 'Per Capita GDP(yuan person)', 'Gross National Product(%)', 'Gross Domestic Product(%)', 'Gross Domestic Product - Primary Industry(%)', 'Gross Domestic Product - Secondary Industry(%)', 'Gross Domestic Product - Secondary Industry - Industry(%)', 'Gross Domestic Product - Secondary Industry - Construction(%)', 'Gross Domestic Product - Tertiary Industry(%)', 'Gross Domestic Product - Tertiary Industry - Transportation Post and Telecommunications(%)', 'Gross Domestic Product - Tertiary Industry - Wholesale Retail and Trade(%)', 'Per Capita GDP(%)', 'Gross National Product(growth)', 'Gross Domestic Product(growth)', 'Gross Domestic Product - Primary Industry(growth)', 'Gross Domestic Product - Secondary Industry(growth)', 'Gross Domestic Product - Secondary Industry - Industry(growth)', 'Gross Domestic Product - Secondary Industry - Construction(growth)', 'Gross Domestic Product - Tertiary Industry(growth)', 'Gross Domestic Product - Tertiary Industry - Transportation Post and Telecommunications(growth)', 'Gross Domestic Product - Tertiary Industry - Wholesale Retail and Trade(growth)', 'Per Capita GDP(growth)', 'Gross Domestic Product by Expenditure Approach(100 million yuan)', 'Gross Domestic Product by Expenditure Approach - Final Consumption Expenditure(100 million yuan)', 'Gross Domestic Product by Expenditure Approach - Final Consumption Expenditure - Household(100 million yuan)', 'Gross Domestic Product by Expenditure Approach - Final Consumption Expenditure - Government(100 million yuan)', 'Gross Domestic Product by Expenditure Approach - Gross Capital Formation(100 million yuan)', 'Gross Domestic Product by Expenditure Approach - Gross Capital Formation - Fixed Capital(100 million yuan)', 'Gross Domestic Product by Expenditure Approach - Gross Capital Formation - Changes in Inventories(100 million yuan)', 'Gross Domestic Product by Expenditure Approach - Net Exports of Goods and Services(100 million yuan)', 'Total Permanent Population(year-end)(10000 persons)', 'Total Permanent Population - Male(year-end)(10000 persons)', 'Total Permanent Population - Female(year-end)(10000 persons)', 'Total Permanent Population - Urban Areas(year-end)(10000 persons)', 'Total Permanent Population - Rural Areas(year-end)(10000 persons)', 'Total Household registed Population(year-end)(10000 persons)', 'Total Household registed Population - Male(year-end)(10000 persons)', 'Total Household registed Population - Female(year-end)(10000 persons)', 'Total Household registed Population - Agriculture(year-end)(10000 persons)', 'Total Household registed Population - non-Agriculture(year-end)(10000 persons)', 'Birth Rate(e)', 'Death Rate(e)', 'Natural Growth Rate(e)', 'Total Number of Employed Persons(10000 persons)', 'Total Number of Employed Persons - Urban(10000 persons)', 'Total Number of Employed Persons - Rural(10000 persons)', 'Total Number of Employed Persons - Primary Industry(10000 persons)', 'Total Number of Employed Persons - Secondary Industry(10000 persons)', 'Total Number of Employed Persons - Tertiary Industry(10000 persons)', 'Staff and Workers(10000 persons)', 'Staff and Workers - State Owned(10000 persons)', 'Staff and Workers - Urban Collective Owned Units(10000 persons)', 'Staff and Workers - Other Ownership Units(10000 persons)', 'Total Investmentin Fixed Assets(100 million yuan)', 'Total Investmentin Fixed Assets - State Owned Units(100 million yuan)', 'Total Investmentin Fixed Assets - Collective Owned Units(100 million yuan)', 'Total Investmentin Fixed Assets - Individuals(100 million yuan)', 'Floor Space of Buildings - Under Construction(10000 sq.m)', 'Floor Space of Buildings - Completed(10000 sq.m)', 'Floor Space of Commercial House Actually Sold(10000 sq.m)', 'Floor Spaceof Commercial House Actually Sold - Residential Buildings(10000 sq.m)', 'Commercial House Purchased by Individuals(10000 sq.m)', 'Total Sales of Commercial House(100 million yuan)', ' General Retail Price Index(1978=100)(%)', 'General Consumer Price Index(1985=100)(%)', 'Consumer Price Index Urban Area(1985=100)(%)', 'Consumer Price Index - Rural Area(1985=100)(%)', 'Ex-factory Price Indices of Industrial Products(1985=100)(%)', 'Purchasing Price Indices of Raw Material,Fuel and Power (1990=100)(%)', 'General Retail Price Index(%)', 'General Consumer Price Index(%)', 'Consumer Price Index - Urban Area(%)', 'Consumer Price Index - Rural Area(%)', 'Purchasing Price Indices of Raw Material Fuel and Power(%)', 'Investment in Fixed Assets Price Index(%)', 'Urban Households - Per Capita Annual Disposable Income(yuan)', 'Urban Households - Per Capital Annual Disposable Income Index(%)', 'Urban Households - Living Expenditure(yuan)', 'Urban Households - Living Expenditure - Food(yuan)', 'Rural Households - Net Income(yuan)', 'Rural Households - Net Income Index(%)', 'Rural Households - Living Expenditure(yuan)', 'Rural Households - Living Expenditure - Food(yuan)', 'Household Consumption - Value - All Households(yuan)', 'Household Consumption - Value - Rural Households(yuan)', 'Household Consumption - Value - Urban Households(yuan)', 'Household Consumption - Index - All Households(%)', 'Household Consumption - Index - Rural Households(%)', 'Household Consumption - Index - Urban Households(%)', 'Household Consumption - Index - All Households(%)', 'Household Consumption - Index - Rural Households(%)', 'Household Consumption - Index - Urban Households(%)', 'Urban - Per Capita Using Space(sq.m)', 'Urban - Per Capita Living Space(sq.m)', 'Per Capita Living Spacein Rural(sq.m)', 'Total Outstading Amount of Savings Deposit(100 million yuan)', 'Fixed Deposits(100 million yuan)', 'Current Deposits(100 million yuan)', 'Total Wages(100 million yuan)', 'Total Wages - State-owned Units(100 million yuan)', 'Total Wages - Urban Colletive-owned Units(100 million yuan)', 'Total Wages - Other Units(100 million yuan)', 'Total Wages - Index - Total(%)', 'Total Wages - Index - State-owned Units(%)', 'Total Wages - Index - Urban Colletive-owned Units(%)', 'Total Wages - Index - Other Units(%)', 'Total Revenue(100 million yuan)', 'Total Expenditures(100 million yuan)', 'Government Revenue Increase Rates(%)', 'Government Expenditure Increase Rates(%)', 'Total Tax Revenue(100 million yuan)', 'Value-added Tax(100 million yuan)', 'Business Tax(100 million yuan)', 'Consumption Tax(100 million yuan)', 'Tariffs(100 million yuan)', 'Agricultural and Related Tax(100 million yuan)', 'Expenditures for Capital Construction(100 million yuan)', 'Additional Appropriation for Circulating Capital of Enterprises(100 million yuan)', 'Innovation Fundsand Science and Technology Promotion Funds(100 million yuan)', 'GeologicalProspecting Expenses(100 million yuan)', 'Operating Expenses of Industrial Transportation and Commercial Departments(100 million yuan)', 'Expenditure for Supporting Agricultural Production and Agricultural Operating Expenses(100 million yuan)', 'Operating Expenses for Culture Education Science & Health Care(100 million yuan)', 'Pensions Social and Relief Funds(100 million yuan)', 'Expenditure for National Defense(100 million yuan)', 'Expenditure for Government Administration(100 million yuan)', 'Price Subsidies(100 million yuan)', 'Total Debt Payments(100 million yuan)', 'Expenditure on Scientific Research(100 million yuan)', 'Expenditure on Scientific Research - Expense on S&T Promotion(100 million yuan)', 'Expenditure on Scientific Research - Operating Expenses for Sciences(100 million yuan)', 'Expenditure on Scientific Research - Expenses for Capital Construction of S&T Institutes(100 million yuan)', 'Expenditure on Scientific Research - Other S&T Operating Expenses(100 million yuan)', 'Government Expenditure for Agriculture(100 million yuan)', 'Expenditure for Supporting Agricultural Production and Agricultural Operating Expenses(100 million yuan)', 'Government Expenditure for Agriculture - Expenditure for Capital Construction(100 million yuan)', 'Government Expenditure for Agriculture - Science & Technology Promotion Funds(100 million yuan)', 'Government Expenditure for Agriculture - Rural Relief Funds(100 million yuan)', 'Government Expenditure for Pensions and Social Welfare(100 million yuan)', 'Pension for Handicapped and Bereaved Families(100 million yuan)', 'Pension for Retirees(100 million yuan)', 'Social Welfare and Relief Funds(100 million yuan)', 'Expenses on Disaster Relief(100 million yuan)', 'Government Expenditure for Pensions and Social Welfare - Others(100 million yuan)', 'Government Revenue(100 million yuan)', 'Government Revenue - Central Government(100 million yuan)', 'Government Revenue - Local Government(100 million yuan)', 'Government Extra-Budgetary Revenue(100 million yuan)', 'Government Extra-Budgetary Revenue - Central Government(100 million yuan)', 'Government Extra-Budgetary Revenue - Local Government(100 million yuan)', 'Government Expenses(100 million yuan)', 'Government Expenses - Central Government(100 million yuan)', 'Government Expenses - Local Government(100 million yuan)', 'Government Extra-Budgetary Expenses(100 million yuan)', 'Government Extra-Budgetary Expenses - Central Government(100 million yuan)', 'Government Extra-Budgetary Expenses - Local Government(100 million yuan)', 'Credit Funds Balance Sheet of State Banks - Sources of Funds - All Sources(100 million yuan)', 'Credit Funds Balance Sheet of State Banks - Sources of Funds - Deposits(100 million yuan)', 'Credit Funds Balance Sheet of State Banks - Sources of Funds - Deposits - Deposits of Enterprises(100 million yuan)', 'Credit Funds Balance Sheet of State Banks - Sources of Funds - Deposits - Treasury Deposits(100 million yuan)', 'Credit Funds Balance Sheet of State Banks - Sources of Funds - Deposits - Deposits of Government Agencies and Organizations(100 million yuan)', 'Credit Funds Balance Sheet of State Banks - Sources of Funds - Deposits - Urban and Rural Savings Deposits(100 million yuan)', 'Credit Funds Balance Sheet of State Banks - Sources of Funds - Deposits - Agricultural Deposits(100 million yuan)', 'Credit Funds Balance Sheet of State Banks - Sources of Funds - Deposits - Other Deposits(100 million yuan)', 'Credit Funds Balance Sheet of State Banks - Sources of Funds - Bonds(100 million yuan)', 'Credit Funds Balance Sheet of State Banks - Sources of Funds - Liabilities to International Financial Institutions(100 million yuan)', 'Credit Funds Balance Sheet of State Banks - Sources of Funds - Currency in Circulation(100 million yuan)', 'Credit Funds Balance Sheet of State Banks - Sources of Funds - Others(100 million yuan)', 'Credit Funds Balance Sheet of State Banks - Uses of Funds - All Uses(100 million yuan)', 'Credit Funds Balance Sheet of State Banks - Uses of Funds - Loans(100 million yuan)', 'Credit Funds Balance Sheet of State Banks - Uses of Funds - Loans - Industrial Loans(100 million yuan)', 'Credit Funds Balance Sheet of State Banks - Uses of Funds - Loans - Commercial Loans(100 million yuan)', 'Credit Funds Balance Sheet of State Banks - Uses of Funds - Loans - Loans to Private & Urban Collective Enterprises(100 million yuan)', 'Credit Funds Balance Sheet of State Banks - Uses of Funds - Loans - Agricultural Loans(100 million yuan)', 'Credit Funds Balance Sheet of State Banks - Uses of Funds - Loans - Medium-term & Long-term Loans(100 million yuan)', 'Credit Funds Balance Sheet of State Banks - Uses of Funds - Loans - Loans to Sino-Foreign Joint Venture & Cooperative Enterprises(100 million yuan)', 'Credit Funds Balance Sheet of State Banks - Uses of Funds - Loans - Other Loans(100 million yuan)', 'Credit Funds Balance Sheet of State Banks - Uses of Funds - Securities and Investment(100 million yuan)', 'Credit Funds Balance Sheet of State Banks - Uses of Funds - Purchase of Gold & Silver(100 million yuan)', 'Credit Funds Balance Sheet of State Banks - Uses of Funds - Purchase of Foreign Exchanges(100 million yuan)', 'Credit Funds Balance Sheet of State Banks - Uses of Funds - Assets in International Financial Institutions(100 million yuan)', 'Cash Statistics of Financial Institutions - Cash Income(100 million yuan)', 'Cash Statistics of Financial Institutions - Cash Expenditures(100 million yuan)', 'Cash Statistics of Financial Institutions - Currency Issuance(100 million yuan)', 'Gold Reserve(10000 fine troy ounce)', 'Foreign Exchange Reserve(USD 100 million)', 'Balance of Payments - Current Account(USD 10000)', 'Balance of Payments - Current Account - Goods(USD 10000)', 'Balance of Payments - Current Account - Goods - Exports(USD 10000)', 'Balance of Payments - Current Account - Goods - Imports(USD 10000)', 'Balance of Payments - Service(USD 10000)', 'Balance of Payments - Service - Transportation(USD 10000)', 'Balance of Payments - Service - Tourism(USD 10000)', 'Balance of Payments - Service - Communication Service(USD 10000)', 'Balance of Payments - Service - Construction Service(USD 10000)', 'Balance of Payments - Service - Insurance Service(USD 10000)', 'Balance of Payments - Service - Financial Service(USD 10000)', 'Balance of Payments - Service - Computer and Information Service(USD 10000)', 'Balance of Payments - Service - Fee for Patent or Royalty(USD 10000)', 'Balance of Payments - Service - Consultation(USD 10000)', 'Balance of Payments - Service - Advertisement and Publicity(USD 10000)', 'Balance of Payments - Service - Movies and Audio-video Products(USD 10000)', 'Balance of Payments - Service - Other Comercial Service(USD 10000)', 'Balance of Payments - Service - Government Service not Elsewhere Classified(USD 10000)', 'Balance of Payments - Income and Profit(USD 10000)', 'Balance of Payments - Income and Profit - Compensation of Staff and Workers(USD 10000)', 'Balance of Payments - Income and Profit - Profit from Investment(USD 10000)', ' Balance of Payments - Current Transfer(USD 10000)', 'Balance of Payments - Current Transfer - Governments(USD 10000)', 'Balance of Payments - Current Transfer - Other Departments(USD 10000)', 'Balance of Payments - Capital and Finance Account(USD 10000)', 'Balance of Payments - Capital and Finance Account - Capital Account(USD 10000)', 'Balance of Payments - Capital and Finance Account - Financial Account(USD 10000)', 'Balance of Payments - Capital and Finance Account - Financial Account - Direct Investments(USD 10000)', 'Balance of Payments - Capital and Finance Account - Financial Account - Direct Investments - Chinese Direct Investments Abroad(USD 10000)', 'Balance of Payments - Capital and Finance Account - Financial Account - Direct Investments - Foreign Direct Investment in China(USD 10000)', 'Balance of Payments - Capital and Finance Account - Financial Account - Securities(USD 10000)', 'Balance of Payments - Capital and Finance Account - Financial Account - Securities - Assets(USD 10000)', 'Balance of Payments - Capital and Finance Account - Financial Account - Securities - Assets - Capital Securities(USD 10000)', 'Balance of Payments - Capital and Finance Account - Financial Account - Securities - Assets - Debt Securities(USD 10000)', 'Balance of Payments - Capital and Finance Account - Financial Account - Securities - Liabilities(USD 10000)', 'Balance of Payments - Capital and Finance Account - Financial Account - Securities - Liabilities - Capital Securities(USD 10000)', 'Balance of Payments - Capital and Finance Account - Financial Account - Securities - Liabilities - Debt Securities(USD 10000)', 'Balance of Payments - Capital and Finance Account - Financial Account - Other Investments(USD 10000)', 'Balance of Payments - Capital and Finance Account - Financial Account - Other Investments - Assets(USD 10000)', 'Balance of Payments - Capital and Finance Account - Financial Account - Other Investments - Assets - Trade Credit(USD 10000)', 'Balance of Payments - Capital and Finance Account - Financial Account - Other Investments - Assets - Loans(USD 10000)', 'Balance of Payments - Capital and Finance Account - Financial Account - Other Investments - Assets - Currencies and Deposits(USD 10000)', 'Balance of Payments - Capital and Finance Account - Financial Account - Other Investments - Assets - Other Assets(USD 10000)', 'Balance of Payments - Capital and Finance Account - Financial Account - Other Investments - Liabilities(USD 10000)', 'Balance of Payments - Capital and Finance Account - Financial Account - Other Investments - Liabilities - Trade Credit(USD 10000)', 'Balance of Payments - Capital and Finance Account - Financial Account - Other Investments - Liabilities - Loans(USD 10000)', 'Balance of Payments - Capital and Finance Account - Financial Account - Other Investments - Liabilities - Currencies and Deposits(USD 10000)', 'Balance of Payments - Capital and Finance Account - Financial Account - Other Investments - Liabilities - Other Liabilities(USD 10000)', 'Balance of Payments - Net Error and Omission(USD 10000)', 'Balance of Payments - Change in Reserve Assets(USD 10000)', 'Balance of Payments - Change in Reserve Assets - Gold Reserves(USD 10000)', 'Balance of Payments - Change in Reserve Assets - Foreign Exchange(USD 10000)', 'Balance of Payments - Change in Reserve Assets - SDR (Special Drawing Rights)(USD 10000)', 'Balance of Payments - Change in Reserve Assets - Chinas Reserve in IMF (International Monetary Fund)(USD 10000)', 'Production Capacity of Tap Water(10000tons-day)', 'Length of Water Supply Pipelines(km)', 'Total Annual Volume of Water Supply(100 million tons)', 'Total Annual Volume of Water Supply - For Residential Use(100 million tons)', 'Total Annual Volume of Water Supply - For Productive Use(100 million tons)', 'Per cpita Daily Consumption of Tap Water for Residential Use(ton)', 'Number of Public Transportation Vehicles(unit)', 'Number of Public Transportation Vehicles - Buses(unit)', 'Number of Public Transportation Vehicles - Trolley(unit)', 'Number of Public Transportation Vehicles - Subways(unit)', 'Number of Passengers Carried(10000 person-times)', 'Number of Taxis(unit)', 'Production Capacity of Coal Gas(10000tons-day)', 'Length of Gas Pipelines - CoalGas(km)', 'Length of Gas Pipelines - Natural Gas(km)', 'Total Gas Supply - Coal Gas(100 million cu.m)', 'Total Gas Supply - Liquefied Petroleum Gas(10000 tons)', 'Total Gas Supply - Natural Gas(100 million cu.m)', 'Roads - Length of Paved Roads(10000 km)', 'Roads - Area of Paved Roads(10000 sq.m)', 'Number of Bridges(unit)', 'Sewer Pipelines(10000 km)', 'Daily Disposal Capacity of Sewage(10000 sq.m)', 'Number of Street Lights(unit)', 'Gross Output Value of Farming Forestry Animal Husbandry and Fishery - Total(100 million yuan)', 'Gross Output Value of Farming Forestry Animal Husbandry and Fishery - Farming(100 million yuan)', 'Gross Output Value of Farming Forestry Animal Husbandry and Fishery - Forestry(100 million yuan)', 'Gross Output Value of Farming Forestry Animal Husbandry and Fishery - Animal Husbandry(100 million yuan)', 'Gross Output Value of Farming Forestry Animal Husbandry and Fishery - Fishery(100 million yuan)', 'Indices of Gross Output Value of Farming Forestry Animal Husbandry and Fishery - Total(%)', 'Indices of Gross Output Value of Farming Forestry Animal Husbandry and Fishery - Farming(%)', 'Indices of Gross Output Value of Farming Forestry Animal Husbandry and Fishery - Forestry(%)', 'Indices of Gross Output Value of Farming Forestry Animal Husbandry and Fishery - Animal Husbandry(%)', 'Indices of Gross Output Value of Farming Forestry Animal Husbandry and Fishery - Fishery(%)', 'Cultivated Area(1000 hectares)', 'Total Sown Area(1000 hectares)', 'Total Sown Area - Grain Crops(1000 hectares)', 'Total Power of Agricultural Machinery(10000 kw)', 'Irrigated Area(1000 hectares)', 'Consumption of Chemical Fertilizers(10000 tons)', 'Electricity Consumed in Rural Area(100 million kwh)', 'Grain(10000 tons)', 'Cotton Crops(10000 tons)', 'Oil-Bearing Crops(10000 tons)', 'Jute andAmbary Hemp(10000 tons)', 'Sugar(10000 tons)', 'Tea(10000 tons)', 'Fruits(10000 tons)', 'Large Animals(year-end)(10000 heads)', 'Hogs(year-end)(10000 heads)', 'Sheep and Goats(year-end)(10000 heads)', 'Output of Meat(10000 tons)', 'Output of Meat - Pork Beef and Mutton(10000 tons)', 'Total Aquatic Products(10000 tons)', 'Total Aquatic Products - Seawater Aquatic Products(10000 tons)', 'Total Aquatic Products - Freshwater Aquatic Products(10000 tons)', 'Natural Disasters of China - Areas Covered(1000 hectares)', 'Natural Disasters of China - Areas Affected(1000 hectares)', 'Natural Disasters of China - Flood - Areas Covered(1000 hectares)', 'Natural Disasters of China - Flood - Areas Affected(1000 hectares)', 'Natural Disasters of China - Drought - Areas Covered(1000 hectares)', 'Natural Disasters of China - Drought - Areas Affected(1000 hectares)', 'Number of Industrial Enterprises(unit)', 'Number of Industrial Enterprises(unit) - State-owned(unit)', 'Number of Industrial Enterprises(unit) - Collective-owned(unit)', 'Gross Industrial Output Value(100 million yuan)', 'Gross Industrial Output Value - State-owned(100 million yuan)', 'Gross Industrial Output Value - Collective-owned(100 million yuan)', 'Indices of Gross Industrial Output Value(1952=100)(%)', 'Indices of Gross Industrial Output Value(1952=100) - State-owned(%)', 'Indices of Gross Industrial Output Value(1952=100) - Collective-owned(%)', 'Indices of Gross Industrial Output Value(Preceding year=100)(%)', 'Indices of Gross Industrial Output Value(Preceding year=100) - State-owned(%)', 'Indices of Gross Industrial Output Value(Preceding year=100) - Collective-owned(%)', 'Value of Light Industry(100 million yuan)', 'Value of Heavy Industry(100 million yuan)', 'Indices of Light Industry(%)', 'Indicies of Heavy Industry(%)', 'Chemical Fiber(10000 tons)', 'Yarn(10000 tons)', 'Cloth(100 million m)', 'Woolen(10000 m)', 'Silk(tons)', 'Paper and Paperboards(10000 tons)', 'Sugar(10000 tons)', 'Salt(10000 tons)', 'Edible Vegetable Oil(10000 tons)', 'Beer(10000 kl(year:10000 tons))', 'Cigarettes(100 million unit)', 'Household Refrigerators(10000 sets)', 'Electric Fan(10000 sets)', 'Household Washing Machines(10000 sets)', 'Color TV Sets(10000 sets)', 'Cameras(10000 sets)', 'Coal(10000 tons)', 'Crude Oil(10000 tons)', 'Natural Gas(100000000 cu.m)', 'Electricity(100 million kwh)', 'Electricity - Hydro-power(100 million kwh)', 'Pig Iron(10000 tons)', 'Steel(10000 tons)', 'Steel Products(10000 tons)', 'Cement(10000 tons)', 'Plate Glass(10000 weight cases)', 'Sulfuric Acid(10000 tons)', 'Chemical Fertilizer(10000 tons)', 'Chemical Pesticide(10000 tons)', 'Metal- Cutting Machine Tools(10000 sets)', 'Motor Vehicles(10000 units)', 'Number of Construction Enterprises(unit)', 'Number of Construction Enterprises - State-owned(unit)', 'Number of Construction Enterprises - Urban Collective-owned(unit)', 'Number of Construction Enterprises - Rural Construction Teams(unit)', 'Number of Persons Engaged in Construction(10000 persons)', 'Number of Persons Engaged in Construction - State-owned(10000 persons)', 'Number of Persons Engaged in Construction - Urban Collective-owned(10000 persons)', 'Number of Persons Engaged in Construction - Rural Construction Teams(10000 persons)', 'Gross Output Value of Construction(100 million yuan)', 'Gross Output Value of Construction - State-owned(100 million yuan)', 'Gross Output Value of Construction - Urban Collective-owned(100 million yuan)', 'Gross Output Value of Construction - Rural Construction Teams(100 million yuan)', 'Floor Space Under Construction(10000 sq.m)', 'Floor Space Completed(10000 sq.m)', 'Length of Railways in Operation(10000 km)', 'National Electrical Railways(10000 km)', 'Length of Highways(10000 km)', 'Length of Navigable Inland Waterways(10000 km)', 'Length of Civil Avaition Routes(10000 km)', 'Length of Civil Avaition Routes - International(10000 km)', 'Length of Pipelines(10000 km)', 'Total Passenger Traffic(10000 persons)', 'Railways(10000 persons)', 'Railways - National Railways(10000 persons)', 'Railways - Local Railways(10000 persons)', 'Highways(10000 persons)', 'Waterways(10000 persons)', 'Civil Avaition(10000 persons)', 'Total Turnover Value of Passenger Traffic(100 million passenger-km)', 'Railways(100 million passenger-km)', 'Railways - National Railways(100 million passenger-km)', 'Railways - Local Railways(100 million passenger-km)', 'Highways(100 million passenger-km)', 'Waterways(100 million passenger-km)', 'Civil Avaition(100 million passenger-km)', 'Total Freight Traffic(10000 tons)', 'Railways(10000 tons)', 'Railways - National Railways(10000 tons)', 'Railways - Local Railways(10000 tons)', 'Highways(10000 tons)', 'Waterways(10000 tons)', 'Civil Aviation(10000 tons)', 'Petroleum and Gas(10000 tons)', 'Total Turnover Volume of Freight Traffic(100 million ton-km)', 'Railways(100 million ton-km)', 'Railways - National Railways(100 million ton-km)', 'Railways - Local Railways(100 million ton-km)', 'Highways(100 million ton-km)', 'Waterways(100 million ton-km)', 'Civil Aviation(100 million ton-km)', 'Petroleum and Gas(100 million ton-km)', 'Total Average Transport Distance of Passengers(km)', 'Railways(km)', 'Highways(km)', 'Waterways(km)', 'Civil Avaition(km)', 'Total Average Transport Distance of Freight(km)', 'Average Freight Distance - Railways(km)', 'Average Freight Distance - Highways(km)', 'Average Freight Distance - Waterways(km)', 'Average Freight Distance - Pipelines(km)', 'Average Freight Distance - Civil Aviation(km)', 'Total Daily Average Number of Freight Car Loadings(car)', 'Total Daily Average Number of Freight Car Loadings - Coal(car)', 'Total Daily Average Number of Freight Car Loadings - Petroleum(car)', 'Total Daily Average Number of Freight Car Loadings - Steel and Iron(car)', 'Total Daily Average Number of Freight Car Loadings - Mineral Builing Materials(car)', 'Total Daily Average Number of Freight Car Loadings - Grain(car)', 'Railway Traffic - Coal(10000 tons)', 'Railway Traffic - Petroleum(10000 tons)', 'Railway Traffic - Steel and Iron(10000 tons)', 'Railway Traffic - Mineral Building Materials(10000 tons)', 'Railway Traffic - Cement(10000 tons)', 'Railway Traffic - Timber(10000 tons)', 'Railway Traffic - Chemical Fertilizers and Pesticides(10000 tons)', 'Railway Traffic - Grain(10000 tons)', 'Total Number of Civil Motor Vehicles Owned(10000 units)', 'Total Number of Civil Motor Vehicles Owned - Buses and Cars(10000 units)', 'Total Number of Civil Motor Vehicles Owned - Trucks(10000 units)', 'Vehicles Owned by Departmentof Highway Transportation(10000 units)', 'Vehicles Owned by Departmentof Highway Transportation - Buses and Cars(10000 units)', 'Vehicles Owned by Departmentof Highway Transportation - Trucks(10000 units)', 'Private Vehicles(10000 units)', 'Private Vehicles - Buses and Cars(10000 units)', 'Private Vehicles - Trucks(10000 units)', 'Number of Post and Telecommunications Offices(unit)', 'Length of Postal Routes and Rural Delivery Routes(10000 km)', 'Length of Postal Routes and Rural Delivery Routes - Highway Routes(km)', 'Length of Postal Routes and Rural Delivery Routes - Railway Routes(km)', 'Long Distance Telephone Circuits(line)', 'Telegram Circuits(line)', 'Business Volume of Post and Telecommunication(100 million yuan)', 'Number of Letter(100 million pcs)', 'Number of Parcels(10000 pcs)', 'Newspapers and Magazines Circulation(10000 copies)', 'Number of Long Distance Telephone Calls(100 million times)', 'Number of Local Urban Telephone Subscribers(year-end)(subscribers)(10000 subscribers)', 'Number of Local Urban Telephone Subscribers - Residential Telephone Subscribers(10000 subscribers)', 'Capacity of Local Office Telephone Exchanges(10000 line)', 'Capacity of Local Office Telephone Exchanges - Central State-owned(10000 line)', 'Capacity of Local Office Telephone Exchanges - Local State-owned(10000 line)', 'Number of Telephone Sets(10000 units)', 'Number of Telephone Sets - Central State-owned(10000 units)', 'Number of Telephone Sets - Local State-owned(10000 units)', 'Total Retail Sales of Consumer Goods(100 million yuan)', 'Total Retail Sales of Consumer Goods - State-owned(100 million yuan)', 'Total Retail Sales of Consumer Goods - Collective Owned(100 million yuan)', 'Total Retail Sales of Consumer Goods - Joint Owned(100 million yuan)', 'Total Retail Sales of Consumer Goods - Individual(100 million yuan)', 'Total Retail Sales of Consumer Goods - Others(100 million yuan)', 'Total Retail Sales of Consumer Goods - by Sector(100 million yuan)', 'Total Retail Sales of Consumer Goods - Wholesale and Retail Sale Trades(100 million yuan)', 'Total Retail Sales of Consumer Goods - Catering Trade(100 million yuan)', 'Total Retail Sales of Consumer Goods - Others(100 million yuan)', 'Number of Contracts With Foreign Countries or Territories(unit)', 'Contracted Value With Foreign Countries or Territories(USD 100 million)', 'Value of Business Fulfilled With Foreign Countries or Territories(USD 10000)', 'Number of Contracts of Contracted Projects(unit)', 'Contracted Value of Contracted Projects(USD 100 million)', 'Value of Businness Fulfilled of Contracted Projects(USD 10000)', 'Number of Contracts of Contracted Projects - unknown type?(unit)', 'Contracted Value of Contracted Projects - unknown type?(USD 100 million)', 'Value of Businness Fulfilled of Contracted Projects - unknown type2?(USD 10000)', 'Number of Contracts of Contracted Projects - unknown type?(unit)', 'Contracted Value of Contracted Projects - unknown type2?(USD 100 million)', 'Value of Businness Fulfilled of Contracted Projects - unknown type2?(USD 10000)', 'Total Imports & Exports(100 million yuan)', 'Total Exports(RMB 100 million yuan)', 'Total Imports(RMB 100 million yuan)', 'Balance(RMB 100 million yuan)', 'Total Imports & Exports(1000 US dollars)', 'Total Exports(1000 US dollars)', 'Total Imports(1000 US dollars)', 'Balance(1000 US dollars)', 'Exports - Total(1000 US dollars)', 'Exports - Primary Goods(1000 US dollars)', 'Exports - Primary Goods - Food and Live Animals Used Chiefly for Food(1000 US dollars)', 'Exports - Primary Goods - Beverages and Tobacco(1000 US dollars)', 'Exports - Primary Goods - Non-Edible Raw Materials(1000 US dollars)', 'Exports - Primary Goods - Mineral Fuels Lubricants and Related Materials(1000 US dollars)', 'Exports - Primary Goods - Animal and Vegetable Oils Fats and Wax(1000 US dollars)', 'Exports - Manufactured Goods(1000 US dollars)', 'Exports - Manufactured Goods - Chemicals and Related Products(1000 US dollars)', 'Exports - Manufactured Goods - Light and Textile Industrial Products Rubber Products Minerals Metallurgical Products(1000 US dollars)', 'Exports - Manufactured Goods - Machinery and Transport Equipment(1000 US dollars)', 'Exports - Manufactured Goods - Miscellaneous Products(1000 US dollars)', 'Exports - Manufactured Goods - Products Not Otherwise Classified(1000 US dollars)', 'Imports - Total(1000 US dollars)', 'Imports - Primary Goods(1000 US dollars)', 'Imports - Primary Goods - Food and Live Animals Used Chiefly for Food(1000 US dollars)', 'Imports - Primary Goods - Beverages and Tobacco(1000 US dollars)', 'Imports - Primary Goods - Non-Edible Raw Materials(1000 US dollars)', 'Imports - Primary Goods - Mineral Fuels Lubricants and Related Materials(1000 US dollars)', 'Imports - Primary Goods - Animal and Vegetable Oils Fats and Wax(1000 US dollars)', 'Imports - Manufactured Goods(1000 US dollars)', 'Imports - Manufactured Goods - Chemicals and Related Products(1000 US dollars)', 'Imports - Manufactured Goods - Light and Textile Industrial Products Rubber Products Minerals Metallurgical Products(1000 US dollars)', 'Imports - Manufactured Goods - Machinery and Transport Equipment(1000 US dollars)', 'Imports - Manufactured Goods - Miscellaneous Products(1000 US dollars)', 'Imports - Manufactured Goods - Products Not Otherwise Classified(1000 US dollars)', 'Total Utilization of Foreign Capital - Number of Projects(unit)', 'Total Utilization of Foreign Capital - Value(USD 10000)', 'Foreign Loans - Number of Projects(unit)', 'Foreign Loans - Value(USD 10000)', 'Direct Foreign Investments - Number of Projects(unit)', 'Direct Foreign Investments - Value(USD 10000)', 'Total Utilization of Foreign Capital - Number of Projects(unit) - unknown type?', 'Total Utilization of Foreign Capital - Value(USD 10000) - unknown type?', 'Foreign Loans - Number of Projects - unknown type?(unit)', 'Foreign Loans - Value - unknown type?(USD 10000)', 'Direct Foreign Investments - Number of Projects - unknown type?(unit)', 'Direct Foreign Investments - Value - unknown type?(USD 10000)', 'Total Number of Schools(unit)', 'Number of Schools - Regular Institutions of Higher Education(unit)', 'Number of Schools - Secondary Schools(unit)', 'Number of Schools - Secondary Schools - Specialized Secondary Sechools(unit)', 'Number of Schools - Secondary Schools - Specialized Secondary Schools - Technical Schools(unit)', 'Number of Schools - Secondary Schools - Specialized Secondary Sechools - Teacher Training Schools(unit)', 'Number of Schools - Secondary Schools - Regular Secondary Schools(unit)', 'Number of Schools - Secondary Schools - Regular Secondary Schools - Senior(unit)', 'Number of Schools - Secondary Schools - Regular Secondary Schools - Junior(unit)', 'Number of Schools - Secondary Schools - Vocational Schools(unit)', 'Number of Schools - Primary Schools(unit)', 'Number of Schools - Kindergartens(unit)', 'Number of Schools - Special Schools(unit)', 'Total School Staff(10000 persons)', 'School Staff - Regular Institutions of Higher Education(10000 persons)', 'School Staff - Secondary Schools(10000 persons)', 'School Staff - Secondary Schools - Specialized Secondary Schools(10000 persons)', 'School Staff - Secondary Schools - Specialized Secondary Schools - Technical Schools(10000 persons)', 'School Staff - Secondary Schools - Specialized Secondary Sechools - Teacher Training Schools(10000 persons)', 'School Staff - Secondary Schools - Regular Secondary Schools(10000 persons)', 'School Staff - Secondary Schools - Vocational Schools(10000 persons)', 'School Staff - Primary Schools(10000 persons)', 'School Staff - Kindergartens(10000 persons)', 'School Staff - Special Schools(10000 persons)', 'Total Number of Teachers(10000 persons)', 'Number of Teachers - Regular Institutions of Higher Education(10000 persons)', 'Number of Teachers - Secondary Schools(10000 persons)', 'Number of Teachers - Secondary Schools - Specialized Secondary Schools(10000 persons)', 'Number of Teachers - Secondary Schools - Specialized Secondary Schools - Technical Schools(10000 persons)', 'Number of Teachers - Secondary Schools - Specialized Secondary Sechools - Teacher Training Schools(10000 persons)', 'Number of Teachers - Secondary Schools - Regular Secondary Schools(10000 persons)', 'Number of Teachers - Secondary Schools - Regular Secondary Schools - Senior(10000 persons)', 'Number of Teachers - Secondary Schools - Regular Secondary Schools - Junior(10000 persons)', 'Number of Teachers - Secondary Schools - Vocational Schools(10000 persons)', 'Number of Teachers - Primary Schools(10000 persons)', 'Number of Teachers - Kindergartens(10000 persons)', 'Number of Teachers - Special Schools(10000 persons)', 'Total Number of Enrolled Students(10000 persons)', 'Enrolled Students - Regular Institutions of Higher Education(10000 persons)', 'Enrolled Students - Secondary Schools(10000 persons)', 'Enrolled Students - Secondary Schools - Specialized Secondary Schools(10000 persons)', 'Enrolled Students - Secondary Schools - Specialized Secondary Schools - Technical Schools(10000 persons)', 'Enrolled Students - Secondary Schools - Specialized Secondary Sechools - Teacher Training Schools(10000 persons)', 'Enrolled Students - Secondary Schools - Regular Secondary Schools(10000 persons)', 'Enrolled Students - Secondary Schools - Regular Secondary Schools - Senior(10000 persons)', 'Enrolled Students - Secondary Schools - Regular Secondary Schools - Junior(10000 persons)', 'Enrolled Students - Secondary Schools - Vocational Schools(10000 persons)', 'Enrolled Students - Primary Schools(10000 persons)', 'Enrolled Students - Kindergartens(10000 persons)', 'Enrolled Students - Special Schools(10000 persons)', 'Total New Student Enrollment(10000 persons)', 'New Student Enrollment - Regular Institutions of Higher Education(10000 persons)', 'New Student Enrollment - Secondary Schools(10000 persons)', 'New Student Enrollment - Secondary Schools - Specialized Secondary Schools(10000 persons)', 'New Student Enrollment - Secondary Schools - Specialized Secondary Schools - Technical Schools(10000 persons)', 'New Student Enrollment - Secondary Schools - Specialized Secondary Sechools - Teacher Training Schools(10000 persons)', 'New Student Enrollment - Secondary Schools - Regular Secondary Schools(10000 persons)', 'New Student Enrollment - Secondary Schools - Regular Secondary Schools - Senior(10000 persons)', 'New Student Enrollment - Secondary Schools - Regular Secondary Schools - Junior(10000 persons)', 'New Student Enrollment - Secondary Schools - Vocational Schools(10000 persons)', 'New Student Enrollment - Primary Schools(10000 persons)', 'New Student Enrollment - Special Schools(10000 persons)', 'Total Number of Graduates(10000 persons)', 'Number of Graduates - Regular Institutions of Higher Education(10000 persons)', 'Number of Graduates - Secondary Schools(10000 persons)', 'Number of Graduates - Secondary Schools - Specialized Secondary Schools(10000 persons)', 'Number of Graduates - Secondary Schools - Specialized Secondary Schools - Technical Schools(10000 persons)', 'Number of Graduates - Secondary Schools - Specialized Secondary Sechools - Teacher Training Schools(10000 persons)', 'Number of Graduates - Secondary Schools - Regular Secondary Schools(10000 persons)', 'Number of Graduates - Secondary Schools - Regular Secondary Schools - Senior(10000 persons)', 'Number of Graduates - Secondary Schools - Regular Secondary Schools - Junior(10000 persons)', 'Number of Graduates - Secondary Schools - Vocational Schools(10000 persons)', 'Number of Graduates - Primary Schools(10000 persons)', 'Number of Graduates - Special Schools(10000 persons)', 'Higher Education Enrollment - Philosophy(10000 persons)', 'Higher Education Enrollment - Economics(10000 persons)', 'Higher Education Enrollment - Law(10000 persons)', 'Higher Education Enrollment - Education(10000 persons)', 'Higher Education Enrollment - Literature(10000 persons)', 'Higher Education Enrollment - History(10000 persons)', 'Higher Education Enrollment - Science(10000 persons)', 'Higher Education Enrollment - Engineering(10000 persons)', 'Higher Education Enrollment - Agriculture(10000 persons)', 'Higher Education Enrollment - Medicine(10000 persons)', 'New Student Enrollment - Philosophy(10000 persons)', 'New Student Enrollment - Economics(10000 persons)', 'New Student Enrollment - Law(10000 persons)', 'New Student Enrollment - Education(10000 persons)', 'New Student Enrollment - Literature(10000 persons)', 'New Student Enrollment - History(10000 persons)', 'New Student Enrollment - Science(10000 persons)', 'New Student Enrollment - Engineering(10000 persons)', 'New Student Enrollment - Agriculture(10000 persons)', 'New Student Enrollment - Medicine(10000 persons)', 'Graduates of Philosophy(10000 persons)', 'Graduates of Economics(10000 persons)', 'Graduates of Law(10000 persons)', 'Graduates of Education(10000 persons)', 'Graduates of Literature(10000 persons)', 'Graduates of History(10000 persons)', 'Graduates of Science(10000 persons)', 'Graduates of Engineering(10000 persons)', 'Graduates of Agriculture(10000 persons)', 'Graduates of Medicine(10000 persons)', 'Student Enrollment in Technical Schools - Engineering(10000 persons)', 'Student Enrollment in Technical Schools - Agriculture(10000 persons)', 'Student Enrollment in Technical Schools - Forestry(10000 persons)', 'Student Enrollment in Technical Schools - Medicine(10000 persons)', 'Student Enrollment in Technical Schools - Economics and Finance(10000 persons)', 'School Enrollment in Secondary Technical Schools - Politics and Law(10000 persons)', 'School Enrollment in Secondary Technical Schools - Physical(10000 persons)', 'School Enrollment in Secondary Technical Schools - Art(10000 persons)', 'School Enrollment in Secondary Technical Schools - Management(10000 persons)', 'School Enrollment - Teacher Training(10000 persons)', 'New Student Enrollment in Technical Schools - Engineering(10000 persons)', 'New Student Enrollment in Technical Schools - Agriculture(10000 persons)', 'New Student Enrollment in Technical Schools - Forestry(10000 persons)', 'New Student Enrollment in Technical Schools - Medicine(10000 persons)', 'New Student Enrollment in Technical Schools - Economics and Finance(10000 persons)', 'New School Enrollment in Secondary Technical Schools - Politics and Law(10000 persons)', 'New School Enrollment in Secondary Technical Schools - Physical(10000 persons)', 'New School Enrollment in Secondary Technical Schools - Art(10000 persons)', 'New School Enrollment in Secondary Technical Schools - Management(10000 persons)', 'New School Enrollment - Teacher Training(10000 persons)', 'Graduates of Technical Schools - Engineering(10000 persons)', 'Graduates of Technical Schools - Agriculture(10000 persons)', 'Graduates of Technical Schools - Forestry(10000 persons)', 'Graduates of Technical Schools - Medicine(10000 persons)', 'Graduates of Technical Schools - Economics and Finance(10000 persons)', 'Graduates of Secondary Technical Schools - Politics and Law(10000 persons)', 'Graduates of Secondary Technical Schools - Physical(10000 persons)', 'Graduates of Secondary Technical Schools - Art(10000 persons)', 'Graduates of Secondary Technical Schools - Management(10000 persons)', 'Graduates of Teacher Training(10000 persons)', 'Number of Postgraduates - Student Enrollment(10000 persons)', 'Number of Postgraduates - New Student Enrollment(10000 persons)', 'Number of Postgraduates - Graduates(10000 persons)', 'Number of Students Studying Abroad(10000 persons)', 'Number of Returned Students(10000 persons)', 'Percentage of Graduates of Junior Secondary Schools Entering Senior Secondary Schools(%)', 'Percentage of Graduates of Primary Secondary Schools Entering Junior Secondary Schools(%)', 'School-Age Children(10000 persons)', 'School-Age Children Enrolled in Schools(10000 persons)', 'Enrollment Rate(%)', 'Students as Percentage of Total Population(%)', 'Number of Students per 10000 Population - University and College Students(person)', 'Number of Students per 10000 Population - Secondary School Students(person)', 'Number of Students per 10000 Population - Primary School Students(person)', 'Student-Teacher Ratio - Regular Institutions of Higher Education(person)', 'Student-Teacher Ratio - Secondary Schools(person)', 'Student-Teacher Ratio - Secondary Schools - Specialized Secondary Schools(person)', 'Student-Teacher Ratio - Secondary Schools - Specialized Secondary Schools - Technical Schools(person)', 'Student-Teacher Ratio - Secondary Schools - Specialized Secondary Schools -Teacher Training Schools(person)', 'Student-Teacher Ratio - Secondary Schools - Regular Secondary Schools(person)', 'Student-Teacher Ratio - Secondary Schools - Regular Secondary Schools(person) - Senior(person)', 'Student-Teacher Ratio - Secondary Schools - Regular Secondary Schools(person) - Junior(person)', 'Student-Teacher Ratio - Secondary Schools - Vocational Schools(person)', 'Student-Teacher Ratio - Primary Schools(person)', 'Student-Teacher Ratio - Kindergartens(person)', 'Student-Teacher Ratio - Schools for the Blind Deaf and Deafmute(person)', 'Art Performance Troupes(unit)', 'Art Performance Plances(unit)', 'Cultural Centers(unit)', 'Public Libraries(unit)', 'Museums(unit)', 'Book Published - Number of Publications(kind)', 'Book Published - Number of Publications - New Publications(kind)', 'Book Published - Printed Copies(100 million copies)', 'Book Published - Printed Sheets(100 million sheets)', 'Magazines Published - Number of Publications(kind)', 'Magazines Published - Average Printed Copies per Issue(10000 copies)', 'Magazines Published - Total Printed Copies(100 million copies)', 'Magazines Published - Printed Sheets(100 million sheets)', 'Newspapers Published - Number of Newspapers Published(kind)', 'Newspapers Published - Average Printed Copies per Issue(10000 copies)', 'Newspapers Published - Total Printed Copies(100 million copies)', 'Newspapers Published - Printed Sheets(100 million sheets)', 'Number of Health Institutions - Total(unit)', 'Hospitals(unit)', 'Hospitals At and Above County Level(unit)', 'Sanatoriums(unit)', 'Clinics(unit)', 'Specialized Prevention & Treatment Centers & Stations(unit)', 'Sanitation and Antiepidemic Institutions(unit)', 'Maternity and Child Care Centers(unit)', 'Medicines and Chemical Reagent Test Labs(unit)', 'Research Institutes of Medical Science(unit)', 'Other Health Institutions(unit)', 'Number of Persons Engaged in Health Institutions - Total', 'Medical Technical Personnel(10000 persons)', 'Medical Technical Personnel - Doctors(10000 persons)', 'Medical Technical Personnel - Doctors - Doctors of Traditional Chinese Medicine(10000 persons)', 'Medical Technical Personnel - Doctors - Doctors of Western Medicine(10000 persons)', 'Medical Technical Personnel - Doctors - Paramedics of Western Medicine(10000 persons)', 'Medical Technical Personnel - Senior and Junior Nurses(10000 persons)', 'Number of Beds in Health Institutions - Total(10000 units)', 'Number of Beds in Health Institutions - Hospitals(10000 units)', 'Number of Beds in Health Institutions - Hospitals - At and Above County Level(10000 units)', 'Number of Beds in Health Institutions - Sanatoriums(10000 units)', 'Number of Beds in Health Institutions - Other Health Institutions(10000 units)', 'Hospital Beds - City(10000 units)', 'Hospital Beds - County(10000 units)', 'Medical Technical Personnel - City(10000 persons)', 'Medical Technical Personnel - City - Doctors(10000 persons)', 'Medical Technical Personnel - City - Senior and Junior Nurses(10000 persons)', 'Medical Technical Personnel - County(10000 persons)', 'Medical Technical Personnel - County - Doctors(10000 persons)', 'Medical Technical Personnel - County - Senior and Junior Nurses(10000 persons)', 'Area of Cultivated Land(10000 hectares)', 'Area of Undeveloped Land(10000 hectares)', 'Area of Afforestated Land(10000 hectares)', 'Grassland(10000 hectares)', 'Forest Area(10000 hectares)', 'Forest Coverage Rate(%)', 'Surface Water Volume(100 million cu.m)', 'Hydropower Resources(100 million kw)', 'Inland Water Area(10000 hectares)', 'Coastal Area(10000sq.km)', 'Cultivatable Area in Marine Areas(1000 hectares)']
+NATIONAL_BASE_URL = 'macroy/macroytshow.asp'
+NATIONAL_NUM_HEADER_VARIABLES = 1
+
+#
+# PREFECTURE VARIABLES
+#
+
+PREFECTURE_DATASET = "prefecture"
+
+# array of prefecture page codes
+PREFECTURE_PAGES = ['A01', 'A02', 'A03', 'A04', 'A05', 'A06', 'A07', 'A08', 'A09', 'A10', 'A12', 'A13', 'A14', 'A15', 'A16', 'A17', 'A18', 'A19', 'A20', 'A21', 'A22', 'A23', 'A24', 'A25', 'A26', 'A27']
+PREFECTURE_HEADERS = ['Year', 'ProvinceID', 'Province', 'IsPrefectureTotal', 'IsProvinceTotal', 'Prefecture', 'PrefectureID', 'Total Population at year-end(10000 persons)', 'Non-agricultural Population(10000 persons)', 'Natural Growth Rate(e)', 'Number of Employees(10000 persons)', 'Number of Urban Registered Unemployees at Year-end(10000 persons)', 'Number of Employed Persons in Urban Private Enpterprises and Self-employed Individuals at the Year-end(10000 persons)', 'Proportion of Employees in Primary Industry(10000 persons)', 'Proportion of Employees in Secondary Industry(10000 persons)', 'Proportion of Employees in Tertiary Industry(10000 persons)', 'Number of Labors in Farming Forestry Animal Husbandry Fishery(10000 persons)', 'Mining and Quarrying(10000 persons)', 'Manufacturing(10000 persons)', 'Electric Power Gas and Water Production and Supply(10000 persons)', 'Construction(10000 persons)', 'Transportation Storage Post and Telecommunications(10000 persons)', 'Wholesale & Retail Trade(10000 persons)', 'Banking and Insurance(10000 persons)', 'Real Estate(10000 persons)', 'Social Services(10000 persons)', 'Public Management and Social Organization(10000 persons)', 'Scientific Research Technical Service and Geologic Prospecting(10000 persons)', 'Management of Water Conservancy Environment and Public Facilities(10000 persons)', 'Health Social Security and Social Welfare(10000 persons)', 'Land Area(10000 sq.km)', 'Land Area(Completed Construction Area)(sq.km)', 'Cultivated Land by Year-end(1000 hectares)', 'Park Garden and Green Area(10000 hectare)', 'Population Density(person per sq.km)', 'Per Capita Cultivated Land(hectare)', 'Coverage Rate of Green Area in Completed Construction Area(%)', 'Gross Domestic Product(100 million yuan)', 'Primary Industry Percentage(100 million yuan)', 'Secondary Industry Percentage(100 million yuan)', 'Tertiary Industry Percentage(100 million yuan)', 'GDP Index(%)', 'Per Capital of Gross Domestic Product(yuan person)', 'Yield of Major Farm Crops Vegetables(10000 tons)', 'Yield of Major Farm Crops Fruits(10000 tons)', 'Yield of Major Farm Products Total Aquatic Products(10000 tons)', 'Yield of Major Farm Crops Meat(10000 tons)', 'Yield of Major Farm Crops Milk(10000 tons)', 'Per Capita Yield of Aquatic(kg)', 'Per Capita Yield of Vegetables(kg)', 'Per Capita Yield of Milk(kg)', 'Per Capita Yield of Meat(kg)', 'Per Capita Yield of fruits(kg)', 'Gross Industrial Output Value of Enterprises above Designated Size(100 million yuan)', 'Number of Enterprises above Designated Size(unit)', 'Gross Industrial Output Value of Domestic-funded Enterprises(100 million yuan)', 'Gross Industrial Output Value of Enterprises Funded by Hongkong Macao and Taiwan Investors(100 million yuan)', 'Gross Industrial Output Value of Foreign-funded Enterprises(100 million yuan)', 'Average Annual Number of Employees(10000 persons)', 'Sales Revenue of Product(100 million yuan)', 'Total Pre-tex Profits(100 million yuan)', 'Value-added Tax Payable in This Year(100 million yuan)', 'Annual Average Balance of Net Value of Fixed Assets(100 million yuan)', 'Annual Average Balance of Flowing Assets(100 million yuan)', 'Investment in Fixed Assets(100 million yuan)', 'Investment in Residential Buildings(100 million yuan)', 'Investment in Real Estate Development(100 million yuan)', 'Sales Value in Wholesale and Retail Sale Trade(100 million yuan)', 'Total Retail Sales of Consumer Goods(100 million yuan)', 'Number of Corporation above Designated Size in Wholesale and Retail Trade(unit)', 'Number of Newly Signed Contracts(unit)', 'Total Foreign Capital from Signed Contracts(USD 10000)', 'Actually Utilized Foreign Capital(USD 10000)', 'Budgetary Revenue of Local Government(100 million yuan)', 'Budgetary Expenditure of Local Government(100 million yuan)', 'Expenditure for Science Administration(100 million yuan)', 'Expenditure for Education Administration(100 million yuan)', 'Deposit(100 million yuan)', 'Loan(100 million yuan)', 'Outstanding Amount of Savings Deposit of Urban and Rural Residents at Year-end(100 million yuan)', 'Average Wage of Staff and Workers(yuan)', 'Average Number of Employees(10000 persons)', 'Total Wage of Employees(100 million yuan)', 'Number of Institutions of Higher Education(unit)', 'Number of Regular Secondary Schools(unit)', 'Number of Primary Schools(unit)', 'Number of Full-time Teachers in Institutions of Higher Education(10000 persons)', 'Number of Full-time Teachers in Regular Secondary Schools(10000 persons)', 'Number of Full-time Teachers in Primary Schools(10000 persons)', 'Student Enrollment in Institutions of Higher Education(10000 persons)', 'Student Enrollment in Regular Secondary Schools(10000 persons)', 'Student Enrollment in Primary Schools(10000 persons)', 'Theaters and Music Halls(unit)', 'Public Library Collections(10000 volumes)', 'Number of Books in Public Libraries Per Capita(volume-person)', 'Number of Hospitals(unit)', 'Number of Beds in Hospitals(10000 units)', 'Number of Doctors(10000 persons)', 'Total Passenger Traffic(10000 persons)', 'Passenger Traffic by Railway(10000 persons)', 'Passenger Traffic by Highway(10000 persons)', 'Total Freight Traffic(100 million passenger-km)', 'Freight Traffic by Railway(100 million passenger-km)', 'Freight Traffic by Highway(100 million passenger-km)', 'Number of Post & Telecommunication Offices at Year-end(unit)', 'Postal Service Income(100 million yuan)', 'Telecommunication Service Income(100 million yuan)', 'Number of Local Telephone Users(10000 subscribers)', 'Annual Supply of Tap Water(100 million tons)', 'Per Capita Water Consumption for Living(ton)', 'Total Yearly Electricity Consumption(10000 kwh)', 'Per Capita Electricity Consumption for Living(kwh)', 'Household Consumption of Coal Gas(100 million cu.m)', 'Household Consumption of Liquefied Petrol Gas(10000 tons)', 'Area of Paved Roads by Year-end(10000 sq.m)', 'Area of paved Rodas Per Capita(sq.m)', 'Number of Public Transportation Vehicles by Year-end (Buses and Trolley Buses etc.)(unit)', 'Number of Public Transportation Vehicles Per 10,000 Persons(unit)', 'Number of Passengers Carried by Public Transportation Vehicles(10000 person-times)', 'Number of Cabs by Year-end(unit)', 'Industry Solid Waste Comprehensive Use Factor(%)', 'Volume of Sulphur Dioxide Exhausted(ton)', 'Proportion of Industrial Waste Water Discharge Qualifying Standard(%)']
+PREFECTURE_BASE_URL = 'city/citytshow.asp'
+# number of left-hand side array variables that will be spliced on a the end
+PREFECTURE_NUM_HEADER_VARIABLES = 5
+
+#
+# PROVINCE VARIABLES
+#
+
+PROVINCE_DATASET = "province"
+
+# The location of the province dropdown on the province page
+PROVINCE_DATASET_DD = 0
+
+# array of provincial page codes
+PROVINCE_PAGES = ['A0101', 'A0103', 'A0104', 'A0201', 'A0202', 'A0301', 'A0302', 'A0402', 'A0501', 'A0601', 'A0602', 'A0801', 'A0802', 'A0803', 'A0804', 'A0901', 'A0904', 'A1001', 'A1002', 'A1101', 'A1102', 'A1103', 'A1201', 'A1202', 'A1401', 'A1402', 'A1501', 'A1601']
+PROVINCE_HEADERS = ['Year', 'Province ID', 'Province', 'Gross Domestic Product(100 million yuan)', 'Primary Industry(100 million yuan)', 'Secondary Industry(100 million yuan)', 'Industry(100 million yuan)', 'Construction(100 million yuan)', 'Tertiary Industry(100 million yuan)', 'Transportation Post and Telecommunications(100 million yuan)', 'Wholesale Retail & Catering Trade(100 million yuan)', 'Per-Capita GDP(yuan/person)', 'Gross Domestic Product(%)', 'Primary Industry(%)', 'Secondary Industry(%)', 'Secondary Industry-Industry(%)', 'Secondary Industry-Construction(%)', 'Tertiary Industry(%)', 'Tertiary Industry(%)-Transportation Post and Telecommunications(%)', 'Tertiary Industry(%)-Wholesale Retail& Catering Trade(%)', 'Per-Capitas GDP(%)', 'Gross Domestic Product by Expenditure Approach(100 million yuan)', 'Final Consumption Expenditure(100 million yuan)', 'Household Expenditure(100 million yuan)', 'Government Expenditure(100 million yuan)', 'Gross Capital Formation(100 million yuan)', 'Fixed Capital(100 million yuan)', 'Changes in Inventories(100 million yuan)', 'Net Exportof Goods and Services(100 million yuan)', 'Total Permanent Population(year-end)(10000 persons)', 'Total Permanent Population-Male(10000 Persons)', 'Total Permanent Population-Female(10000 Persons)', 'Total Household registed Population(year-end)(10000 persons)', 'Total Household registed Population(year-end) Grouped by Sex-Male(10000 Persons)', 'Total Household registed Population(year-end) Grouped by Sex-Female(10000 Persons)', 'Birth Rate(e)', 'Death Rate(e)', 'Natural Growth Rate(e)', 'Total Number of Employed Persons(10000 persons)', 'Employed Persons by UrbanAreas(10000 persons)', 'Employed Persons by RuralAreas(10000 persons)', 'Employed Persons by Industry-Primary Industry(10000 persons)', 'Employed Persons by Industry-Secondary Industry(10000 persons)', 'Employed Persons by Industry-Tertiary Industry(10000 persons)', 'Staff and Workers(10000 persons)', 'Staff and Workers-State Owned Units(10000 persons)', 'Staff and Workers-Urban Collective Owned Units(10000 persons)', 'Staff and Workers-Other Ownership Units(10000 persons)', 'Total Investment in Fixed Assets(100 million yuan)', 'Domestic(100 million yuan)', 'DomesticState-owned(100 million yuan)', 'DomesticCollective-owned(100 million yuan)', 'DomesticCooperative(100 million yuan)', 'DomesticJoint(100 million yuan)', 'DomesticLimited Liability(100 million yuan)', 'DomesticShare-holding(100 million yuan)', 'DomesticPrivate(100 million yuan)', 'DomesticSelf-employed Individual(100 million yuan)', 'DomesticOthers(100 million yuan)', 'Funds from Hong Kong,Macao and Taiwan(100 million yuan)', 'Foreign Funded(100 million yuan)', 'Floor Space of Buildings-Under Construction(10000 sq m)', 'Floor Space of Buildings-Completed(10000 sq m)', 'Floor Space of Commercial House Actually Sold(10000 sq m)', 'Floor Space of Commercial House Actually Sold-Residential Buildings(10000 sq m)', 'Commercial House Purchased by Individuals(10000 sq m)', 'Total Sales of Commercial House(100 million yuan)', 'Total Sales of Commercial House-Residential Buildings(100 million yuan)', 'General Retail Price Index(%)', 'General Consumer Price Index(%)', 'General Consumer Price Index-#Rural Area(%)', 'General Consumer Price Index-#Urban Area(%)', 'General Purchasing Price Index of Farm Products(%)', 'General Rural Retail Price Index of Industrial Products(%)', 'Urban Households Per Capital Annual-Disposable Income-Total(yuan)', 'Urban Households Per Capital Annual-Disposable Income-Index(1978=100)%', 'Urban Households Per Capital Annual-Living Expenditure(yuan)', 'Urban Households Per Capital Annual-Living Expenditure-Food(yuan)', 'Rural Households Per Capital Annual-Net Income-Total(yuan)', 'Rural Households Per Capital Annual-Index(1978=100)(%)', 'Rural Households Per Capital Annual-Living Expenditure(yuan)', 'Rural Households Per Capital Annual-Living Expenditure-Food(yuan)', 'Per Capita Living Space Urban(sq.m)', 'Per Capita Living Space Rural(sq.m)', 'Average Wage of Staff and Workers Total(yuan)', 'Average Wage of Staff and Workers Total Index(1978=100)(%)', 'Savings Depositin Urban and Rural Areas(year-end)(100 million yuan)', 'Per Captia Savings Deposit(yuan)', 'Local Revenue(100 million yuan', 'Local Taxes(100 million yuan)', 'Local Taxes-Industrial and Commercial(100 million yuan)', 'Local Expenditure(100 million yuan)', 'Local Expenditure-Capital Construction(100 million yuan)', 'Local Expenditure-Innovation Funds(100 million yuan)', 'Local Expenditure-Supporting Agricultural Production(100 million yuan)', 'Local Expenditure-Culture Education Science & Health Care(100 million yuan)', 'Local Expenditure-Government Administration(100 million yuan)', 'Total Deposits in Financial Institutions(100 million yuan)', 'Deposits in Financial Institutions - Enterprise Deposits (100 million yuan)', 'Total Loans in Financial Institutions(100 million yuan)', 'Loans in Financial Institutions - To Industrial Enterprises (100 million yuan)', 'Loans in Financial Institutions - To Commercial Enterprises (100 million yuan)', 'Loans in Financial Institutions - To Agriculture (100 million yuan)', 'Loans in Financial Institutions - Fixed Assets (100 million yuan)', 'Number of Township and Town Governments(unit)', 'Number of Villagers Committees(unit)', 'Number of Rural Households(household)', 'Number of Rural Populations(10000 persons)', 'Number of Rural Laborers(10000 persons)', 'Number of Rural Laborers - Farming Forestry Animal Husbandry & Fishery(10000 persons)', 'Number of Rural Laborers - Industry(10000 persons)', 'Number of Rural Laborers - Construction(10000 persons)', 'Number of Rural Laborers - Transportation(10000 persons)', 'Number of Rural Laborers - Wholesale Retail Sale and Catering Trades(10000 persons)', 'Number of Rural Laborers - Others(10000 persons)', 'Cultivated Areas(1000 hectares)', 'Cultivated Areas - Paddy Fields(1000 hectares)', 'Cultivated Areas - Dry Fields(1000 hectares)', 'Cpacity of Reservoirs(100 million cu.m)', 'Number of large and Medium Agricultural Tractors(unit)', 'Capacity of Large and Medium Agricultural Tractors(10000 kw)', 'Number of Mini-tractors(unit)', 'Capacity of Mini-tractors(10000 kw)', 'Number of Diesel Engines(unit)', 'Capacity of Diesel Engines(10000 kw)', 'Number of Trucks for Agricultrural Use(unit)', 'Capacity of Trucks for Agricultrural Use(10000 kw)', 'Number of Motorized Fishing Boats(unit)', 'Capacity of Motorized Fishing Boats(10000 kw)', 'Grain Crops(kg-hectare)', 'Cotton(kg-hectare)', 'Oilbearing Crops(kg-hectare)', 'Sugar Crops(kg-hectare)', 'Grain Crops(kg)', 'Cotton(kg)', 'Output of Pork Beef and Mutton(kg)', 'Aquatic Products(kg)', 'Output Value of Farming and Forestry(yuan)', 'Gross Output Value of Farming Forestry and Animal Husbandry - Total(100 million yuan)', 'Gross Output Value of Farming Forestry and Animal Husbandry - Farming(100 million yuan)', 'Gross Output Value of Farming Forestry and Animal Husbandry - Forestry(100 million yuan)', 'Gross Output Value of Farming Forestry and Animal Husbandry - Animal Husbandry(100 million yuan)', 'Gross Output Value of Farming Forestry and Animal Husbandry - Fishing(100 million yuan)', 'Indices of Gross Output Value of Farming and Animal Husbandry - Total(%)', 'Indices of Gross Output Value of Farming and Animal Husbandry - Farming(%)', 'Indices of Gross Output Value of Farming and Animal Husbandry - Forestry(%)', 'Indices of Gross Output Value of Farming and Animal Husbandry - Animal Husbandry(%)', 'Indices of Gross Output Value of Farming and Animal Husbandry - Fishery(%)', 'Total Power of Agricultural Machinery(10000 kw)', 'Irrigated Area(1000 hectares)', 'Consumption of Chemical Fertilizers(10000 tons)', 'Electricity Consumed in Rural Area(100 million kwh)', 'Total Sown Area(1000 hectares)', 'Sown Area - Grain Crops(1000 hectares)', 'Grain(10000 tons)', 'Cotton(10000 tons)', 'Oil-Bearing Crops(10000 tons)', 'Fruits(10000 tons)', 'Fruits(10000 tons)', 'Large Animals(year-end)(10000 heads)', 'Output of Pork Beef & Mutton(10000 tons)', 'Aquatic Products(10000 tons)', 'Number of Industrial Enterprises(unit)', 'Number of Industrial Enterprises - State Owned(unit)', 'Number of Industrial Enterprises - Collective Owned(unit)', 'Gross Industrial Output Value(100 million yuan)', 'Gross Industrial Output Value - State Owned(100 million yuan)', 'Gross Industrial Output Value - Collective Owned(100 million yuan)', 'Indices of Gross Industrial Output Value(%)', 'Indices of Gross Industrial Output Value - State Owned(%)', 'Indices of Gross Industrial Output Value - Collective Owned(%)', 'Cloth(100 million m)', 'Machine-made Paper and Paperboard(10000 tons)', 'Cigarettes(100 million unit)', 'Coal(10000 tons)', 'Oil(10000 tons)', 'Electricity(100 million kwh)', 'Steel(10000 tons)', 'Steel Products(10000 tons)', 'Cement(10000 tons)', 'Plate Glass(10000 weight cases)', 'Chemical Fertilizer(10000 tons)', 'Number of Construction Enterprises(unit)', 'Number of Construction Enterprises - State Owned(unit)', 'Number of Construction Enterprises - Urban Collective Owned(unit)', 'Number of Persons Engaged(10000 persons)', 'Number of Persons Engaged - State Owned(10000 persons)', 'Number of Persons Engaged - Urban Collective Owned(10000 persons)', 'Gross OutputValue of Construction Enterprises(100 million yuan)', 'Gross OutputValue of Construction Enterprises - State Owned(100 million yuan)', 'Gross OutputValue of Construction Enterprises - Urban Collective Owned(100 million yuan)', 'Floor Space of Building Construction - Under Construction(10000 sq m)', 'Floor Space of Building Construction - Completed(10000 sq m)', 'Length of Railways(10000 km)', 'Length of Highways(10000 km)', 'Passenger Traffic(10000 persons)', 'Passenger Traffic - Railway(10000 persons)', 'Passenger Traffic - Highway(10000 persons)', 'Passenger Traffic - Waterways(10000 persons)', 'Freight Traffic(10000 tons)', 'Freight Traffic - Railway(10000 tons)', 'Freight Traffic - Highway(10000 tons)', 'Freight Traffic - Waterways(10000 tons)', 'Turnover Volume of Passenger Traffic(100 million passenger-km)', 'Turnover Volume of Passenger Traffic - Railway(100 million passenger-km)', 'Turnover Volume of Passenger Traffic - Highway(100 million passenger-km)', 'Turnover Volume of Passenger Traffic - Waterways(100 million passenger-km)', 'Turnover Volume of Freight Traffic(100 million ton-km)', 'Turnover Volume of Freight Traffic - Railway(100 million ton-km)', 'Turnover Volume of Freight Traffic - Highway(100 million ton-km)', 'Turnover Volume of Freight Traffic - Waterways(100 million ton-km)', 'Number of Civil Motor Vehicles Owned(10000 units)', 'Business Volume of Post and Telecommunications(100 million yuan)', 'Number of Letters(100 million pcs)', 'Number of Loans Urban Telephone Subscribers(10000 subscribers)', 'Number of Telephone Sets(10000 units)', 'Total Retail Sales of Consumer Goods(100 million yuan)', 'Retail Sales of Consumer Goods - State Owned(100 million yuan)', 'Retail Sales of Consumer Goods - Collective Owned(100 million yuan)', 'Retail Sales of Consumer Goods - Urban Areas(100 million yuan)', 'Retail Sales of Consumer Goods - Rural Areas(100 million yuan)', 'Transaction Value(100 million yuan)', 'Total Imports and Exports(1000 US dollars)', 'Imports and Exports - Exports(1000 US dollars)', 'Foreign Capital Actually Utilized(USD 10000)', 'Foreign Capital Actually Utilized - Foreign Loans(USD 10000)', 'Foreign Capital Actually Utilized - Direct Foreign Investment(USD 10000)', 'Foreign Capital Actually Utilized - Other Foreign Investments(USD 10000)', 'Foreign Exchange Income from Tourism(USD million)', 'Student Enrollment - Institutions of Higher Education(10000 Persons)', 'Student Enrollment - Secondary Schools(10000 Persons)', 'Student Enrollment - Secondary Schools (Regular Secondary Schools)(10000 Persons)', 'Student Enrollment - Primary Schools(10000 Persons)', 'Percentage of Graduates of Primary Schools Entering Secondary(%)', 'Percentage of School-Aged Children Enrolled(%)', 'Number of Full-time Teachers - Institutions of Higher Education(10000 persons)', 'Number of Full-time Teachers - Secondary Schools(10000 persons)', 'Number of Full-time Teachers - Secondary Schools (Regular Secondary Schools)(10000 persons)', 'Number of Full-time Teachers - Primary Schools(10000 persons)', 'Art Performance Troupes(unit)', 'Cultural Centers(unit)', 'Public Libraries(unit)', 'Number of Books Published(100 million copies)', 'Number of Magazines Published(100 million copies)', 'Number of Newspapers Published(100 million copies)', 'Listener Rating(%)', 'Viewer Rating(%)', 'Number of Health Institutions(unit)', 'Number of Health Institutions - Hospitals(unit)', 'Number of Beds in Health Institution(10000 units)', 'Number of Beds in Health Institution - Hospitals(10000 units)', 'Medical Technical Personnel(10000 persons)', 'Medical Technical Personnel - Doctors(10000 persons)', 'Per 10000 persons - Number of Beds(unit)', 'Per 10000 persons - Number of Doctors(person)', 'Area of Cultivated Land(10000 hectares)', 'Area of Undeveloped Land(10000 hectares)', 'Area of Afforestated Land(10000 hectares)', 'Grassland(10000 hectares)', 'Forest Area(10000 hectares)', 'Forest-coverage Rate(%)', 'Surface Water Volume(100 million cu.m)', 'Hydropower Resources(100 million kw)', 'Inland Water Area(10000 hectares)', 'Coatal Area(10000sq.km)', 'Cultivable Area in Shallow Sea and Sea-beaches(1000 hectares)']
+PROVINCE_BASE_URL = 'macroyr/macroyrtshow.asp'
+PROVINCE_NUM_HEADER_VARIABLES = 3
+
+#
+# URBAN VARIABLES
+#
+
+URBAN_DATASET = "urban"
+
+# array of urban page codes
+URBAN_PAGES = ['A01', 'A02', 'A05', 'A06', 'A07', 'A12', 'A13', 'A14', 'A18', 'A19', 'A20']
+# headers of the data columns
+URBAN_HEADERS = ['Year', 'Province ID', 'Province', 'IsProvinceTotal', 'District', 'DistrictID', 'Total Population at year-end(10000 persons)',	'Natural Growth Rate(e)', 'Number of Employees(10000 persons)',	'Number of Urban Registered Unemployees at Year-end(10000 persons)', 'Land Area(10000 sq.km)', 'Cultivated Land by Year-end(1000 hectares)', 'Gross Domestic Product(100 million yuan)', 'GDP of Primary Industry(100 million yuan)', 'GDP of Secondary Industry(100 million yuan)', 'GDP of Tertiary Industry(100 million yuan)', 'Yield of Major Farm Crops Fruits(10000 tons)', 'Yield of Major Farm Products Total Aquatic Products(10000 tons)', 'Investment in Fixed Assets(100 million yuan)', 'Investment in Real Estate Development(100 million yuan)', 'Total Retail Sales of Consumer Goods(100 million yuan)', 'Total Foreign Capital from Signed Contracts(USD 10000)', 'Actually Utilized Foreign Capital in This Year(USD 10000)', 'Value of Export(1,000 US dollars)', 'Number of Regular Secondary Schools(unit)', 'Number of Primary Schools(unit)', 'Number of Full-time Teachers in Regular Secondary Schools(10000 persons)', 'Number of Full-time Teachers in Primary Schools(10000 persons)', 'Student Enrollment in Regular Secondary Schools(10000 persons)', 'Student Enrollment in Primary Schools(10000 persons)']
+# url specifying the urban pages
+URBAN_BASE_URL = 'city/citytshow.asp'
+# number of left-hand side array variables that will be spliced on a the end
+URBAN_NUM_HEADER_VARIABLES = 4
+
+##
+## DEFAULT VARIABLES
+##
+
+# This is the code to make sure that an option has to be picked
+NO_DEFAULT = 0
+
+# This is the starting and ending years of the dataset online
+URBAN_DATASET_START = 1996
+URBAN_DATASET_END = 2012
+
+COUNTY_DATASET_START = 1947
+COUNTY_DATASET_END = 2012
+
+PROVINCE_DATASET_START = 1947
+PROVINCE_DATASET_END = 2012
+
+NATIONAL_DATASET_START = 1947
+NATIONAL_DATASET_END = 2012
+
+PREFECTURE_DATASET_START = 1996
+PREFECTURE_DATASET_END = 2012
+
+# array of years we are interested in
+DEFAULT_YEARS_COUNTY = [1979, 1980, 1981, 1982, 1983, 1984, 1985, 1986, 1987, 1988, 1989, 1990, 1991, 1992, 1993, 1994, 1995, 1996, 1997, 1998, 1999, 2000, 2001, 2002, 2003, 2004, 2005, 2006, 2007, 2008]
+DEFAULT_YEARS_URBAN = [1996, 1997, 1998, 1999, 2000, 2001, 2002, 2003, 2004, 2005, 2006, 2007, 2008]
+DEFAULT_YEARS_PROVINCE = [1979, 1980, 1981, 1982, 1983, 1984, 1985, 1986, 1987, 1988, 1989, 1990, 1991, 1992, 1993, 1994, 1995, 1996, 1997, 1998, 1999, 2000, 2001, 2002, 2003, 2004, 2005, 2006, 2007, 2008]
+DEFAULT_YEARS_NATIONAL = [1979, 1980, 1981, 1982, 1983, 1984, 1985, 1986, 1987, 1988, 1989, 1990, 1991, 1992, 1993, 1994, 1995, 1996, 1997, 1998, 1999, 2000, 2001, 2002, 2003, 2004, 2005, 2006, 2007, 2008]
+DEFAULT_YEARS_PREFECTURE = [1996, 1997, 1998, 1999, 2000, 2001, 2002, 2003, 2004, 2005, 2006, 2007, 2008]
+
+DEFAULT_DATASET = NO_DEFAULT
+
+DEFAULT_VERBOSE = True
+
+DEFAULT_MULTIFILE = False
+
+# number of threads fetching pages at once; 1 keeps the old one-page-at-a-time behaviour
+DEFAULT_WORKERS = 1
+
+# the most requests we will ever have open to chinadataonline.org at the same time
+DEFAULT_MAX_INFLIGHT = 4
+
+# number of processes parsing pages; 0 parses them in this process, as they are used
+DEFAULT_PARSERS = 0
+
+# where downloaded pages are cached between runs
+DEFAULT_CACHE_DIR = 'pagecache'
+
+# seconds a cached page stays fresh before it is downloaded again; 0 means forever
+DEFAULT_CACHE_TTL = 30 * 24 * 60 * 60
+
+# the most megabytes of compressed pages the cache will hold
+DEFAULT_CACHE_SIZE = 1024
+
+# the tuning options set from the command line; filled in by the main code from parseArguments,
+# in place, so that every module that imported it sees the same options
+crawlOptions = {
+	'workers':DEFAULT_WORKERS,
+	'maxinflight':DEFAULT_MAX_INFLIGHT,
+	'cachedir':DEFAULT_CACHE_DIR,
+	'cachettl':DEFAULT_CACHE_TTL,
+	'cachesize':DEFAULT_CACHE_SIZE,
+	'offline':False,
+	'resume':False,
+	'incremental':False,
+	'batch':True,
+	'parsers':DEFAULT_PARSERS,
+	'refreshdropdowns':False,
+	'metrics':None,
+	'archive':None,
+	'site':None,
+	'loginwait':WAIT_TIME,
+	'maxrate':DEFAULT_MAX_RATE}
+
+####
+#### FUNCTIONS
+####
+
+# Gets the header row of a dataset's csv files
+def getHeaders(dataset):
+
+	headers = ""
+
+	# Sets the headers correctly
+	if(dataset == COUNTY_DATASET):
+		headers = COUNTY_HEADERS
+			
+	elif(dataset == NATIONAL_DATASET):
+		headers = NATIONAL_HEADERS
+		
+	elif(dataset == PROVINCE_DATASET):
+		headers = PROVINCE_HEADERS
+	
+	elif(dataset == PREFECTURE_DATASET):
+		headers = PREFECTURE_HEADERS
+
+	elif(dataset == URBAN_DATASET):
+		headers = URBAN_HEADERS
+	
+	else:
+		print "No headers chosen"
+		sys.exit()
+
+	return headers
+
+# Gets the codes of a dataset's pages, in order
+def getPages(dataset):
+
+	if(dataset == COUNTY_DATASET):
+		return COUNTY_PAGES
+	elif(dataset == NATIONAL_DATASET):
+		return NATIONAL_PAGES
+	elif(dataset == PROVINCE_DATASET):
+		return PROVINCE_PAGES
+	elif(dataset == PREFECTURE_DATASET):
+		return PREFECTURE_PAGES
+	elif(dataset == URBAN_DATASET):
+		return URBAN_PAGES
+
+# Gets the number of columns at the start of a dataset's headers that aren't from its pages
+def getNumHeaderVariables(dataset):
+
+	if(dataset == COUNTY_DATASET):
+		return COUNTY_NUM_HEADER_VARIABLES
+	elif(dataset == NATIONAL_DATASET):
+		return NATIONAL_NUM_HEADER_VARIABLES
+	elif(dataset == PROVINCE_DATASET):
+		return PROVINCE_NUM_HEADER_VARIABLES
+	elif(dataset == PREFECTURE_DATASET):
+		return PREFECTURE_NUM_HEADER_VARIABLES
+	elif(dataset == URBAN_DATASET):
+		return URBAN_NUM_HEADER_VARIABLES
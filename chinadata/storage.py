@@ -0,0 +1,611 @@
+# file: chinadata/storage.py
+#
+# purpose: what the crawl keeps: the csv output files and the tables they are written from,
+# the journal of finished work, the rows of earlier output for --incremental, and the
+# registry of the site's dropdown lists
+#
+# created by: Andrew MacDonald on 11/24/08, as part of chinesedata.py; split out on 10/18/26.
+#
+# copyright: (c) 2008, 2009, 2010, 2013 Andrew MacDonald. All rights reserved.
+# email: andrewm@stanfordalumni.org
+
+import array
+import csv
+import json
+import os.path
+import re
+import sys
+import threading
+
+from chinadata.settings import *
+from chinadata.parse import parseDropdown
+
+####
+#### GLOBAL VARIABLES
+####
+
+# the journal of finished work for each dataset being crawled; set up in the main code
+crawlJournals = {}
+
+# the open file behind each csv writer made by initCSV, so the journal can flush them
+csvHandles = {}
+
+# with --incremental, the rows of earlier output files, by unit of work; see loadExistingRows
+existingRows = {}
+
+# the dropdown lists seen on the site, as {dataset: {year: {province ID: [(ID, name), ...]}}};
+# a province ID of "" holds the year's list of provinces. See registerDropdown
+dropdownRegistry = {}
+
+# whether dropdownRegistry has anything in it that isn't saved yet
+dropdownRegistryChanged = False
+
+# subunit IDs by (dataset, year, name), built from dropdownRegistry by lookupUnitId
+unitIdIndex = None
+
+# guards the registry, which the threads crawling different datasets all use
+dropdownRegistryLock = threading.RLock()
+
+# one copy of each name and ID string, shared by every table; see internString
+internedStrings = {}
+
+####
+#### FUNCTIONS
+####
+
+# Properly sets up the CSV file according to the program options
+def initCSV(dataset, years, multifiles):
+
+	csvfiles = []
+	headers = getHeaders(dataset)
+
+	for filename in csvFilenames(dataset, years, multifiles):
+		csvfiles.append(openCSV(dataset, filename, headers))
+
+	return csvfiles
+
+# Gets the names of the csv files a crawl writes, in the order initCSV opens them
+def csvFilenames(dataset, years, multifiles):
+
+	filenames = []
+
+	# Switches up depending on whether the option to specify multiple files has been selected
+	if(multifiles == False or dataset==NATIONAL_DATASET):
+		filenames.append(dataset + str(years[0]) + "-" + str(years[len(years)-1]) + ".csv")
+	else:
+		for i in years:
+			filenames.append(dataset + str(i) + ".csv")
+
+	return filenames
+
+# For --incremental: reads the rows of the dataset's earlier output files in this directory into
+# existingRows, grouped into the units of work the crawl is done in (a province in a year, a year
+# of the province dataset, or the whole national dataset), so the crawl only has to fetch the units
+# that are missing. Output files this crawl is about to overwrite are first moved aside to
+# <name>.old, replacing the one an earlier run left (unless we are resuming, when the .old file
+# is the one to read); if two files have the same unit, the first one read wins
+def loadExistingRows(dataset, years, multifiles, verbose):
+
+	filepattern = re.compile("^" + dataset + "[0-9]{4}(-[0-9]{4})?\\.csv(\\.old)?$")
+	headers = getHeaders(dataset)
+	wantedyears = set([str(year) for year in years])
+	targets = csvFilenames(dataset, years, multifiles)
+	unitfiles = {}
+	nationalyears = {}
+	filenames = []
+
+	for filename in targets:
+		# when resuming, the file already holds this crawl's rows, and the .old file the earlier ones;
+		# otherwise the file is the newest output there is, and takes the place of any older .old file
+		if(os.path.isfile(filename) and (crawlOptions['resume'] == False or os.path.isfile(filename + ".old") == False)):
+			if(os.path.isfile(filename + ".old")):
+				os.remove(filename + ".old")
+
+			os.rename(filename, filename + ".old")
+
+		if(os.path.isfile(filename + ".old")):
+			filenames.append(filename + ".old")
+
+	for filename in sorted(os.listdir(".")):
+		if(filepattern.match(filename) and filename not in targets and filename not in filenames):
+			filenames.append(filename)
+
+	for filename in filenames:
+		existingfile = open(filename, "r")
+		reader = csv.reader(existingfile)
+
+		# an empty file, say from a crawl that died as soon as it had made it, has no header at all
+		if(next(reader, None) != headers):
+			if(verbose==True):
+				print "Not using %s, as it is empty or its columns don't match this dataset's" % filename
+
+			existingfile.close()
+			continue
+
+		for row in reader:
+			if(row[0] not in wantedyears):
+				continue
+
+			if(dataset == NATIONAL_DATASET):
+				nationalyears.setdefault(row[0], row)
+				continue
+			elif(dataset == PROVINCE_DATASET):
+				key = (dataset, row[0], "")
+			else:
+				key = (dataset, row[0], row[1])
+
+			if(unitfiles.setdefault(key, filename) == filename):
+				existingRows.setdefault(key, []).append(row)
+
+		existingfile.close()
+
+	# the national pages have every year on them, so they are only worth skipping if we have every year
+	if(dataset == NATIONAL_DATASET and len(nationalyears) == len(wantedyears)):
+		existingRows[(dataset, "", "")] = [nationalyears[str(year)] for year in years]
+
+	if(verbose==True):
+		print "Read %s units of work out of %s earlier output files" % (len(existingRows), len(filenames))
+
+# Gets the rows an earlier crawl already wrote out for a unit of work, or None if we don't have
+# them (which is always the case without --incremental)
+def existingUnit(dataset, year, province):
+	return existingRows.get((dataset, str(year), str(province)))
+
+# Opens one csv file for writing and returns its writer. If we are resuming and the journal
+# says how far the file got, it is cut back to that point (dropping any rows written after
+# the last finished unit) and appended to; otherwise it starts fresh with the header row
+# note: only called from initCSV
+def openCSV(dataset, filename, headers):
+
+	journal = crawlJournals.get(dataset)
+
+	if(journal != None and filename in journal.offsets):
+		handle = open(filename, "r+")
+		handle.truncate(journal.offsets[filename])
+		handle.seek(journal.offsets[filename])
+
+		writer = csv.writer(handle)
+	else:
+		handle = open(filename, "w")
+
+		writer = csv.writer(handle)
+		writer.writerow(headers)
+
+	csvHandles[writer] = handle
+
+	return writer
+
+# The journal of a crawl: an append-only file recording each page that has been parsed and each
+# unit of work (a province in a year, a year of the province dataset, or the whole national
+# dataset) that has been written out, along with how far its csv file had got. With --resume,
+# finished units are skipped and the csv files are picked up from where they were left. With a
+# path of None the journal is only kept in memory, for crawls that write no files of their own
+class CrawlJournal(object):
+
+	def __init__(self, path, resume):
+		self.path = path
+		self.lock = threading.Lock()
+		self.units = set()
+		self.pages = set()
+		self.offsets = {}
+
+		if(path == None):
+			self.handle = None
+		elif(resume == True and os.path.isfile(path)):
+			self.load()
+			self.handle = open(path, "a")
+		else:
+			self.handle = open(path, "w")
+
+	# Reads in the entries of an earlier run's journal
+	def load(self):
+
+		journalfile = open(self.path, "r")
+
+		for line in journalfile:
+			entry = line.rstrip("\n").split("\t")
+
+			if(entry[0] == "page" and len(entry) == 5):
+				self.pages.add(tuple(entry[1:5]))
+			elif(entry[0] == "unit" and len(entry) == 6):
+				self.units.add(tuple(entry[1:4]))
+				self.offsets[entry[4]] = int(entry[5])
+			# anything else is a line cut short by the crash we are resuming from
+
+		journalfile.close()
+
+	# Checks whether a unit was written out by an earlier run
+	def unitDone(self, dataset, year, province):
+		return (dataset, str(year), str(province)) in self.units
+
+	# The number of pages journaled for units that are not finished yet
+	def unfinishedPages(self):
+		return len([page for page in self.pages if page[:3] not in self.units])
+
+	# Notes that a page has been parsed; only flushed, not synced, as there are so many of them
+	def recordPage(self, dataset, year, province, page):
+
+		with self.lock:
+			self.pages.add((dataset, str(year), str(province), page))
+
+			if(self.handle == None):
+				return
+
+			self.handle.write("page\t%s\t%s\t%s\t%s\n" % (dataset, year, province, page))
+			self.handle.flush()
+
+	# Notes that a unit has been written out to csvfile; the csv file is synced to disk first,
+	# so that the offset recorded is never ahead of what was actually saved
+	def recordUnit(self, dataset, year, province, csvfile):
+
+		handle = csvHandles[csvfile]
+
+		with self.lock:
+			handle.flush()
+			os.fsync(handle.fileno())
+
+			self.units.add((dataset, str(year), str(province)))
+			self.offsets[handle.name] = handle.tell()
+			self.handle.write("unit\t%s\t%s\t%s\t%s\t%s\n" % (dataset, year, province, handle.name, handle.tell()))
+			self.handle.flush()
+			os.fsync(self.handle.fileno())
+
+	def close(self):
+
+		if(self.handle != None):
+			self.handle.close()
+
+# One of the in-memory databases (the subunits of a province, the years of the national data,
+# or the provinces in a year), stored by column rather than by row. The first textcolumns
+# columns hold the names, IDs and years, as shared strings; each of the others is a typed array
+# of numbers, a mask of which cells are filled in, and the number of decimal places each number
+# was printed with, so that iterRows can write it back out exactly as the site gave it. A cell
+# that isn't a plain number is kept as its string in overrides. The table also keeps an index from
+# each row's name (in column nameoffset) to its row, kept up to date as rows are added with addRow
+class ColumnTable(object):
+
+	def __init__(self, numcolumns, textcolumns, nameoffset):
+		self.numcolumns = numcolumns
+		self.textcolumns = textcolumns
+		self.nameoffset = nameoffset
+		self.numrows = 0
+		self.index = {}
+		self.overrides = {}
+		self.text = []
+		self.values = []
+		self.decimals = []
+		self.valid = []
+
+		for i in range(textcolumns):
+			self.text.append([])
+
+		for i in range(numcolumns - textcolumns):
+			self.values.append(array.array('d'))
+			self.decimals.append(array.array('b'))
+			self.valid.append(bytearray())
+
+	def __len__(self):
+		return self.numrows
+
+	# Adds a row to the end of the table; two rows can't have the same name, as we would
+	# have no way of telling which one later data belonged to
+	def addRow(self, row):
+
+		if(row[self.nameoffset] in self.index):
+			print "Somehow there is more than one unit in the database with the same name (%s). This is a serious problem." % row[self.nameoffset]
+			print "Exiting now"
+			sys.exit()
+
+		self.index[row[self.nameoffset]] = self.numrows
+		self.numrows = self.numrows + 1
+
+		for i in range(self.textcolumns):
+			self.text[i].append(internString(row[i]))
+
+		for i in range(self.numcolumns - self.textcolumns):
+			self.values[i].append(0)
+			self.decimals[i].append(0)
+			self.valid[i].append(0)
+			self.set(self.numrows - 1, self.textcolumns + i, row[self.textcolumns + i])
+
+	# Sets one cell from the string the site gave for it
+	def set(self, row, column, datum):
+
+		if(column < self.textcolumns):
+			self.text[column][row] = internString(datum)
+			return
+
+		i = column - self.textcolumns
+		self.overrides.pop((row, column), None)
+
+		if(datum == MISSING_VALUE):
+			self.valid[i][row] = 0
+		elif(NUMBER_FORMAT.match(datum) and formatNumber(float(datum), len((datum + ".").split(".")[1])) == datum):
+			self.values[i][row] = float(datum)
+			self.decimals[i][row] = len((datum + ".").split(".")[1])
+			self.valid[i][row] = 1
+		else:
+			# not something we can store as a number and get back unchanged, so we keep it as it is
+			self.overrides[(row, column)] = datum
+			self.valid[i][row] = 0
+
+	# Gets one cell back as a string, as it would be written out
+	def get(self, row, column):
+
+		if(column < self.textcolumns):
+			return self.text[column][row]
+
+		i = column - self.textcolumns
+
+		if((row, column) in self.overrides):
+			return self.overrides[(row, column)]
+		elif(self.valid[i][row] == 0):
+			return MISSING_VALUE
+		else:
+			return formatNumber(self.values[i][row], self.decimals[i][row])
+
+	# Gets a numeric column as its array of values and the mask of which values are filled in
+	def numericColumn(self, column):
+		return self.values[column - self.textcolumns], self.valid[column - self.textcolumns]
+
+	# Yields each row as a list of strings, ready to be written to a csv file
+	def iterRows(self):
+
+		for row in range(self.numrows):
+			datarow = []
+
+			for column in range(self.numcolumns):
+				datarow.append(self.get(row, column))
+
+			yield datarow
+
+# Makes an empty table shaped for one of the datasets: for the subunit datasets, a row is the
+# subunit's name and ID and its data; for the others, it is a whole row of the output file
+def newDatabase(dataset):
+
+	if(dataset == COUNTY_DATASET):
+		return ColumnTable(len(COUNTY_HEADERS) - COUNTY_NUM_HEADER_VARIABLES, 2, 0)
+	elif(dataset == URBAN_DATASET):
+		return ColumnTable(len(URBAN_HEADERS) - URBAN_NUM_HEADER_VARIABLES, 2, 0)
+	elif(dataset == PREFECTURE_DATASET):
+		return ColumnTable(len(PREFECTURE_HEADERS) - PREFECTURE_NUM_HEADER_VARIABLES, 2, 0)
+	elif(dataset == NATIONAL_DATASET):
+		return ColumnTable(len(NATIONAL_HEADERS), NATIONAL_NUM_HEADER_VARIABLES, NATIONAL_NUM_HEADER_VARIABLES-1)
+	elif(dataset == PROVINCE_DATASET):
+		return ColumnTable(len(PROVINCE_HEADERS), PROVINCE_NUM_HEADER_VARIABLES, PROVINCE_NUM_HEADER_VARIABLES-1)
+
+# Returns the shared copy of a name or ID string, so that each one is only stored once
+def internString(string):
+	return internedStrings.setdefault(string, string)
+
+# Prints a number with the given number of decimal places
+def formatNumber(value, decimals):
+	return "%.*f" % (decimals, value)
+
+# A little helper function to find the appropriate row index in the database
+# returns -1 if not found, so that the code will throw an error
+# name offset is what column in the data the name is
+def findRowIndex(database, name, nameoffset):
+
+	# This strips off the tailing spaces; some of the dropdowns have extra spaces at the end
+	# which causes some obvious problems
+	cleanedname = name.rstrip()
+
+	return database.index.get(cleanedname, -1)
+
+# Yields the rows of the output for one year/province set, one line of the csv file each
+# note: provincetuple specifies province ID and name.
+# note: hassum indicates whether the first row is a summation row. If so, the 4th column will be a 
+# flag that indicates this, otherwise will just be a zero.
+def enterData(database, provincetuple, year, dataset):
+	
+	for i, row in enumerate(database.iterRows()):
+	
+		## note that to add the additional control data, we have to put them
+		## on in reverse, as insert works like a 'push'
+	
+		# this is for if the first row is a summation row
+		if(dataset == URBAN_DATASET):
+			if(i == 0):
+				row.insert(0, 1)
+			else:
+				row.insert(0, 0)
+		elif(dataset==PREFECTURE_DATASET):
+			# This marks if it is a province subtotal; there is also a possibility of a district subtotal
+			if(i == 0):
+				row.insert(0, 1)
+				row.insert(0, 0)
+			elif(i == 1 and row[0].startswith("Districts")):
+				row.insert(0, 1)
+				row.insert(0, 1)
+			else:
+				row.insert(0, 0)
+				
+				# This marks the district subtotals
+				if(row[1].startswith("Districts")):
+					row.insert(0, 1)
+				else:
+					row.insert(0, 0)					
+				
+		elif(dataset==COUNTY_DATASET):
+			# we don't have any special columns for county data
+			pass
+
+		if(dataset != PROVINCE_DATASET and dataset != NATIONAL_DATASET):
+			# provinces don't need anything added
+			row.insert(0, provincetuple[1])
+			row.insert(0, provincetuple[0])
+			row.insert(0, year)
+
+		# once we have a well-formed entry, it is ready to go out
+		yield row
+
+# Writes the units of work a crawl yields (see crawlUnits) to the dataset's csv files as they come,
+# each year to its own file with multifile, and notes each one in the journal once it is on disk
+def writeUnits(dataset, years, units, csvfiles, multifile):
+
+	for year, province, rows in units:
+		if(multifile == True and year != ""):
+			csvfile = csvfiles[years.index(year)]
+		else:
+			csvfile = csvfiles[0]
+
+		csvfile.writerows(rows)
+		crawlJournals[dataset].recordUnit(dataset, year, province, csvfile)
+
+# One row of a dataset's output, as iterRecords yields it. row is the row as it would be written to
+# the csv file; get and asDict give its columns as Python values instead: the year and the 0/1 flag
+# columns as ints, the names and IDs as they are, the data as floats, and None for a missing value.
+# The odd data cell that isn't a number at all is left as the site's own text
+class Record(object):
+
+	__slots__ = ['dataset', 'row']
+
+	def __init__(self, dataset, row):
+		self.dataset = dataset
+		self.row = row
+
+	def __repr__(self):
+		return "Record(%r, %r)" % (self.dataset, self.row)
+
+	# Gets one column by its header, such as 'Year' or 'Total Population (10000 persons)'
+	def get(self, header):
+
+		column = getHeaders(self.dataset).index(header)
+
+		return typedValue(self.dataset, column, self.row[column])
+
+	# Gets the whole row as a dictionary from header to value
+	def asDict(self):
+		return dict((header, typedValue(self.dataset, column, self.row[column])) for column, header in enumerate(getHeaders(self.dataset)))
+
+# The number of columns at the start of a dataset's rows that say which unit the row is: the year,
+# the province, the flags and, for the subunit datasets, the subunit's name and ID
+def numKeyColumns(dataset):
+
+	if(dataset == NATIONAL_DATASET or dataset == PROVINCE_DATASET):
+		return getNumHeaderVariables(dataset)
+	else:
+		return getNumHeaderVariables(dataset) + 2
+
+# Turns one cell of an output row into a Python value; see Record
+def typedValue(dataset, column, datum):
+
+	if(column < numKeyColumns(dataset)):
+		if(column == 0 or getHeaders(dataset)[column].startswith("Is")):
+			try:
+				return int(datum)
+			except ValueError:
+				return datum
+		else:
+			return datum
+	elif(datum == MISSING_VALUE):
+		return None
+	elif(NUMBER_FORMAT.match(datum)):
+		return float(datum)
+	else:
+		return datum
+
+# Loads the dropdown lists that earlier runs saved in DROPDOWN_FILE
+def loadDropdownRegistry():
+	global dropdownRegistry
+
+	if(os.path.isfile(DROPDOWN_FILE)):
+		registryfile = open(DROPDOWN_FILE, 'r')
+		dropdownRegistry = json.load(registryfile)
+		registryfile.close()
+
+# Saves the dropdown lists to DROPDOWN_FILE, if anything has changed since they were loaded
+def saveDropdownRegistry():
+	global dropdownRegistryChanged
+
+	with dropdownRegistryLock:
+		if(dropdownRegistryChanged == False):
+			return
+
+		registryfile = open(DROPDOWN_FILE + ".tmp", 'w')
+		json.dump(dropdownRegistry, registryfile, indent=1, sort_keys=True)
+		registryfile.close()
+
+		os.rename(DROPDOWN_FILE + ".tmp", DROPDOWN_FILE)
+		dropdownRegistryChanged = False
+
+# Gets a dropdown list out of the registry as a list of (ID, name) tuples, or None if it isn't there;
+# a province of "" gets the year's list of provinces
+def registeredDropdown(dataset, year, province):
+
+	with dropdownRegistryLock:
+		entries = dropdownRegistry.get(dataset, {}).get(str(year), {}).get(province)
+
+	if(entries == None):
+		return None
+
+	return [tuple(entry) for entry in entries]
+
+# Puts a dropdown list, as (ID, name) tuples, into the registry, saying so if it has changed since
+# the last time it was seen
+def registerDropdown(dataset, year, province, entries, verbose):
+	global dropdownRegistryChanged, unitIdIndex
+
+	entries = [(unicode(id), unicode(name)) for id, name in entries]
+
+	with dropdownRegistryLock:
+		previous = registeredDropdown(dataset, year, province)
+
+		if(previous == entries):
+			return
+
+		if(previous != None and verbose==True):
+			added = set(entries) - set(previous)
+			removed = set(previous) - set(entries)
+
+			if(province == ""):
+				print "\tThe list of provinces in %s has changed since it was last seen: %s added, %s gone" % (year, len(added), len(removed))
+			else:
+				print "\tThe list of subunits of %s in %s has changed since it was last seen: %s added, %s gone" % (province, year, len(added), len(removed))
+
+		dropdownRegistry.setdefault(dataset, {}).setdefault(str(year), {})[province] = entries
+		dropdownRegistryChanged = True
+		unitIdIndex = None
+
+# Checks the province dropdown on a page against the year's list in the registry; a crawl that
+# used a saved list that the site has since changed may have missed provinces, and this is
+# where we find out. Returns False if the page has no province dropdown to check
+def checkProvinceList(dataset, year, page):
+
+	if(page.soup == None and PROVINCE_DD not in page.dropdowns):
+		return False
+
+	provinces = parseDropdown(page, PROVINCE_DD)
+
+	if(provinces != registeredDropdown(dataset, year, "")):
+		print "The list of provinces in %s has changed since it was saved in %s." % (year, DROPDOWN_FILE)
+		print "Run again with --refresh-dropdowns to pick up the provinces this run has missed."
+		registerDropdown(dataset, year, "", provinces, False)
+
+	return True
+
+# Looks up a subunit's ID by its name, in the lists of subunits the registry has for the year.
+# Returns None if there isn't exactly one subunit of that name
+def lookupUnitId(dataset, year, name):
+	global unitIdIndex
+
+	with dropdownRegistryLock:
+		if(unitIdIndex == None):
+			unitIdIndex = {}
+
+			for registrydataset in dropdownRegistry:
+				for registryyear in dropdownRegistry[registrydataset]:
+					for province in dropdownRegistry[registrydataset][registryyear]:
+						if(province == ""):
+							continue
+
+						for unitid, unitname in dropdownRegistry[registrydataset][registryyear][province]:
+							unitIdIndex.setdefault((registrydataset, registryyear, unitname.rstrip()), []).append(unitid)
+
+		unitids = unitIdIndex.get((dataset, str(year), name.rstrip()), [])
+
+	if(len(unitids) != 1):
+		return None
+
+	return unitids[0]
@@ -0,0 +1,132 @@
+# file: externalsort.py
+#
+# purpose: sorts more rows than fit in memory, for the merge scripts. The rows are sorted in runs
+# that fit in a memory budget, each run is written out to a temporary file, and the runs are then
+# merged back together as they are read, so that only one row of each run is in memory at a time.
+#
+# created by: Andrew MacDonald on 10/18/26.
+#
+# copyright: (c) 2016 Andrew MacDonald. All rights reserved.
+# email: andrewwm@gmail.com
+
+import heapq
+import marshal
+import os
+import os.path
+import sys
+import tempfile
+
+####
+#### GLOBAL VARIABLES
+####
+
+# the most runs that are read from at once; any more are merged down in several passes, so as
+# not to run out of open files
+MAX_OPEN_RUNS = 64
+
+# roughly what the tuples that go around each row in a run cost, on top of the row itself
+ENTRY_OVERHEAD = 128
+
+####
+#### FUNCTIONS
+####
+
+# Sorts (key, row) pairs by key, holding no more than about budget bytes of rows in memory at a
+# time, and yields them back in order. Rows with the same key come back in the order they were
+# given in. The keys and rows can be anything marshal can save: numbers, strings, and lists and
+# tuples of them. The temporary files are removed once the last row is yielded, or the generator
+# is closed
+def sortRows(entries, budget, tempdir=None):
+
+	runs = []
+	run = []
+	size = 0
+
+	try:
+		# the position of each row is sorted on after its key, so equal keys keep their order
+		for order, (key, row) in enumerate(entries):
+			run.append((key, order, row))
+			size = size + rowSize(row)
+
+			if(size >= budget):
+				runs.append(writeRun(run, tempdir))
+				run = []
+				size = 0
+
+		run.sort()
+
+		# everything fitted in memory, so there is nothing to merge
+		if(runs == []):
+			for key, order, row in run:
+				yield key, row
+
+			return
+
+		if(run != []):
+			runs.append(writeRun(run, tempdir))
+			run = []
+
+		while(len(runs) > MAX_OPEN_RUNS):
+			runs = [mergeRuns(runs[i:i+MAX_OPEN_RUNS], tempdir) for i in range(0, len(runs), MAX_OPEN_RUNS)]
+
+		for key, order, row in heapq.merge(*[readRun(path) for path in runs]):
+			yield key, row
+	finally:
+		for path in runs:
+			if(os.path.isfile(path)):
+				os.remove(path)
+
+# Roughly how much memory a row takes up, fields and all
+def rowSize(row):
+
+	size = ENTRY_OVERHEAD + sys.getsizeof(row)
+
+	for field in row:
+		size = size + sys.getsizeof(field)
+
+	return size
+
+# Sorts a run and writes it out to a temporary file; returns the file's path
+def writeRun(run, tempdir):
+
+	run.sort()
+
+	handle, path = tempfile.mkstemp(prefix="externalsort", suffix=".run", dir=tempdir)
+	runfile = os.fdopen(handle, "wb")
+
+	for entry in run:
+		marshal.dump(entry, runfile)
+
+	runfile.close()
+
+	return path
+
+# Reads the entries of a run back, one at a time
+def readRun(path):
+
+	runfile = open(path, "rb")
+
+	try:
+		while(True):
+			try:
+				yield marshal.load(runfile)
+			except EOFError:
+				return
+	finally:
+		runfile.close()
+
+# Merges several runs into one new run, removing the old ones; returns the new run's path
+def mergeRuns(paths, tempdir):
+
+	handle, path = tempfile.mkstemp(prefix="externalsort", suffix=".run", dir=tempdir)
+	runfile = os.fdopen(handle, "wb")
+
+	for entry in heapq.merge(*[readRun(runpath) for runpath in paths]):
+		marshal.dump(entry, runfile)
+
+	runfile.close()
+
+	for runpath in paths:
+		os.remove(runpath)
+
+	return path
@@ -7,9 +7,14 @@
 # copyright: (c) 2016 Andrew MacDonald. All rights reserved.
 # email: andrewwm@gmail.com
 
+import cStringIO
 import csv 
+import getopt
+import multiprocessing
 import sys
 
+import externalsort
+
 ####
 #### GLOBAL VARIABLES
 ####
@@ -33,28 +38,90 @@ STATA_NAME = 5
 STATA_PROV_NAME = 3
 STATA_COLUMNS = 248
 
+# the memory budget of -m is given in megabytes
+MEGABYTE = 1024 * 1024
+
+# what int() reads as COUNTY_MISSING_VALUE, for blanking the missing values out a whole table at
+# a time with -p: -9999 with any leading zeros, and whitespace around it or after the minus sign
+MISSING_PATTERN = r"^\s*-\s*0*9999\s*$"
+
+# -p merges and writes the rows this many at a time, through a buffer this big; each chunk of
+# merged rows is held as a table and as lists while it is written
+WRITE_CHUNK_ROWS = 2000
+WRITE_BUFFER = 1024 * 1024
+
+# the province of a county is in the digits of its ID above this; -j merges a province at a time
+PROVINCE_PLACE = 1000
+
+# the parsed rows of the two files for -j, in each worker process; see initPartitions
+parallelStataRows = []
+parallelCountyRows = []
+
+# numpy and pandas, which are only imported for -p; see loadPandas
+numpy = None
+pandas = None
+
 ####
 #### FUNCTIONS
 ####
 
-def findRecord(data, countyreader_list, found_counties):
+# Parses one line of the county file, which stata/excel leave as a single field; returns [] for a blank line
+def parseCounty(row):
+
+	if(row == []):
+		return []
+
+	rowreader = csv.reader(row)
+
+	return rowreader.next()
+
+# The key a county is joined on: its ID and year
+def countyKey(rowlist):
+	return (int(rowlist[COUNTY_ID]), int(rowlist[COUNTY_YEAR]))
 
+# Builds the index the stata rows are joined on: each county row, parsed, by its (ID, year). Only
+# the first row with a key is kept, as that is the one findRecord used to find by going down the
+# file; any others are printed out as duplicates
+def indexCounties(countyreader_list):
+
+	countyindex = {}
+	duplicates = 0
 	i = 0
 
 	for row in countyreader_list:
-		# avoiding header row
+		# avoiding header row, and blank lines
 		if(i != 0):
-			rowreader = csv.reader(row)
-			rowlist = rowreader.next()
-		
-			# check to make sure year and ID are matching
-			if(int(rowlist[COUNTY_ID]) == int(data[STATA_ID])):
-				if(int(rowlist[COUNTY_YEAR]) == int(data[STATA_YEAR])):				
-					found_counties.append(rowlist)
-					return rowlist, found_counties
-			
+			rowlist = parseCounty(row)
+
+			if(rowlist != []):
+				key = countyKey(rowlist)
+
+				if(key in countyindex):
+					print "Duplicate county entry"
+					print "\t\tcounty id is: " + rowlist[COUNTY_ID] + "; county year is: " + rowlist[COUNTY_YEAR]
+
+					duplicates = duplicates + 1
+				else:
+					countyindex[key] = rowlist
+
 		i = i+1
-					
+
+	if(duplicates > 0):
+		print "num duplicates: " + str(duplicates)
+
+	return countyindex
+
+def findRecord(data, countyindex, found_counties):
+
+	# check to make sure year and ID are matching
+	key = (int(data[STATA_ID]), int(data[STATA_YEAR]))
+
+	if(key in countyindex):
+		# a copy, as concatRecords changes the record it is given
+		rowlist = list(countyindex[key])
+		found_counties.add(key)
+		return rowlist, found_counties
+
 	print "Didn't find entry"
 	print "\t\tstata id is: " + data[STATA_ID] + "; stata year is: " + data[STATA_YEAR]
 
@@ -87,15 +154,8 @@ def concatRecords(county_record, stata_record):
 
 	return row
 
-def searchCountyfile(record, found_counties):
-	
-	for data in found_counties:
-		if(data[COUNTY_ID] == record[COUNTY_ID]):
-			if(data[COUNTY_YEAR] == record[COUNTY_YEAR]):
-				return True
-	
-	return False
-
+# Lines a county that no stata row matched up under the merged file's headers: blank stata
+# columns, with the province name in the provname column, as concatRecords has it
 def prepCountyForWriting(record):
 	
 	emptyStata = []
@@ -103,91 +163,625 @@ def prepCountyForWriting(record):
 	for i in range(STATA_COLUMNS):
 		emptyStata.append("")
 	
-	return emptyStata + record
+	row = emptyStata + record
+	row.insert(STATA_PROV_NAME, record[COUNTY_PROV_NAME])
 
-##########################################################
-################### START OF MAIN CODE ###################
-##########################################################
+	return row
 
-# check command line; sys.argv[0] is the name of the file, [1] is the first arg
-try:
-	print sys.argv[1]
+# The merge as it has always been done: both files are read into memory, and each stata row is
+# looked up in the index of the county rows. Writes the merged rows, and with doall the counties
+# that weren't matched after them
+def mergeInMemory(statareader, countyreader, writer, doall):
 
-	if(sys.argv[1] == "-a"):
-		doall = True
-	else:
-		doall = False
-except:
-	doall = False
+	# there's something funky about the way stata/excel outputs the file. so we have to 
+	# dump everything into a  mega list and process it while doing the loops
+	statareader_list = []
+	countyreader_list = []
+
+	statareader_list.extend(statareader)
+	countyreader_list.extend(countyreader)
+
+	# the county rows by (ID, year), so each stata row is looked up rather than searched for
+	countyindex = indexCounties(countyreader_list)
+
+	# keeps the (ID, year) of each matched county, so that when we're done appending county data
+	# to the stata rows, -a can add the counties that weren't matched
+	found_counties = set()
 
-# open csv files
-statareader = csv.reader(open(STATAFILE, 'rU'), dialect=csv.excel_tab)
-countyreader = csv.reader(open(COUNTYFILE, 'rU'), dialect=csv.excel_tab)
+	i = 0
+	n = 0
+
+	# Loops through all of the stata entries; for those with a matching county record, it concats the two
+	for row in statareader_list:
+		rowreader = csv.reader(row)
+		rowlist = rowreader.next()
+		towrite = ""
+		
+		# doing header row
+		if(i == 0):
+			towrite = stataHeader(rowlist)
+		else:
+			foundRecord, found_counties = findRecord(rowlist, countyindex, found_counties)
+
+			# if we have found the record, then concat and write it to file
+			if(foundRecord != NOT_FOUND):
+				towrite = concatRecords(foundRecord, rowlist)
+			else:
+				# blank row for counties if not found
+				blank = [""] * len(COUNTY_HEADERS)
+				towrite = concatRecords(blank, rowlist)
+				
+				n = n+1
+		
+		writer.writerow(towrite)
+		i = i+1
+		
+	printCounts(i, n)
 
-if(doall == True):
-	writer = csv.writer(open(OUT_FILE_ALL, 'wb'))
-else:
-	writer = csv.writer(open(OUT_FILE, 'wb'))
+	# adding back all of the counties we didn't match to a stata record earlier
+	if(doall == True):	  
 
-# there's something funky about the way stata/excel outputs the file. so we have to 
-# dump everything into a  mega list and process it while doing the loops
-statareader_list = []
-countyreader_list = []
+		i = 0
 
-statareader_list.extend(statareader)
-countyreader_list.extend(countyreader)
+		# skips the header row, and blank lines
+		for record in countyreader_list[1:]:
+			record = parseCounty(record)
 
-# keeps a list of matched counties, so that when we're done appending county data
-# to 
-found_counties = []
+			if(record != [] and countyKey(record) not in found_counties):
+				record = prepCountyForWriting(record)
+				writer.writerow(record)
 
-i = 0
-n = 0
+				i = i + 1
+				
+		print "num not found: " + str(i)
 
-# Loops through all of the stata entries; for those with a matching county record, it concats the two
-for row in statareader_list:
-	rowreader = csv.reader(row)
-	rowlist = rowreader.next()
-	towrite = ""
-	
-	# doing header row
-	if(i == 0):
-		rowlist.insert(STATA_PROV_NAME, "provname")
-		towrite = rowlist+COUNTY_HEADERS		
+# The same merge for files too big to read into memory. Both files are sorted by (ID, year) with
+# externalsort, and then joined in one pass down the two of them. The merged rows are sorted back
+# into the order of the stata file, with the unmatched counties after them in the order of the
+# county file, so the output is the same as mergeInMemory's. The sorts share budget bytes of memory
+def mergeSorted(statareader, countyreader, writer, doall, budget):
+
+	# the stata, county and output sorts can each be holding a run at once
+	share = budget / 3
+
+	# the header rows aren't sorted; the stata one goes out first, as it is
+	writer.writerow(stataHeader(parseCounty(statareader.next())))
+	countyreader.next()
+
+	statarows = externalsort.sortRows(stataEntries(statareader), share)
+	counties = countyGroups(externalsort.sortRows(countyEntries(countyreader), share))
+	counts = {'stata':1, 'notfound':0, 'unmatched':0}
+
+	for key, row in externalsort.sortRows(joinSorted(statarows, counties, doall, counts), share):
+		writer.writerow(row)
+
+	printCounts(counts['stata'], counts['notfound'])
+
+	if(doall == True):
+		print "num not found: " + str(counts['unmatched'])
+
+# The merge done with pandas a column at a time, rather than a row at a time. The files are read as
+# mergeInMemory reads them, into tables of strings with the IDs and years as integers, and all of
+# the stata rows are joined to the county rows at once. The -9999s are blanked out and the county
+# names copied over with a mask over the whole table. A row that isn't as wide as its file's
+# header, which concatRecords would line up differently, is merged on its own with concatRecords,
+# so the output is the same byte for byte as mergeInMemory's
+def mergeVectorized(statareader, countyreader, writer, doall):
+
+	loadPandas()
+
+	statarows = [parseCounty(row) for row in statareader]
+	countyrows = [row for row in [parseCounty(row) for row in countyreader][1:] if row != []]
+
+	statawidth = len(statarows[0])
+	countywidth = len(COUNTY_HEADERS)
+	header = stataHeader(statarows[0])
+	statarows = statarows[1:]
+
+	# the keys of each file, with the county rows' positions
+	statakeys = pandas.DataFrame({'id':numpy.array([row[STATA_ID] for row in statarows], dtype=object).astype(numpy.int64), 'year':numpy.array([row[STATA_YEAR] for row in statarows], dtype=object).astype(numpy.int64)})
+	countykeys = pandas.DataFrame({'id':numpy.array([row[COUNTY_ID] for row in countyrows], dtype=object).astype(numpy.int64), 'year':numpy.array([row[COUNTY_YEAR] for row in countyrows], dtype=object).astype(numpy.int64), 'position':numpy.arange(len(countyrows))})
+
+	# as with indexCounties, the first row with a key is the one that is joined to
+	duplicated = countykeys.duplicated(['id', 'year'], keep='first').values
+
+	for position in numpy.flatnonzero(duplicated):
+		print "Duplicate county entry"
+		print "\t\tcounty id is: " + countyrows[position][COUNTY_ID] + "; county year is: " + countyrows[position][COUNTY_YEAR]
+
+	if(duplicated.sum() > 0):
+		print "num duplicates: " + str(duplicated.sum())
+
+	# the county row each stata row joins to, or -1; a left join keeps the stata rows in their order
+	joined = statakeys.merge(countykeys[~duplicated], how='left', on=['id', 'year'])['position'].fillna(-1).values.astype(numpy.int64)
+	matched = joined != -1
+
+	for position in numpy.flatnonzero(~matched):
+		print "Didn't find entry"
+		print "\t\tstata id is: " + statarows[position][STATA_ID] + "; stata year is: " + statarows[position][STATA_YEAR]
+
+	# the rows that can be merged a whole table at a time
+	# (the width on the end is what a -1, for no county row, picks out)
+	statalengths = numpy.array([len(row) for row in statarows], dtype=numpy.int64)
+	countylengths = numpy.array([len(row) for row in countyrows] + [countywidth], dtype=numpy.int64)
+	regular = (statalengths == statawidth) & (countylengths[joined] == countywidth) & (statawidth > STATA_NAME)
+
+	# the county rows that are joined to, with their -9999s blanked out. Each different string is
+	# only checked for being a -9999 once
+	used = numpy.unique(joined[regular & matched])
+	countyvalues = objectTable([countyrows[position] for position in used], countywidth)
+
+	if(len(used) > 0):
+		codes, uniques = pandas.factorize(countyvalues.ravel())
+		missing = pandas.Series(uniques).str.match(MISSING_PATTERN).values.astype(bool)
+		countyvalues[missing[codes].reshape(countyvalues.shape)] = ""
+
+	writer.writerow(header)
+
+	# the merged rows are made and written a chunk at a time, so that only one chunk of them is
+	# ever held as lists on top of the rows that were read in
+	for start in range(0, len(statarows), WRITE_CHUNK_ROWS):
+		positions = numpy.arange(start, min(start + WRITE_CHUNK_ROWS, len(statarows)))
+		merged = dict(zip(positions[regular[positions]], mergeTables(statarows, joined, matched, positions[regular[positions]], used, countyvalues, statawidth)))
+
+		# the other rows, merged one at a time
+		for position in positions[~regular[positions]]:
+			if(matched[position] == True):
+				merged[position] = concatRecords(list(countyrows[joined[position]]), statarows[position])
+			else:
+				merged[position] = concatRecords([""] * len(COUNTY_HEADERS), statarows[position])
+
+		writer.writerows([merged[position] for position in positions])
+
+	printCounts(len(statarows) + 1, (~matched).sum())
+
+	# adding back all of the counties whose key no stata row had, in the order of the county file
+	if(doall == True):
+		keyjoined = numpy.zeros(len(countyrows), dtype=bool)
+		keyjoined[joined[matched]] = True
+		firstofkey = countykeys.groupby(['id', 'year'], sort=False)['position'].transform('first').values
+		unmatched = numpy.flatnonzero(~keyjoined[firstofkey])
+
+		for start in range(0, len(unmatched), WRITE_CHUNK_ROWS):
+			writer.writerows(prepCountiesForWriting([countyrows[position] for position in unmatched[start:start+WRITE_CHUNK_ROWS]]))
+
+		print "num not found: " + str(len(unmatched))
+
+# Merges the stata rows at positions, which are all as wide as the stata header and are joined to
+# county rows as wide as the county header (or to none), a whole table at a time, for
+# mergeVectorized. The joined county rows are looked up in countyvalues, which has the county rows
+# at used with their -9999s blanked out. Returns the merged rows, as lists
+def mergeTables(statarows, joined, matched, positions, used, countyvalues, statawidth):
+
+	countywidth = len(COUNTY_HEADERS)
+
+	if(len(positions) == 0):
+		return []
+
+	# the stata side, as a table of strings
+	statapart = objectTable([statarows[position] for position in positions], statawidth)
+
+	# the county side, lined up with the stata rows, with blanks for those that weren't matched
+	found = matched[positions]
+	countypart = numpy.empty((len(positions), countywidth), dtype=object)
+	countypart[:] = ""
+	countypart[found] = countyvalues[numpy.searchsorted(used, joined[positions][found])]
+
+	# the county's name goes over the bogus one wherever the county has one
+	names = countypart[:, COUNTY_NAME]
+	statapart[names != "", STATA_NAME] = names[names != ""]
+
+	return numpy.hstack([statapart[:, :STATA_PROV_NAME], countypart[:, COUNTY_PROV_NAME:COUNTY_PROV_NAME+1], statapart[:, STATA_PROV_NAME:], countypart]).tolist()
+
+# prepCountyForWriting for a list of counties at once, for mergeVectorized: the ones as wide as
+# the county headers are lined up a whole table at a time, and the others one by one
+def prepCountiesForWriting(records):
+
+	countywidth = len(COUNTY_HEADERS)
+	regular = [position for position, record in enumerate(records) if len(record) == countywidth]
+
+	counties = objectTable([records[position] for position in regular], countywidth)
+
+	emptyStata = numpy.empty((len(regular), STATA_COLUMNS), dtype=object)
+	emptyStata[:] = ""
+
+	rows = records[:]
+
+	for position, row in zip(regular, numpy.hstack([emptyStata[:, :STATA_PROV_NAME], counties[:, COUNTY_PROV_NAME:COUNTY_PROV_NAME+1], emptyStata[:, STATA_PROV_NAME:], counties]).tolist()):
+		rows[position] = row
+
+	for position in range(len(records)):
+		if(len(records[position]) != countywidth):
+			rows[position] = prepCountyForWriting(records[position])
+
+	return rows
+
+# Makes a numpy table of strings out of rows that are all width wide. The values are kept as the
+# strings they were read as, rather than as numbers, so that they are written back out exactly as
+# they came in (with their own decimal places, leading zeros and spaces)
+def objectTable(rows, width):
+
+	table = numpy.empty((len(rows), width), dtype=object)
+
+	if(len(rows) > 0):
+		table[:] = rows
+
+	return table
+
+# Imports numpy and pandas for -p, exiting if they aren't installed
+def loadPandas():
+	global numpy, pandas
+
+	try:
+		import numpy
+		import pandas
+	except ImportError:
+		print "Merging with -p needs numpy and pandas, which aren't installed"
+		sys.exit(1)
+
+# The merge split up by province, with the provinces merged side by side in a pool of worker
+# processes. Each file's rows go to the province of their county ID by their line numbers, so the
+# merged rows can be put back in the order mergeInMemory writes them in; the output is the same
+# byte for byte. The counties that weren't found and the duplicates are printed a province at a time
+def mergeParallel(statareader, countyreader, outfile, doall, workers):
+
+	statarows = [parseCounty(row) for row in statareader]
+	countyrows = [parseCounty(row) for row in countyreader]
+
+	writer = csv.writer(outfile)
+	writer.writerow(stataHeader(statarows[0]))
+
+	# the line numbers of the stata and county rows of each province
+	partitions = {}
+
+	for number in range(1, len(statarows)):
+		partitions.setdefault(int(statarows[number][STATA_ID]) // PROVINCE_PLACE, ([], []))[0].append(number)
+
+	for number in range(1, len(countyrows)):
+		# skips blank lines
+		if(countyrows[number] != []):
+			partitions.setdefault(countyKey(countyrows[number])[0] // PROVINCE_PLACE, ([], []))[1].append(number)
+
+	jobs = [partitions[province] + (doall,) for province in sorted(partitions)]
+
+	# the jobs are only line numbers; the rows go to each worker once, when it starts
+	if(workers == 1):
+		initPartitions(statarows, countyrows)
+		results = map(mergePartition, jobs)
 	else:
-		foundRecord, found_counties = findRecord(rowlist, countyreader_list, found_counties)
+		pool = multiprocessing.Pool(workers, initPartitions, (statarows, countyrows))
+		results = pool.map(mergePartition, jobs)
+		pool.close()
+		pool.join()
+
+	merged = [None] * len(statarows)
+	unmatched = [None] * len(countyrows)
+	duplicates = 0
+	notfound = 0
+
+	for mergedlines, unmatchedlines, duplicatekeys, notfoundkeys in results:
+		mergedlines.place(merged)
+		unmatchedlines.place(unmatched)
+
+		for id, year in duplicatekeys:
+			print "Duplicate county entry"
+			print "\t\tcounty id is: " + id + "; county year is: " + year
+
+		for id, year in notfoundkeys:
+			print "Didn't find entry"
+			print "\t\tstata id is: " + id + "; stata year is: " + year
+
+		duplicates = duplicates + len(duplicatekeys)
+		notfound = notfound + len(notfoundkeys)
+
+	if(duplicates > 0):
+		print "num duplicates: " + str(duplicates)
 
-		# if we have found the record, then concat and write it to file
-		if(foundRecord != NOT_FOUND):
-			towrite = concatRecords(foundRecord, rowlist)
+	# the rows come back as csv lines, ready to go out as they are
+	outfile.write("".join(merged[1:]))
+
+	printCounts(len(statarows), notfound)
+
+	if(doall == True):
+		unmatched = [line for line in unmatched if line != None]
+		outfile.write("".join(unmatched))
+
+		print "num not found: " + str(len(unmatched))
+
+# Hands the parsed rows of the two files to a worker process of mergeParallel. Where processes are
+# forked, as on Linux and OS X, the workers get the rows as they are, without them being sent over;
+# elsewhere they are pickled over to each worker once
+# note: only called from mergeParallel
+def initPartitions(statarows, countyrows):
+	global parallelStataRows, parallelCountyRows
+
+	parallelStataRows = statarows
+	parallelCountyRows = countyrows
+
+# Merges one province for mergeParallel, in a worker process, as mergeInMemory would. Takes the
+# line numbers of the province's stata and county rows, and returns the merged rows and the
+# unmatched counties as RowFormatters, with the (ID, year) of the duplicate counties and
+# of the stata rows that weren't found, for mergeParallel to print out
+# note: only called from mergeParallel
+def mergePartition(job):
+
+	statanumbers, countynumbers, doall = job
+
+	countyindex = {}
+	duplicatekeys = []
+	notfoundkeys = []
+	found_counties = set()
+
+	for number in countynumbers:
+		rowlist = parallelCountyRows[number]
+
+		if(countyKey(rowlist) in countyindex):
+			duplicatekeys.append((rowlist[COUNTY_ID], rowlist[COUNTY_YEAR]))
 		else:
-			# blank row for counties if not found
-			blank = [""] * len(COUNTY_HEADERS)
-			towrite = concatRecords(blank, rowlist)
-			
-			n = n+1
-	
-	writer.writerow(towrite)
-	i = i+1
-	
-print "i: " 
-print i 
-print "\n"
-print "n: "
-print n
+			countyindex[countyKey(rowlist)] = rowlist
 
-# adding back all of the counties we didn't match to a stata record earlier
-if(doall == True):	  
+	mergedlines = RowFormatter()
 
-	i = 0
+	for number in statanumbers:
+		# a copy, as concatRecords changes the record it is given
+		rowlist = list(parallelStataRows[number])
+		key = (int(rowlist[STATA_ID]), int(rowlist[STATA_YEAR]))
 
-	for record in countyreader_list:
-		wasFound = searchCountyfile(record, found_counties)
-		
-		if(wasFound == False):
-			record = prepCountyForWriting(record)
-			writer.writerow(record)
+		if(key in countyindex):
+			found_counties.add(key)
+			mergedlines.add(number, concatRecords(list(countyindex[key]), rowlist))
+		else:
+			notfoundkeys.append((rowlist[STATA_ID], rowlist[STATA_YEAR]))
+			mergedlines.add(number, concatRecords([""] * len(COUNTY_HEADERS), rowlist))
+
+	unmatchedlines = RowFormatter()
+
+	if(doall == True):
+		for number in countynumbers:
+			rowlist = parallelCountyRows[number]
+
+			if(countyKey(rowlist) not in found_counties):
+				unmatchedlines.add(number, prepCountyForWriting(rowlist))
+
+	return mergedlines.close(), unmatchedlines.close(), duplicatekeys, notfoundkeys
+
+# Formats rows as csv lines, exactly as they would be written to the output file, noting the line
+# number each one goes at; for sending the rows back from mergePartition as one string, which is
+# much quicker to send between processes than the rows themselves
+class RowFormatter(object):
+
+	def __init__(self):
+		self.buffer = cStringIO.StringIO()
+		self.writer = csv.writer(self.buffer)
+		self.numbers = []
+		self.offsets = [0]
+		self.text = None
+
+	def add(self, number, row):
+
+		self.writer.writerow(row)
+		self.numbers.append(number)
+		self.offsets.append(self.buffer.tell())
+
+	# Finishes the formatting, so the formatter can be sent back; returns itself
+	def close(self):
+
+		self.text = self.buffer.getvalue()
+		self.buffer = None
+		self.writer = None
+
+		return self
+
+	# Puts each line into lines, at its line number
+	def place(self, lines):
+
+		for i, number in enumerate(self.numbers):
+			lines[number] = self.text[self.offsets[i]:self.offsets[i+1]]
+
+# The stata rows as (((ID, year), line number), row), for sorting
+def stataEntries(statareader):
+
+	for number, row in enumerate(statareader):
+		rowlist = parseCounty(row)
+
+		yield ((int(rowlist[STATA_ID]), int(rowlist[STATA_YEAR])), number), rowlist
+
+# The county rows as (((ID, year), line number), row), for sorting; blank lines are left out
+def countyEntries(countyreader):
+
+	for number, row in enumerate(countyreader):
+		rowlist = parseCounty(row)
+
+		if(rowlist != []):
+			yield (countyKey(rowlist), number), rowlist
+
+# Goes through the sorted county rows a key at a time, yielding the key and its rows, (line number,
+# row), in the order of the file. As in indexCounties, any rows after the first are printed out as
+# duplicates; the first is the one the stata rows are joined to
+def countyGroups(countyrows):
+
+	group = []
+	duplicates = 0
+
+	for (key, number), rowlist in countyrows:
+		if(group != [] and key != group[0][0]):
+			yield group[0][0], [(entrynumber, entry) for entrykey, entrynumber, entry in group]
+			group = []
+
+		if(group != []):
+			print "Duplicate county entry"
+			print "\t\tcounty id is: " + rowlist[COUNTY_ID] + "; county year is: " + rowlist[COUNTY_YEAR]
+
+			duplicates = duplicates + 1
+
+		group.append((key, number, rowlist))
+
+	if(group != []):
+		yield group[0][0], [(entrynumber, entry) for entrykey, entrynumber, entry in group]
+
+	if(duplicates > 0):
+		print "num duplicates: " + str(duplicates)
+
+# Joins the sorted stata rows to the sorted county groups, going down both at once. Yields the
+# merged rows keyed by (0, stata line number), and with doall the unmatched counties keyed by
+# (1, county line number), so that sorting on the key puts them in the order they are written in
+def joinSorted(statarows, counties, doall, counts):
+
+	group = next(counties, None)
+	matched = False
+
+	for (key, number), rowlist in statarows:
+		# the counties before this stata row's key that no stata row had
+		while(group != None and group[0] < key):
+			if(matched == False and doall == True):
+				for entry in unmatchedCounties(group, counts):
+					yield entry
+
+			group = next(counties, None)
+			matched = False
+
+		if(group != None and group[0] == key):
+			matched = True
+
+			# a copy, as concatRecords changes the record it is given
+			towrite = concatRecords(list(group[1][0][1]), rowlist)
+		else:
+			print "Didn't find entry"
+			print "\t\tstata id is: " + rowlist[STATA_ID] + "; stata year is: " + rowlist[STATA_YEAR]
+
+			towrite = concatRecords([""] * len(COUNTY_HEADERS), rowlist)
+			counts['notfound'] = counts['notfound'] + 1
+
+		counts['stata'] = counts['stata'] + 1
+
+		yield (0, number), towrite
+
+	while(group != None):
+		if(matched == False and doall == True):
+			for entry in unmatchedCounties(group, counts):
+				yield entry
+
+		group = next(counties, None)
+		matched = False
+
+# The rows of a county key no stata row had, ready to be written out after the merged rows
+# note: only called from joinSorted
+def unmatchedCounties(group, counts):
+
+	for number, rowlist in group[1]:
+		counts['unmatched'] = counts['unmatched'] + 1
+
+		yield (1, number), prepCountyForWriting(rowlist)
+
+# The header of the merged file: the stata file's, with the province name and the county headers added
+def stataHeader(rowlist):
+
+	rowlist.insert(STATA_PROV_NAME, "provname")
+
+	return rowlist + COUNTY_HEADERS
+
+def printCounts(i, n):
+
+	print "i: " 
+	print i 
+	print "\n"
+	print "n: "
+	print n
+
+# Lets people know how to use the program from the command line
+def usage(error):
+
+	if(error != ""):
+		print "Error: " + error + "\n"
+
+	print "USAGE: mergecountyfiles [-h | --help] [-a] [-m | -p | -j]\n"
+	print "NAME\n\tmergecountyfiles -- merges chinadataonline.org county data with census county data\n"
+	print "DESCRIPTION\n\tJoins each row of " + STATAFILE + " to the row of " + COUNTYFILE + " with the"
+	print "\tsame county ID and year, and writes the merged rows to " + OUT_FILE + ".\n"
+	print "\t-a\tAlso writes the counties that no row was joined to, after the merged\n\t\trows, and writes to " + OUT_FILE_ALL + " instead.\n"
+	print "\t-m\tMerges files that are too big to read into memory, by sorting them on\n\t\tdisk first. Takes the number of megabytes of rows to hold in memory\n\t\tat once. The output is the same.\n"
+	print "\t-p\tMerges a whole table at a time with pandas, which is much faster on big\n\t\tfiles that fit in memory. Needs numpy and pandas. The output is the same.\n"
+	print "\t-j\tMerges the provinces side by side, in the number of processes given.\n\t\tThe output is the same; what is printed along the way comes out a\n\t\tprovince at a time."
+	print ""
+
+	sys.exit(0)
+
+# Parses the command line arguments; returns doall, the memory budget in bytes (or None to merge
+# in memory), whether to merge with pandas and the number of worker processes (or None for none)
+def parseArguments(argv):
+
+	doall = False
+	budget = None
+	vectorized = False
+	workers = None
+
+	try:
+		opts, args = getopt.getopt(argv, "ham:pj:", ["help"])
+	except getopt.GetoptError, err:
+		usage(str(err))
+
+	if(args != []):
+		usage("extraneous argument(s): " + str(args) + " not allowed.")
+
+	for opt, arg in opts:
+		if opt in ("-h", "--help"):
+			usage("")
+		elif(opt == "-a"):
+			doall = True
+		elif(opt == "-m"):
+			try:
+				budget = int(arg) * MEGABYTE
+			except ValueError:
+				budget = 0
+
+			if(budget < 1):
+				usage("the memory budget must be a whole number of megabytes, at least 1")
+		elif(opt == "-p"):
+			vectorized = True
+		elif(opt == "-j"):
+			try:
+				workers = int(arg)
+			except ValueError:
+				workers = 0
+
+			if(workers < 1):
+				usage("the number of processes must be a whole number of at least 1")
+
+	if([budget != None, vectorized, workers != None].count(True) > 1):
+		usage("only one of -m, -p and -j can be used at a time")
+
+	return doall, budget, vectorized, workers
+
+##########################################################
+################### START OF MAIN CODE ###################
+##########################################################
+
+# Runs the merge with the command line arguments in argv
+def main(argv):
+
+	doall, budget, vectorized, workers = parseArguments(argv)
+
+	# open csv files
+	statareader = csv.reader(open(STATAFILE, 'rU'), dialect=csv.excel_tab)
+	countyreader = csv.reader(open(COUNTYFILE, 'rU'), dialect=csv.excel_tab)
+
+	if(doall == True):
+		outfile = open(OUT_FILE_ALL, 'wb', WRITE_BUFFER)
+	else:
+		outfile = open(OUT_FILE, 'wb', WRITE_BUFFER)
+
+	writer = csv.writer(outfile)
+
+	if(workers != None):
+		mergeParallel(statareader, countyreader, outfile, doall, workers)
+	elif(vectorized == True):
+		mergeVectorized(statareader, countyreader, writer, doall)
+	elif(budget == None):
+		mergeInMemory(statareader, countyreader, writer, doall)
+	else:
+		mergeSorted(statareader, countyreader, writer, doall, budget)
+
+	outfile.close()
 
-			i = i + 1
-			
-	print "num not found: " + i		
+if __name__ == '__main__':
+	main(sys.argv[1:])
@@ -8,9 +8,13 @@
 # email: andrewwm@gmail.com
 
 import csv 
+import getopt
+import multiprocessing
 import sys
 import math
 
+import externalsort
+
 ####
 #### GLOBAL VARIABLES
 ####
@@ -27,6 +31,9 @@ RPOP_OFFSET = 1
 ID = 4
 YEAR = 1
 
+# the memory budget of -m is given in megabytes
+MEGABYTE = 1024 * 1024
+
 ####
 #### FUNCTIONS
 ####
@@ -65,9 +72,7 @@ def getProvince(province_code):
 	
 	code = code / PROVINCE_PLACE
 
-	code = floor(code)
-	
-	print "code " + code
+	code = math.floor(code)
 	
 	return code
 
@@ -87,78 +92,223 @@ def checkForDuplicates(row, rowlist):
 					print checkrowlist[ID]
 					print checkrowlist[YEAR]
 
+# The duplicate check for files too big to read into memory: only the ID and year of each row are
+# kept, sorted on disk with externalsort within budget bytes, so that the rows with the same ID and
+# year come out next to each other. Prints what checkForDuplicates does for each row, but in the
+# order of the IDs rather than of the file
+def checkForDuplicatesSorted(reader, budget):
+
+	entries = ((rowlist[ID], rowlist[YEAR]) for rowlist in (csv.reader(row).next() for row in reader))
+	lastkey = None
+	count = 0
+
+	for key, row in externalsort.sortRows(((key, ()) for key in entries), budget):
+		if(key != lastkey):
+			printDuplicates(lastkey, count)
+			lastkey = key
+			count = 0
+
+		count = count + 1
+
+	printDuplicates(lastkey, count)
+
+# Prints an ID and year that count rows have, once for each pair of them, as checkForDuplicates
+# does when it checks each of those rows against all the others
+def printDuplicates(key, count):
+
+	for i in range(count * (count - 1)):
+		print key[0]
+		print key[1]
+
+# The duplicate check split up by province, with the provinces checked side by side in a pool of
+# workers processes. Each row goes to the province of its ID with its line number, so that what
+# is found can be printed in the order of the file: the output is the same as checkForDuplicates
+# gives, row by row
+def checkForDuplicatesParallel(reader, workers):
+
+	# the ID and year of each row, with its line number, by province; IDs that aren't numbers
+	# have a province of their own
+	partitions = {}
+
+	for number, row in enumerate(reader):
+		rowlist = csv.reader(row).next()
+
+		try:
+			province = getProvince(rowlist[ID])
+		except ValueError:
+			province = None
+
+		partitions.setdefault(province, []).append((number, rowlist[ID], rowlist[YEAR]))
+
+	jobs = [partitions[province] for province in sorted(partitions)]
+
+	if(workers == 1):
+		results = map(checkPartition, jobs)
+	else:
+		pool = multiprocessing.Pool(workers)
+		results = pool.map(checkPartition, jobs)
+		pool.close()
+		pool.join()
+
+	duplicates = []
+
+	for result in results:
+		duplicates.extend(result)
+
+	duplicates.sort()
+
+	for number, count, id, year in duplicates:
+		for i in range(count):
+			print id
+			print year
+
+# Finds the rows of one province that have the same ID and year as another row, in a worker
+# process; returns (line number, number of other rows with its ID and year, ID, year) for each
+# note: only called from checkForDuplicatesParallel
+def checkPartition(rows):
+
+	counts = {}
+
+	for number, id, year in rows:
+		counts[(id, year)] = counts.get((id, year), 0) + 1
+
+	return [(number, counts[(id, year)] - 1, id, year) for number, id, year in rows if counts[(id, year)] > 1]
+
+# Lets people know how to use the program from the command line
+def usage(error):
+
+	if(error != ""):
+		print "Error: " + error + "\n"
+
+	print "USAGE: mergepop [-h | --help] [-m | -j] [infile [outfile]]\n"
+	print "NAME\n\tmergepop -- merges census pop data with chinadataonline.org data\n"
+	print "DESCRIPTION\n\tChecks infile for rows with the same ID and year, printing out the ID"
+	print "\tand year of each. Default infile is " + DEFAULT_INFILE + "; default outfile is the"
+	print "\tinfile's name with \"" + DEFAULT_OUTFILE + "\" in front of it.\n"
+	print "\t-m\tChecks files that are too big to read into memory, by sorting them on\n\t\tdisk first. Takes the number of megabytes of rows to hold in memory\n\t\tat once. The duplicates are printed in the order of their IDs.\n"
+	print "\t-j\tChecks the provinces side by side, in the number of processes given.\n\t\tThe output is the same."
+	print ""
+
+	sys.exit(0)
+
 
 ##########################################################
 ################### START OF MAIN CODE ###################
 ##########################################################
 
-specified_infile = ""
-specified_outfile = ""
+# Runs the check with the command line arguments in argv
+def main(argv):
 
-# check command line; sys.argv[0] is the name of the file, [1] is the first arg
-# will first check for an infile, then an outfile
-try:
-	print sys.argv[1]
+	specified_infile = ""
+	specified_outfile = ""
+	budget = None
+	workers = None
 
-	if(sys.argv[1] != ""):
-		specified_infile = sys.argv[1]
-	
+	# check command line; argv has the options
+	# will first check for an infile, then an outfile
 	try:
-		if(sys.argv[2] != ""):
-			specified_outfile = sys.argv[2]
-	except:
-		specified_outfile = ""
-except:
-	specified_infile = ""
+		opts, args = getopt.getopt(argv, "hm:j:", ["help"])
+	except getopt.GetoptError, err:
+		usage(str(err))
 
-print "infile " + specified_infile
-print "outfile " + specified_outfile	
+	for opt, arg in opts:
+		if opt in ("-h", "--help"):
+			usage("")
+		elif(opt == "-m"):
+			try:
+				budget = int(arg) * MEGABYTE
+			except ValueError:
+				budget = 0
 
-# Opening files
-infilename = ""
-outfilename = ""
+			if(budget < 1):
+				usage("the memory budget must be a whole number of megabytes, at least 1")
+		elif(opt == "-j"):
+			try:
+				workers = int(arg)
+			except ValueError:
+				workers = 0
 
-# Doing infile
-if(specified_infile != ""):
-	infilename = specified_infile
-else:
-	infilename = DEFAULT_INFILE
+			if(workers < 1):
+				usage("the number of processes must be a whole number of at least 1")
 
-try:
-	reader = csv.reader(open(infilename, 'rU'), dialect=csv.excel_tab)
-except IOError:
-	print "I/O Error, likely no such infile"
-	sys.exit(0)
+	if(budget != None and workers != None):
+		usage("-m and -j can't be used together")
 
-# Doing outfile
-if(specified_outfile != ""):
-	outfilename = specified_outfile
-else:	
-	outfilename = DEFAULT_OUTFILE+infilename
+	if(len(args) > 2):
+		usage("extraneous argument(s): " + str(args[2:]) + " not allowed.")
 
-try:
-	writer = csv.writer(open(outfilename, 'wb'))	
-except IOError:
-	print "I/O Error opening writer file. Exiting."
-	sys.exit(0)
+	if(len(args) > 0):
+		print args[0]
+		specified_infile = args[0]
+
+	if(len(args) > 1):
+		specified_outfile = args[1]
+
+	print "infile " + specified_infile
+	print "outfile " + specified_outfile	
+
+	# Opening files
+	infilename = ""
+	outfilename = ""
+
+	# Doing infile
+	if(specified_infile != ""):
+		infilename = specified_infile
+	else:
+		infilename = DEFAULT_INFILE
+
+	try:
+		reader = csv.reader(open(infilename, 'rU'), dialect=csv.excel_tab)
+	except IOError:
+		print "I/O Error, likely no such infile"
+		sys.exit(0)
+
+	# Doing outfile
+	if(specified_outfile != ""):
+		outfilename = specified_outfile
+	else:	
+		outfilename = DEFAULT_OUTFILE+infilename
+
+	try:
+		writer = csv.writer(open(outfilename, 'wb'))	
+	except IOError:
+		print "I/O Error opening writer file. Exiting."
+		sys.exit(0)
 	
-reader_list = []
-reader_list.extend(reader)
-i = 0
-
-# Main part of logical code
-for row in reader_list:
-	rowreader = csv.reader(row)
-	rowlist = rowreader.next()
-	towrite = ""
+	# the duplicates are checked for on disk if the file is too big for memory
+	if(budget != None):
+		# the header row isn't checked
+		reader.next()
+		checkForDuplicatesSorted(reader, budget)
+		sys.exit(0)
+
+	# or a province at a time, side by side
+	if(workers != None):
+		# the header row isn't checked
+		reader.next()
+		checkForDuplicatesParallel(reader, workers)
+		sys.exit(0)
+
+	reader_list = []
+	reader_list.extend(reader)
+	i = 0
+
+	# Main part of logical code
+	for row in reader_list:
+		rowreader = csv.reader(row)
+		rowlist = rowreader.next()
+		towrite = ""
 	
-	# doing header row
-	if(i == 0):
-		rowlist.insert(NEW_POPULATION_LOCATION + 1, "rural_popularion_revised")
-		towrite = rowlist
-	else:
-		#towrite = combinePopulation(row)
-		checkForDuplicates(rowlist, reader_list)
+		# doing header row
+		if(i == 0):
+			rowlist.insert(NEW_POPULATION_LOCATION + 1, "rural_popularion_revised")
+			towrite = rowlist
+		else:
+			#towrite = combinePopulation(row)
+			checkForDuplicates(rowlist, reader_list)
 		
-	#writer.writerow(towrite)	
-	i = i+1
+		#writer.writerow(towrite)	
+		i = i+1
+
+if __name__ == '__main__':
+	main(sys.argv[1:])
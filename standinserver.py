@@ -0,0 +1,406 @@
+# file: standinserver.py
+#
+# purpose: a stand-in for chinadataonline.org, for benchmarking and testing chinesedata.py
+# without touching the live site. It serves the four table pages chinesedata.py crawls
+# (countytshow.asp, citytshow.asp, macroyrtshow.asp and macroytshow.asp), with the province
+# and subunit dropdowns and the texttable1 table laid out the way the site lays them out.
+# The pages are made up, but always the same for the same request, so that two crawls can be
+# compared byte for byte; pages recorded by chinesedata.py in its page cache can be served
+# in their place. Pages are gzipped for clients that ask for it, as the site does. The latency,
+# the share of requests that fail with a 500 and the number of provinces and subunits can all
+# be set from the command line.
+#
+# created by: Andrew MacDonald on 10/18/26.
+#
+# copyright: (c) 2016 Andrew MacDonald. All rights reserved.
+# email: andrewwm@gmail.com
+
+import BaseHTTPServer
+import SocketServer
+import ast
+import getopt
+import hashlib
+import json
+import os.path
+import random
+import sys
+import threading
+import time
+import urllib
+import urlparse
+import zlib
+
+####
+#### GLOBAL VARIABLES
+####
+
+# the crawler settings whose page codes and headers the stand-in pages are built from
+SETTINGS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "chinadata", "settings.py")
+
+DEFAULT_PORT = 8765
+DEFAULT_PROVINCES = 4
+DEFAULT_SUBUNITS = 6
+
+# one in this many cells is left empty, as the site does for missing data
+MISSING_ONE_IN = 13
+
+# the national pages have a row for each of these years, whatever year is asked for
+NATIONAL_YEARS = range(1947, 2013)
+
+# what the login page says to a subscriber; chinesedata.py looks for "Guest" in its place
+LOGIN_PAGE = 'Welcome <font color="yellow">Stanford</font>'
+
+# the settings of a running server, set from the command line
+serverOptions = {
+	'latency':0.0,
+	'errors':0.0,
+	'provinces':DEFAULT_PROVINCES,
+	'subunits':DEFAULT_SUBUNITS,
+	'recorded':None,
+	'compress':True}
+
+# the page codes, headers and urls out of chinadata/settings.py; see loadCrawlerSettings
+crawlerSettings = {}
+
+# counts of what the server has done, served as JSON from /stats
+serverStats = {'requests':0, 'errors':0, 'recorded':0, 'bytes':0}
+serverStatsLock = threading.Lock()
+
+####
+#### FUNCTIONS
+####
+
+# Reads the page codes, headers and other constants out of chinadata/settings.py without running it
+def loadCrawlerSettings(path):
+
+	settings = {}
+
+	for node in ast.parse(open(path).read()).body:
+		if(isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name) and node.targets[0].id.isupper()):
+			try:
+				settings[node.targets[0].id] = ast.literal_eval(node.value)
+			except ValueError:
+				# not a plain value, such as a compiled regex; we don't need those
+				pass
+
+	return settings
+
+# Gets the (ID, name) of each province
+def getProvinces():
+
+	provinces = []
+
+	for i in range(serverOptions['provinces']):
+		provinces.append((str(11 + i), "Province %d" % (11 + i)))
+
+	return provinces
+
+# Gets the (ID, name) of each subunit of a province; the urban and prefecture lists start with
+# the province's totals, as the site's do
+def getSubunits(dataset, province):
+
+	subunits = []
+
+	if(dataset in ("urban", "prefecture")):
+		subunits.append((province + "0000", "Province %s Total" % province))
+
+	for j in range(serverOptions['subunits']):
+		subunits.append(("%s%04d" % (province, j + 1), "Unit %s-%d" % (province, j + 1)))
+
+	return subunits
+
+# Splits a dataset's data columns among its pages as evenly as we can, the first pages
+# getting the spare ones
+def getPageWidths(total, numpages):
+
+	widths = [total // numpages] * numpages
+
+	for i in range(total - (total // numpages) * numpages):
+		widths[i] = widths[i] + 1
+
+	return widths
+
+# The made-up value of one cell; the same cell always gets the same value
+def getValue(key):
+
+	h = zlib.crc32(repr(key)) & 0xffffffff
+
+	if(h % MISSING_ONE_IN == 0):
+		return '&nbsp;'
+
+	return '{:,.2f}'.format((h % 10000000) / 100.0)
+
+# Builds the page of a dataset for a page code, province (or "" for all of them) and year
+def makePage(dataset, code, province, year):
+
+	prefix = dataset.upper()
+	pages = crawlerSettings[prefix + '_PAGES']
+	headervariables = crawlerSettings[prefix + '_NUM_HEADER_VARIABLES']
+
+	# the subunit datasets' headers also have the subunit's name and ID
+	if(dataset in ("province", "national")):
+		total = len(crawlerSettings[prefix + '_HEADERS']) - headervariables
+	else:
+		total = len(crawlerSettings[prefix + '_HEADERS']) - headervariables - 2
+
+	if(code not in pages):
+		return None
+
+	width = getPageWidths(total, len(pages))[pages.index(code)]
+	html = ['<html><body><form>']
+
+	html.append('<select name="province"><option value="">All</option>')
+
+	for provincetuple in getProvinces():
+		html.append('<option value="%s">%s</option>' % provincetuple)
+
+	html.append('</select>')
+
+	if(dataset in ("county", "urban", "prefecture")):
+		units = []
+
+		if(province != ""):
+			units = getSubunits(dataset, province)
+		else:
+			for provincetuple in getProvinces():
+				units = units + getSubunits(dataset, provincetuple[0])
+
+		html.append('<select name="city"><option value="">All</option>')
+
+		# the site pads the subunit names with a space
+		for unit in units:
+			html.append('<option value="%s">%s </option>' % unit)
+
+		html.append('</select>')
+
+		rows = [(unit[1], (dataset, year, unit[0])) for unit in units]
+	elif(dataset == "province"):
+		rows = [(provincetuple[1], (dataset, year, provincetuple[0])) for provincetuple in getProvinces()]
+	else:
+		rows = [(str(rowyear), (dataset, rowyear)) for rowyear in NATIONAL_YEARS]
+
+	html.append('<table id="texttable1"><thead><tr><td>Name</td>')
+
+	for c in range(width):
+		html.append('<td>%s col %d</td>' % (code, c))
+
+	html.append('</tr></thead><tbody>')
+
+	for name, key in rows:
+		cells = ['<td class="tdname">%s</td>' % name]
+
+		for c in range(width):
+			cells.append('<td class="tdd">%s</td>' % getValue((key, code, c)))
+
+		html.append('<tr>' + ''.join(cells) + '</tr>')
+
+	html.append('<tr><td class="tdtail">Source: stand-in</td></tr></tbody></table></form></body></html>')
+
+	return ''.join(html)
+
+# Finds a page chinesedata.py recorded in its page cache for the same request to the live site,
+# or returns None if it didn't
+def getRecordedPage(path, form):
+
+	url = crawlerSettings['BASE_URL'] + path.split("/member/", 1)[-1]
+	key = hashlib.sha1(url + "\n" + urllib.urlencode(sorted(form.items()))).hexdigest()
+	cachepath = os.path.join(serverOptions['recorded'], key[:2], key + ".z")
+
+	if(os.path.isfile(cachepath) == False):
+		return None
+
+	cachefile = open(cachepath, "rb")
+	output = zlib.decompress(cachefile.read())
+	cachefile.close()
+
+	return output
+
+# Works out which dataset a request is for from its path and form, or None for the login page
+def getDataset(path, form):
+
+	if(path.endswith(crawlerSettings['COUNTY_BASE_URL'])):
+		return "county"
+	elif(path.endswith(crawlerSettings['URBAN_BASE_URL']) and form.get('sid') == '1'):
+		return "urban"
+	elif(path.endswith(crawlerSettings['PREFECTURE_BASE_URL'])):
+		return "prefecture"
+	elif(path.endswith(crawlerSettings['PROVINCE_BASE_URL'])):
+		return "province"
+	elif(path.endswith(crawlerSettings['NATIONAL_BASE_URL'])):
+		return "national"
+
+	return None
+
+# Counts something the server did for /stats
+def countStat(name, amount=1):
+
+	with serverStatsLock:
+		serverStats[name] = serverStats[name] + amount
+
+class StandInHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+
+	# keeps connections open between requests, as the site does
+	protocol_version = 'HTTP/1.1'
+
+	# buffers each response and sends it in one go (see sendPage); written a header at a time, a
+	# response on a kept-alive connection waits out Nagle's algorithm and the client's delayed ACK,
+	# some 40ms a request
+	wbufsize = -1
+
+	def log_message(self, format, *args):
+		pass
+
+	def do_GET(self):
+		self.handleRequest({})
+
+	def do_POST(self):
+		length = int(self.headers.get('Content-Length') or 0)
+		form = urlparse.parse_qs(self.rfile.read(length), keep_blank_values=True)
+
+		self.handleRequest(dict((name, values[0]) for name, values in form.items()))
+
+	def handleRequest(self, form):
+
+		path = urlparse.urlparse(self.path).path
+
+		if(path == "/stats"):
+			# sendPage counts the bytes it sends, so the lock can't be held while it runs
+			with serverStatsLock:
+				stats = json.dumps(serverStats)
+
+			self.sendPage(200, stats)
+			return
+
+		countStat('requests')
+
+		if(serverOptions['latency'] > 0):
+			time.sleep(serverOptions['latency'])
+
+		dataset = getDataset(path, form)
+
+		if(dataset == None):
+			self.sendPage(200, LOGIN_PAGE)
+			return
+
+		# a server having a bad moment, which asks us to wait a second before trying again
+		if(random.random() < serverOptions['errors']):
+			countStat('errors')
+			self.sendPage(500, "Internal Server Error", {'Retry-After':'1'})
+			return
+
+		output = None
+
+		if(serverOptions['recorded'] != None):
+			output = getRecordedPage(path, form)
+
+			if(output != None):
+				countStat('recorded')
+
+		if(output == None):
+			output = makePage(dataset, form.get('code'), form.get('province', form.get('dq', '')), form.get('ayear'))
+
+		if(output == None):
+			self.sendPage(404, "Not Found")
+		else:
+			self.sendPage(200, output)
+
+	def sendPage(self, status, body, headers={}):
+
+		self.send_response(status)
+		self.send_header('Content-Type', 'text/html')
+
+		for name, value in headers.items():
+			self.send_header(name, value)
+
+		if(serverOptions['compress'] == True and 'gzip' in (self.headers.get('Accept-Encoding') or '')):
+			compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+			body = compressor.compress(body) + compressor.flush()
+			self.send_header('Content-Encoding', 'gzip')
+
+		self.send_header('Content-Length', str(len(body)))
+		self.end_headers()
+		self.wfile.write(body)
+		self.wfile.flush()
+
+		countStat('bytes', len(body))
+
+class StandInServer(SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+	daemon_threads = True
+	allow_reuse_address = True
+
+# Lets people know how to use the program from the command line
+def usage(error):
+
+	if(error != ""):
+		print "Error: " + error + "\n"
+
+	print "USAGE: standinserver [-h | --help] [-p] [--latency] [--errors] [--provinces]\n\t[--subunits] [--recorded] [--no-compression]\n"
+	print "NAME\n\tstandinserver -- a local stand-in for chinadataonline.org\n"
+	print "DESCRIPTION\n\tServes made-up pages in the form chinesedata.py expects, so that it can"
+	print "\tbe benchmarked and tested without the live site. Point chinesedata.py"
+	print "\tat it with --base-url http://127.0.0.1:<port>. GET /stats gives the"
+	print "\tnumber of requests and bytes served so far as JSON.\n"
+	print "\t-p\tSpecifies the port to listen on. Default is " + str(DEFAULT_PORT) + ". Same as --port.\n"
+	print "\t--latency\n\t\tSpecifies the seconds each request takes. Default is 0.\n"
+	print "\t--errors\n\t\tSpecifies the share of data requests, from 0 to 1, that fail with a\n\t\t500 error and a Retry-After of a second. Default is 0.\n"
+	print "\t--provinces\n\t\tSpecifies the number of provinces. Default is " + str(DEFAULT_PROVINCES) + ".\n"
+	print "\t--subunits\n\t\tSpecifies the number of counties, urban areas or prefectures in each\n\t\tprovince. Default is " + str(DEFAULT_SUBUNITS) + ".\n"
+	print "\t--recorded\n\t\tServes the pages recorded in a chinesedata.py page cache directory\n\t\twhere it has them, and made-up ones where it doesn't.\n"
+	print "\t--no-compression\n\t\tSends pages uncompressed even to clients that ask for gzip."
+	print ""
+
+	sys.exit(0)
+
+# Parses the command line arguments into serverOptions, and returns the port
+def parseArguments(argv):
+
+	port = DEFAULT_PORT
+
+	try:
+		opts, args = getopt.getopt(argv, "hp:", ["help", "port=", "latency=", "errors=", "provinces=", "subunits=", "recorded=", "no-compression"])
+	except getopt.GetoptError, err:
+		usage(str(err))
+
+	if(args != []):
+		usage("extraneous argument(s): " + str(args) + " not allowed.")
+
+	for opt, arg in opts:
+		try:
+			if opt in ("-h", "--help"):
+				usage("")
+			elif opt in ("-p", "--port"):
+				port = int(arg)
+			elif(opt == "--latency"):
+				serverOptions['latency'] = float(arg)
+			elif(opt == "--errors"):
+				serverOptions['errors'] = float(arg)
+			elif(opt == "--provinces"):
+				serverOptions['provinces'] = int(arg)
+			elif(opt == "--subunits"):
+				serverOptions['subunits'] = int(arg)
+			elif(opt == "--recorded"):
+				serverOptions['recorded'] = arg
+			elif(opt == "--no-compression"):
+				serverOptions['compress'] = False
+		except ValueError:
+			usage("the argument to " + opt + " must be a number")
+
+	return port
+
+####
+#### MAIN CODE
+####
+
+if __name__ == '__main__':
+
+	port = parseArguments(sys.argv[1:])
+	crawlerSettings = loadCrawlerSettings(SETTINGS_FILE)
+
+	server = StandInServer(('127.0.0.1', port), StandInHandler)
+	print "Serving a stand-in for chinadataonline.org on http://127.0.0.1:%s" % port
+	sys.stdout.flush()
+
+	try:
+		server.serve_forever()
+	except KeyboardInterrupt:
+		pass